@@ -0,0 +1,41 @@
+"""exam schedule reserved participants counter
+
+Revision ID: 5c2d7e1f9a34
+Revises: 8fb15993f9f4
+Create Date: 2026-10-18 10:12:41.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2d7e1f9a34'
+down_revision: Union[str, None] = '8fb15993f9f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('exam_schedules', sa.Column('reserved_participants', sa.Integer(), server_default='0', nullable=False))
+    # 기존 확정 예약으로 카운터 초기화
+    op.execute("""
+        UPDATE exam_schedules e
+        SET reserved_participants = s.total
+        FROM (
+            SELECT exam_id, SUM(num_participants) AS total
+            FROM reservations
+            WHERE is_confirmed
+            GROUP BY exam_id
+        ) s
+        WHERE e.exam_id = s.exam_id
+    """)
+    op.create_check_constraint('check_non_negative_reserved_participants', 'exam_schedules',
+                               'reserved_participants >= 0')
+
+
+def downgrade() -> None:
+    op.drop_constraint('check_non_negative_reserved_participants', 'exam_schedules', type_='check')
+    op.drop_column('exam_schedules', 'reserved_participants')
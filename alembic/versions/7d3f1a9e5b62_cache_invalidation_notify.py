@@ -0,0 +1,59 @@
+"""cache invalidation notify triggers
+
+Revision ID: 7d3f1a9e5b62
+Revises: 0b6e3f9c2d48
+Create Date: 2026-10-18 22:41:07.351842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3f1a9e5b62'
+down_revision: Union[str, None] = '0b6e3f9c2d48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 예약 가능 시간은 exam_schedules(정원, 확정 인원 카운터)만으로 계산되므로, 시험 행이 바뀐 문장마다 한 번 알립니다.
+    # NOTIFY 는 커밋될 때만 전달되고, 한 트랜잭션 안의 같은 알림은 한 번만 전달됩니다.
+    op.execute("""
+        CREATE FUNCTION notify_available_times_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('cache_invalidation', 'available_times');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER exam_schedules_cache_invalidation
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON exam_schedules
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_available_times_changed()
+    """)
+    # 인증 사용자(principal) 캐시는 username 으로 보관하므로, 수정/삭제된 사용자의 변경 전후 username 을 알립니다.
+    op.execute("""
+        CREATE FUNCTION notify_principal_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('cache_invalidation', 'principal:' || OLD.username);
+            IF TG_OP = 'UPDATE' AND NEW.username IS DISTINCT FROM OLD.username THEN
+                PERFORM pg_notify('cache_invalidation', 'principal:' || NEW.username);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER users_cache_invalidation
+        AFTER UPDATE OR DELETE ON users
+        FOR EACH ROW EXECUTE FUNCTION notify_principal_changed()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER users_cache_invalidation ON users")
+    op.execute("DROP FUNCTION notify_principal_changed()")
+    op.execute("DROP TRIGGER exam_schedules_cache_invalidation ON exam_schedules")
+    op.execute("DROP FUNCTION notify_available_times_changed()")
@@ -0,0 +1,55 @@
+"""reservation hot query indexes
+
+Revision ID: a91f3c6d2b57
+Revises: 5c2d7e1f9a34
+Create Date: 2026-10-18 11:02:15.884310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91f3c6d2b57'
+down_revision: Union[str, None] = '5c2d7e1f9a34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 실패 메시지에 보여줄 중복 (user_id, exam_id) 쌍의 최대 개수
+DUPLICATES_SHOWN = 20
+
+
+def upgrade() -> None:
+    # (user_id, exam_id) 유니크 제약을 추가하기 전에 중복 예약이 있으면 지우지 않고 중단합니다.
+    # 정리는 `python -m src.dedupe_reservations --dry-run` 으로 확인한 뒤 명시적으로 실행합니다.
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT user_id, exam_id, COUNT(*) AS reservations
+        FROM reservations
+        GROUP BY user_id, exam_id
+        HAVING COUNT(*) > 1
+        ORDER BY user_id, exam_id
+    """)).all()
+    if duplicates:
+        pairs = "\n".join(f"  user_id={row.user_id}, exam_id={row.exam_id}: {row.reservations}건"
+                          for row in duplicates[:DUPLICATES_SHOWN])
+        more = f"\n  ... 외 {len(duplicates) - DUPLICATES_SHOWN}쌍" if len(duplicates) > DUPLICATES_SHOWN else ""
+        raise RuntimeError(
+            f"(user_id, exam_id) 가 같은 예약이 {len(duplicates)}쌍 있어 uq_reservations_user_id_exam_id 를 추가할 수 없습니다.\n"
+            f"{pairs}{more}\n"
+            "python -m src.dedupe_reservations --dry-run 으로 삭제될 예약을 확인하고 정리한 뒤 다시 실행해주세요."
+        )
+
+    op.create_unique_constraint('uq_reservations_user_id_exam_id', 'reservations', ['user_id', 'exam_id'])
+    op.create_index('ix_reservations_user_id_reservation_id', 'reservations',
+                    ['user_id', sa.text('reservation_id DESC')], unique=False)
+    op.create_index('ix_reservations_exam_id_confirmed', 'reservations', ['exam_id'], unique=False,
+                    postgresql_include=['num_participants'],
+                    postgresql_where=sa.text('is_confirmed'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservations_exam_id_confirmed', table_name='reservations')
+    op.drop_index('ix_reservations_user_id_reservation_id', table_name='reservations')
+    op.drop_constraint('uq_reservations_user_id_exam_id', 'reservations', type_='unique')
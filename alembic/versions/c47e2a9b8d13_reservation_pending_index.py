@@ -0,0 +1,29 @@
+"""reservation pending index
+
+Revision ID: c47e2a9b8d13
+Revises: a91f3c6d2b57
+Create Date: 2026-10-18 12:14:40.517203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47e2a9b8d13'
+down_revision: Union[str, None] = 'a91f3c6d2b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_reservations_exam_id_pending', 'reservations',
+                    ['exam_id', 'created_at', 'reservation_id'], unique=False,
+                    postgresql_include=['num_participants'],
+                    postgresql_where=sa.text('is_confirmed IS NOT true'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservations_exam_id_pending', table_name='reservations')
@@ -0,0 +1,51 @@
+"""exam capacity stats rollup
+
+Revision ID: e5a1c9d3f702
+Revises: c47e2a9b8d13
+Create Date: 2026-10-18 16:02:19.384105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c9d3f702'
+down_revision: Union[str, None] = 'c47e2a9b8d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('exam_capacity_stats',
+    sa.Column('exam_id', sa.Integer(), nullable=False),
+    sa.Column('confirmed_participants', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('pending_participants', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('confirmed_reservations', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('pending_reservations', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.CheckConstraint('confirmed_participants >= 0', name='check_non_negative_confirmed_participants'),
+    sa.CheckConstraint('pending_participants >= 0', name='check_non_negative_pending_participants'),
+    sa.CheckConstraint('confirmed_reservations >= 0', name='check_non_negative_confirmed_reservations'),
+    sa.CheckConstraint('pending_reservations >= 0', name='check_non_negative_pending_reservations'),
+    sa.ForeignKeyConstraint(['exam_id'], ['exam_schedules.exam_id'], ),
+    sa.PrimaryKeyConstraint('exam_id')
+    )
+    # 기존 예약으로 집계 초기화
+    op.execute("""
+        INSERT INTO exam_capacity_stats (exam_id, confirmed_participants, pending_participants,
+                                         confirmed_reservations, pending_reservations)
+        SELECT exam_id,
+               COALESCE(SUM(num_participants) FILTER (WHERE is_confirmed), 0),
+               COALESCE(SUM(num_participants) FILTER (WHERE is_confirmed IS NOT true), 0),
+               COUNT(*) FILTER (WHERE is_confirmed),
+               COUNT(*) FILTER (WHERE is_confirmed IS NOT true)
+        FROM reservations
+        GROUP BY exam_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('exam_capacity_stats')
@@ -0,0 +1,142 @@
+"""
+예약 폭주 벤치마크 (예약 대기열 group commit)
+
+예약이 열린 인기 시험 하나에 서로 다른 사용자들의 POST /v1/reservations 를 한꺼번에 보내고,
+예약 대기열(BOOKING_QUEUE_ENABLED)을 끈 경우와 켠 경우의 커밋 수, 처리 시간, 지연 시간 분포를 비교합니다.
+모드마다 새 시험을 만들고, 종료 시 생성된 시험과 예약을 삭제합니다.
+
+    python -m benchmarks.booking_burst --requests 2000 --concurrency 500
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import List
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.concurrency import percentile
+from benchmarks.loadtest import VirtualUser, load_users, wait_until_ready
+from src.core.config import settings
+from src.crud.exam_schedule import rebuild_reserved_participants
+from src.db.session import SessionLocal, engine
+from src.main import app
+from src.models import ExamCapacityStats, ExamSchedule, Reservation
+from src.services.booking_queue import booking_queue
+from src.utils.time_utils import get_kst_now
+
+
+def _create_exam(max_capacity: int) -> int:
+    db = SessionLocal()
+    try:
+        # 예약 가능 기간(시작 3일 전부터) 안에 있는 시험
+        start_time = get_kst_now() + timedelta(days=2)
+        exam_schedule = ExamSchedule(name="booking burst", start_time=start_time,
+                                     end_time=start_time + timedelta(hours=2), max_capacity=max_capacity)
+        db.add(exam_schedule)
+        db.commit()
+        return exam_schedule.exam_id
+    finally:
+        db.close()
+
+
+def _cleanup(exam_ids: List[int]) -> None:
+    db = SessionLocal()
+    try:
+        db.query(ExamCapacityStats).filter(ExamCapacityStats.exam_id.in_(exam_ids)).delete(synchronize_session=False)
+        db.query(Reservation).filter(Reservation.exam_id.in_(exam_ids)).delete(synchronize_session=False)
+        db.query(ExamSchedule).filter(ExamSchedule.exam_id.in_(exam_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _burst(client: httpx.AsyncClient, users: List[VirtualUser], exam_id: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, statuses = [], Counter()
+
+    async def _book(user: VirtualUser):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post("/v1/reservations", headers=user.headers,
+                                         json={"exam_id": exam_id, "num_participants": 1})
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] += 1
+
+    commits = 0
+
+    def _count_commit(conn):
+        nonlocal commits
+        commits += 1
+
+    event.listen(engine, "commit", _count_commit)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(_book(user) for user in users))
+    finally:
+        event.remove(engine, "commit", _count_commit)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(users),
+        "status_counts": dict(statuses),
+        "commits": commits,
+        "elapsed_s": round(elapsed, 2),
+        "requests_per_sec": round(len(users) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(latencies[-1] * 1000, 1),
+    }
+
+
+async def run(users: List[VirtualUser], concurrency: int, max_capacity: int) -> dict:
+    results, exam_ids = {}, []
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(transport=transport, base_url="http://burst", limits=limits, timeout=60) as client:
+            await wait_until_ready(client)
+            # 로그인한 사용자들이 몰리는 상황이므로 인증 정보 캐시를 미리 채웁니다.
+            await asyncio.gather(*(client.get("/v1/users/me", headers=user.headers) for user in users))
+            try:
+                for mode, enabled in (("direct", False), ("queue", True)):
+                    settings.BOOKING_QUEUE_ENABLED = enabled
+                    exam_id = _create_exam(max_capacity)
+                    exam_ids.append(exam_id)
+                    results[mode] = await _burst(client, users, exam_id, concurrency)
+            finally:
+                _cleanup(exam_ids)
+
+    # 예약 생성은 확정 인원 카운터를 바꾸지 않으므로 카운터가 실제 확정 인원과 달라진 시험이 없어야 합니다.
+    db = SessionLocal()
+    try:
+        results["counter_mismatches"] = rebuild_reserved_participants(db)
+        db.rollback()
+    finally:
+        db.close()
+    results["queue_stats"] = booking_queue.stats()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 폭주 벤치마크 (예약 대기열 group commit)")
+    parser.add_argument("--requests", type=int, default=2000, help="서로 다른 사용자 수 = 예약 요청 수")
+    parser.add_argument("--concurrency", type=int, default=500, help="동시에 보내는 최대 요청 수")
+    parser.add_argument("--max-capacity", type=int, default=50000)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(load_users(args.requests), args.concurrency, args.max_capacity))
+    for mode in ("direct", "queue"):
+        result = results[mode]
+        print(f"{mode:>6}: {result['requests']}건 {result['elapsed_s']}초 ({result['requests_per_sec']} req/s), "
+              f"커밋 {result['commits']}회, p50 {result['p50_ms']}ms p95 {result['p95_ms']}ms "
+              f"p99 {result['p99_ms']}ms max {result['max_ms']}ms, 상태 {result['status_counts']}")
+    print(f"예약 대기열: {results['queue_stats']}, 카운터 불일치 시험 {results['counter_mismatches']}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+예약 확정 동시성 벤치마크
+
+정원이 작은 시험 하나에 N명의 사용자가 동시에 예약을 생성하고, 관리자가 각 예약을 바로 확정(PUT is_confirmed)합니다.
+중간중간 같은 시험의 일괄 확정(POST /confirm)도 함께 실행해 잠금 순서가 엇갈리지 않는지(교착 상태 → 500) 확인합니다.
+종료 후 정원 불변식을 검사합니다.
+- 확정 인원 카운터(reserved_participants) <= 정원(max_capacity)
+- 카운터 == 확정된 예약의 인원 합계
+- 시험별 집계(exam_capacity_stats) == 예약 테이블 집계
+
+불변식이 하나라도 깨지거나 500 응답이 있으면 종료 코드 1 로 끝납니다. 생성한 시험과 예약은 종료 시 삭제합니다.
+
+    python -m benchmarks.booking_contention --bookers 200 --capacity 150 --concurrency 50
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import List
+
+import httpx
+from sqlalchemy import func
+
+from benchmarks.booking_burst import _cleanup, _create_exam
+from benchmarks.concurrency import percentile
+from benchmarks.loadtest import VirtualUser, load_users, wait_until_ready
+from src.crud.exam_capacity_stats import find_exam_capacity_stats_drift
+from src.db.session import SessionLocal
+from src.main import app
+from src.models import ExamSchedule, Reservation, User
+
+
+def _admin() -> VirtualUser:
+    db = SessionLocal()
+    try:
+        admin = db.query(User.username).filter(User.is_admin == True).order_by(User.user_id).first()
+    finally:
+        db.close()
+    if admin is None:
+        raise SystemExit("관리자 사용자가 없습니다. 먼저 데이터를 시드해주세요.")
+    return VirtualUser(admin.username)
+
+
+def check_invariants(exam_id: int) -> dict:
+    db = SessionLocal()
+    try:
+        exam_schedule = db.query(ExamSchedule).filter(ExamSchedule.exam_id == exam_id).one()
+        confirmed_sum = db.query(func.coalesce(func.sum(Reservation.num_participants), 0)).filter(
+            Reservation.exam_id == exam_id, Reservation.is_confirmed == True
+        ).scalar()
+        stats_drift = find_exam_capacity_stats_drift(db, exam_id)
+    finally:
+        db.close()
+    violations = []
+    if exam_schedule.reserved_participants > exam_schedule.max_capacity:
+        violations.append(f"확정 인원 {exam_schedule.reserved_participants} > 정원 {exam_schedule.max_capacity}")
+    if exam_schedule.reserved_participants != confirmed_sum:
+        violations.append(f"카운터 {exam_schedule.reserved_participants} != 확정 예약 합계 {confirmed_sum}")
+    for row in stats_drift:
+        violations.append(f"시험별 집계 {row['stored']} != 예약 집계 {row['expected']}")
+    return {
+        "max_capacity": exam_schedule.max_capacity,
+        "reserved_participants": exam_schedule.reserved_participants,
+        "confirmed_sum": confirmed_sum,
+        "violations": violations,
+    }
+
+
+async def _contend(client: httpx.AsyncClient, users: List[VirtualUser], admin: VirtualUser, exam_id: int,
+                   concurrency: int, bulk_confirm_every: int, random_seed: int) -> dict:
+    rng = random.Random(random_seed)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = defaultdict(list)
+    statuses = defaultdict(Counter)
+
+    async def _call(route: str, method: str, url: str, headers: dict, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, headers=headers, **kwargs)
+        latencies[route].append(time.perf_counter() - started)
+        statuses[route][response.status_code] += 1
+        return response
+
+    async def _booker(index: int, user: VirtualUser, num_participants: int):
+        async with semaphore:
+            response = await _call("POST /v1/reservations", "POST", "/v1/reservations", user.headers,
+                                   json={"exam_id": exam_id, "num_participants": num_participants})
+            if response.status_code != 201:
+                return
+            reservation_id = response.json()["reservation_id"]
+            if bulk_confirm_every and index % bulk_confirm_every == 0:
+                await _call("POST /v1/reservations/confirm", "POST", "/v1/reservations/confirm", admin.headers,
+                            json={"exam_id": exam_id})
+            await _call("PUT /v1/reservations/{reservation_id}", "PUT", f"/v1/reservations/{reservation_id}",
+                        admin.headers, json={"is_confirmed": True})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_booker(index, user, rng.randint(1, 3)) for index, user in enumerate(users)))
+    elapsed = time.perf_counter() - started
+
+    routes = {}
+    for route, values in latencies.items():
+        values.sort()
+        routes[route] = {
+            "requests": len(values),
+            "status_counts": dict(statuses[route]),
+            "p50_ms": round(percentile(values, 50) * 1000, 1),
+            "p95_ms": round(percentile(values, 95) * 1000, 1),
+            "p99_ms": round(percentile(values, 99) * 1000, 1),
+        }
+    return {
+        "bookers": len(users),
+        "elapsed_s": round(elapsed, 2),
+        "bookings_per_sec": round(len(users) / elapsed, 1),
+        "server_errors": sum(counter[500] for counter in statuses.values()),
+        "routes": routes,
+    }
+
+
+async def run(users: List[VirtualUser], capacity: int, concurrency: int, bulk_confirm_every: int,
+              random_seed: int) -> dict:
+    admin = _admin()
+    exam_id = _create_exam(capacity)
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://contention", timeout=60) as client:
+                await wait_until_ready(client)
+                # 인증 정보 캐시를 미리 채워 잠금 경합만 측정합니다.
+                await asyncio.gather(*(client.get("/v1/users/me", headers=user.headers) for user in users + [admin]))
+                result = await _contend(client, users, admin, exam_id, concurrency, bulk_confirm_every, random_seed)
+        result["invariants"] = check_invariants(exam_id)
+        return result
+    finally:
+        _cleanup([exam_id])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 확정 동시성 벤치마크")
+    parser.add_argument("--bookers", type=int, default=200, help="동시에 예약/확정하는 사용자 수")
+    parser.add_argument("--capacity", type=int, default=150, help="시험 정원 (인원 합계가 넘도록 작게)")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--bulk-confirm-every", type=int, default=20, help="몇 명마다 일괄 확정을 함께 실행할지 (0: 실행 안 함)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (인원 수)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(load_users(args.bookers), args.capacity, args.concurrency, args.bulk_confirm_every,
+                             args.seed))
+    print(f"예약자 {result['bookers']}명, {result['elapsed_s']}초 ({result['bookings_per_sec']} 예약/초), "
+          f"500 응답 {result['server_errors']}건")
+    for route, stats in result["routes"].items():
+        print(f"  {route}: {stats['requests']}건 {stats['status_counts']} "
+              f"p50 {stats['p50_ms']}ms p95 {stats['p95_ms']}ms p99 {stats['p99_ms']}ms")
+    invariants = result["invariants"]
+    print(f"정원 {invariants['max_capacity']}, 확정 인원 {invariants['reserved_participants']}, "
+          f"확정 예약 합계 {invariants['confirmed_sum']}")
+    for violation in invariants["violations"]:
+        print(f"  불변식 위반: {violation}")
+    if invariants["violations"] or result["server_errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+동시 접속 처리량 벤치마크
+
+실행 중인 서버(uvicorn)에 N개의 동시 클라이언트로 같은 엔드포인트를 반복 호출하고
+초당 처리량(req/s)과 지연 시간 분포를 출력합니다.
+
+    uvicorn src.main:app --port 8000 &
+    python -m benchmarks.concurrency --concurrency 500 --duration 15 \
+        --path /v1/reservations/available-times --username grepp
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from typing import List, Optional
+
+import httpx
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def _client(client: httpx.AsyncClient, path: str, headers: dict, deadline: float,
+                  latencies: List[float], errors: list):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(path, headers=headers)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+                continue
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(base_url: str, path: str, concurrency: int, duration: float, token: Optional[str]) -> dict:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    latencies: List[float] = []
+    errors: list = []
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*[
+            _client(client, path, headers, deadline, latencies, errors) for _ in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "path": path,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 2),
+        "requests": len(latencies),
+        "errors": len(errors),
+        "errors_by_kind": {str(kind): count for kind, count in Counter(errors).items()},
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 접속 처리량 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/v1/reservations/available-times")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=15.0, help="측정 시간(초)")
+    parser.add_argument("--username", default=None, help="토큰을 발급할 사용자 이름")
+    parser.add_argument("--token", default=None, help="이미 발급된 액세스 토큰")
+    args = parser.parse_args()
+
+    token = args.token
+    if token is None and args.username:
+        from src.core.security import create_access_token
+        token = create_access_token(args.username)
+
+    result = asyncio.run(run(args.base_url, args.path, args.concurrency, args.duration, token))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+핫 쿼리 인덱스 사용 확인
+
+시드된 DB 에서 주요 쿼리의 EXPLAIN 결과를 확인해 기대한 인덱스를 사용하는지 검사합니다.
+하나라도 인덱스를 사용하지 않으면 종료 코드 1 로 끝납니다. CI 에서는 tests/test_hot_query_indexes.py 로 같은 검사를 실행합니다.
+
+    python -m benchmarks.explain_indexes
+    python -m benchmarks.explain_indexes --disable-seqscan   # 데이터가 적어 플래너가 seq scan 을 고를 때
+"""
+import argparse
+import json
+import sys
+from typing import List
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from src.crud import reservation_query
+from src.db.session import SessionLocal
+from src.models import Reservation
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def explain(db: Session, query) -> dict:
+    sql = str(query.statement.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True}))
+    plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def hot_queries(db: Session, user_id: int, exam_id: int, after_id: int):
+    """(이름, 쿼리, 기대 인덱스) 목록"""
+    return [
+        ("사용자 예약 목록 (page)",
+         reservation_query.get_user_reservations_query(db, user_id).limit(100),
+         "ix_reservations_user_id_reservation_id"),
+        ("사용자 예약 목록 (cursor)",
+         reservation_query.get_user_reservations_query(db, user_id)
+         .filter(Reservation.reservation_id < after_id).limit(101),
+         "ix_reservations_user_id_reservation_id"),
+        ("중복 예약 확인",
+         db.query(Reservation.reservation_id).filter(
+             Reservation.user_id == user_id, Reservation.exam_id == exam_id),
+         "uq_reservations_user_id_exam_id"),
+        ("시험별 확정 인원 합계",
+         db.query(func.coalesce(func.sum(Reservation.num_participants), 0)).filter(
+             Reservation.exam_id == exam_id, Reservation.is_confirmed == True),
+         "ix_reservations_exam_id_confirmed"),
+        ("시험별 미확정 예약 (일괄 확정)",
+         db.query(Reservation.reservation_id, Reservation.num_participants).filter(
+             Reservation.exam_id == exam_id, Reservation.is_confirmed.isnot(True)
+         ).order_by(Reservation.created_at, Reservation.reservation_id),
+         "ix_reservations_exam_id_pending"),
+    ]
+
+
+def check_hot_query_indexes(db: Session, disable_seqscan: bool = False) -> List[dict]:
+    """핫 쿼리마다 기대한 인덱스를 사용하는지 EXPLAIN 으로 확인합니다 (tests/test_hot_query_indexes.py 에서도 사용)."""
+    # 예약이 가장 많은 사용자 기준으로 확인 (목록 쿼리의 인덱스 선택이 의미 있도록). 비어 있으면 임의의 ID 로 확인합니다.
+    # cursor 는 그 사용자의 예약 중간쯤(다음 페이지 요청)을 가리키게 합니다. 첫 예약 바로 앞을 가리키면 사실상
+    # 전체 목록이라 플래너가 어느 인덱스를 골라도 비용이 같습니다.
+    sample = db.query(
+        Reservation.user_id,
+        func.min(Reservation.exam_id).label("exam_id"),
+        ((func.min(Reservation.reservation_id) + func.max(Reservation.reservation_id)) / 2).label("reservation_id")
+    ).group_by(Reservation.user_id).order_by(func.count().desc()).first()
+    user_id, exam_id, after_id = sample if sample is not None else (1, 1, 1000)
+    if disable_seqscan:
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+
+    results = []
+    for name, query, expected_index in hot_queries(db, user_id, exam_id, after_id):
+        plan = explain(db, query)
+        used = sorted({node["Index Name"] for node in _plan_nodes(plan) if "Index Name" in node})
+        results.append({"name": name, "expected_index": expected_index, "used": used, "ok": expected_index in used,
+                        "node_type": plan["Node Type"], "total_cost": plan["Total Cost"]})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 쿼리 인덱스 사용 확인 (EXPLAIN)")
+    parser.add_argument("--disable-seqscan", action="store_true",
+                        help="enable_seqscan=off 로 실행 (작은 데이터셋에서 인덱스 사용 가능 여부만 확인)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        results = check_hot_query_indexes(db, args.disable_seqscan)
+    finally:
+        db.rollback()
+        db.close()
+
+    for result in results:
+        print(f"[{'OK' if result['ok'] else 'FAIL'}] {result['name']}: 기대 {result['expected_index']}, "
+              f"사용 {result['used'] or '없음'} (최상위 노드 {result['node_type']}, 예상 비용 {result['total_cost']})")
+    sys.exit(0 if all(result["ok"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+API 부하 테스트
+
+여러 가상 사용자가 예약 가능 시간 조회, 예약 생성/목록/조회/수정/삭제를 섞어 호출하고
+경로별 처리량과 p50/p95/p99 지연 시간을 측정합니다. 결과는 JSON 으로 저장해 기준 결과와 비교할 수 있습니다.
+
+    # 앱을 같은 프로세스에서 실행 (httpx ASGI transport)
+    python -m benchmarks.loadtest --in-process --concurrency 50 --duration 20 --output result.json
+
+    # 실행 중인 서버(uvicorn)에 요청
+    python -m benchmarks.loadtest --base-url http://localhost:8000 --baseline benchmarks/baseline.json
+
+    # 데이터 시드 후 실행
+    python -m benchmarks.loadtest --in-process --seed-users 50 --seed-exams 60 --seed-reservations 2000
+
+부하 테스트 중 생성된 예약은 종료 시 삭제합니다 (--keep-data 로 유지).
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import httpx
+from sqlalchemy import delete
+
+from benchmarks.concurrency import percentile
+from src.core.security import create_access_token
+from src.crud.exam_capacity_stats import add_exam_capacity_stats, reservation_stats
+from src.db.session import SessionLocal
+from src.main import app
+from src.models import Reservation, User
+
+# 경로별 호출 비율 (예약 가능 시간 조회가 가장 많이 호출되는 실제 트래픽 비율을 흉내냅니다)
+ROUTE_WEIGHTS = {
+    "GET /v1/reservations/available-times": 40,
+    "GET /v1/reservations": 20,
+    "GET /v1/reservations/{reservation_id}": 15,
+    "POST /v1/reservations": 10,
+    "PUT /v1/reservations/{reservation_id}": 10,
+    "DELETE /v1/reservations/{reservation_id}": 5,
+}
+
+
+class VirtualUser:
+    def __init__(self, username: str):
+        self.username = username
+        self.headers = {"Authorization": f"Bearer {create_access_token(username)}"}
+        self.reservation_ids: List[int] = []
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.created_ids: List[int] = []
+
+    def record(self, route: str, status, elapsed: float):
+        self.statuses[route][str(status)] += 1
+        if isinstance(status, int) and status < 500:
+            self.latencies[route].append(elapsed)
+
+    def route_summary(self, route: str, elapsed: float) -> dict:
+        latencies = sorted(self.latencies[route])
+        statuses = self.statuses[route]
+        total = sum(statuses.values())
+        errors = total - len(latencies)
+        return {
+            "requests": total,
+            "errors": errors,
+            "status_counts": dict(sorted(statuses.items())),
+            "requests_per_sec": round(total / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        }
+
+
+async def _call(client: httpx.AsyncClient, recorder: Recorder, route: str, method: str, url: str, **kwargs):
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        recorder.record(route, type(e).__name__, time.perf_counter() - started)
+        return None
+    recorder.record(route, response.status_code, time.perf_counter() - started)
+    return response
+
+
+async def _step(client: httpx.AsyncClient, recorder: Recorder, user: VirtualUser, exam_ids: List[int],
+                route: str):
+    # 조회/수정/삭제할 예약이 없으면 먼저 예약을 생성합니다.
+    if "{reservation_id}" in route and not user.reservation_ids:
+        route = "POST /v1/reservations"
+
+    if route == "GET /v1/reservations/available-times":
+        await _call(client, recorder, route, "GET", "/v1/reservations/available-times", headers=user.headers)
+    elif route == "GET /v1/reservations":
+        response = await _call(client, recorder, route, "GET", "/v1/reservations",
+                               params={"cursor": "", "limit": 20}, headers=user.headers)
+        if response is not None and response.status_code == 200 and not user.reservation_ids:
+            user.reservation_ids = [item["reservation_id"] for item in response.json()["revations"]]
+    elif route == "POST /v1/reservations":
+        body = {"exam_id": random.choice(exam_ids), "num_participants": random.randint(1, 5)}
+        response = await _call(client, recorder, route, "POST", "/v1/reservations", json=body, headers=user.headers)
+        if response is not None and response.status_code == 201:
+            reservation_id = response.json()["reservation_id"]
+            user.reservation_ids.append(reservation_id)
+            recorder.created_ids.append(reservation_id)
+    elif route == "GET /v1/reservations/{reservation_id}":
+        reservation_id = random.choice(user.reservation_ids)
+        await _call(client, recorder, route, "GET", f"/v1/reservations/{reservation_id}", headers=user.headers)
+    elif route == "PUT /v1/reservations/{reservation_id}":
+        reservation_id = random.choice(user.reservation_ids)
+        await _call(client, recorder, route, "PUT", f"/v1/reservations/{reservation_id}",
+                    json={"num_participants": random.randint(1, 5)}, headers=user.headers)
+    elif route == "DELETE /v1/reservations/{reservation_id}":
+        reservation_id = random.choice(user.reservation_ids)
+        response = await _call(client, recorder, route, "DELETE", f"/v1/reservations/{reservation_id}",
+                               headers=user.headers)
+        if response is not None and response.status_code in (204, 404):
+            user.reservation_ids.remove(reservation_id)
+
+
+async def _worker(client: httpx.AsyncClient, recorder: Recorder, users: List[VirtualUser], exam_ids: List[int],
+                  deadline: float, rng: random.Random):
+    routes, weights = list(ROUTE_WEIGHTS), list(ROUTE_WEIGHTS.values())
+    while time.perf_counter() < deadline:
+        user = rng.choice(users)
+        route = rng.choices(routes, weights)[0]
+        await _step(client, recorder, user, exam_ids, route)
+
+
+async def _drive(client: httpx.AsyncClient, users: List[VirtualUser], concurrency: int, duration: float,
+                 random_seed: int) -> dict:
+    # 예약 생성 대상: 현재 예약 가능한 시험
+    response = await client.get("/v1/reservations/available-times", headers=users[0].headers)
+    response.raise_for_status()
+    exam_ids = [item["exam_id"] for item in response.json()]
+    if not exam_ids:
+        raise SystemExit("예약 가능한 시험이 없습니다. 먼저 데이터를 시드해주세요.")
+
+    recorder = Recorder()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*[
+        _worker(client, recorder, users, exam_ids, deadline, random.Random(random_seed + index))
+        for index in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - started
+
+    routes = {route: recorder.route_summary(route, elapsed) for route in ROUTE_WEIGHTS if recorder.statuses[route]}
+    all_latencies = sorted(latency for latencies in recorder.latencies.values() for latency in latencies)
+    total_requests = sum(summary["requests"] for summary in routes.values())
+    return {
+        "duration_s": round(elapsed, 2),
+        "total": {
+            "requests": total_requests,
+            "errors": sum(summary["errors"] for summary in routes.values()),
+            "requests_per_sec": round(total_requests / elapsed, 1),
+            "p50_ms": round(percentile(all_latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(all_latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(all_latencies, 99) * 1000, 1),
+        },
+        "routes": routes,
+        "created_ids": recorder.created_ids,
+    }
+
+
+async def wait_until_ready(client: httpx.AsyncClient) -> None:
+    """기동 워밍업이 끝나 /health/ready 가 200 을 반환할 때까지 기다립니다 (로드밸런서처럼 준비된 뒤에 측정)."""
+    while (await client.get("/health/ready")).status_code != 200:
+        await asyncio.sleep(0.05)
+
+
+async def run(base_url: Optional[str], users: List[VirtualUser], concurrency: int, duration: float,
+              random_seed: int) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if base_url is not None:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            await wait_until_ready(client)
+            return await _drive(client, users, concurrency, duration, random_seed)
+
+    # ASGITransport 는 lifespan 을 실행하지 않으므로 직접 실행합니다.
+    # 앱에서 발생한 예외는 다시 던지지 않고 500 응답으로 집계합니다.
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=30) as client:
+            await wait_until_ready(client)
+            return await _drive(client, users, concurrency, duration, random_seed)
+
+
+def load_users(num_users: int) -> List[VirtualUser]:
+    db = SessionLocal()
+    try:
+        usernames = [row.username for row in db.query(User.username).filter(
+            User.is_admin.isnot(True), User.is_active.isnot(False)
+        ).order_by(User.user_id.desc()).limit(num_users)]
+    finally:
+        db.close()
+    if not usernames:
+        raise SystemExit("일반 사용자가 없습니다. 먼저 데이터를 시드해주세요.")
+    return [VirtualUser(username) for username in usernames]
+
+
+def cleanup(reservation_ids: List[int]) -> int:
+    if not reservation_ids:
+        return 0
+    db = SessionLocal()
+    try:
+        deleted = db.execute(delete(Reservation).where(
+            Reservation.reservation_id.in_(reservation_ids),
+            Reservation.is_confirmed.isnot(True)
+        ).returning(Reservation.exam_id, Reservation.num_participants)).all()
+        # 미확정 예약만 지우므로 확정 인원 카운터는 그대로 두고 시험별 집계에서만 뺍니다.
+        add_exam_capacity_stats(db, [(row.exam_id, reservation_stats(False, row.num_participants, sign=-1))
+                                     for row in deleted])
+        db.commit()
+        return len(deleted)
+    finally:
+        db.close()
+
+
+def compare(result: dict, baseline: dict, max_regression: Optional[float]) -> bool:
+    """기준 결과와 경로별 처리량/p95 를 비교해 출력하고, 허용치를 넘는 성능 저하가 있으면 False 를 반환합니다."""
+    ok = True
+    print(f"{'경로':<45} {'req/s':>18} {'p95 ms':>18}")
+    for route, summary in result["routes"].items():
+        base = baseline.get("routes", {}).get(route)
+        if base is None:
+            print(f"{route:<45} {summary['requests_per_sec']:>18} {summary['p95_ms']:>18}  (기준 없음)")
+            continue
+        rps_change = (summary["requests_per_sec"] - base["requests_per_sec"]) / (base["requests_per_sec"] or 1)
+        p95_change = (summary["p95_ms"] - base["p95_ms"]) / (base["p95_ms"] or 1)
+        regressed = max_regression is not None and (rps_change < -max_regression or p95_change > max_regression)
+        ok = ok and not regressed
+        print(f"{route:<45} {base['requests_per_sec']:>7} -> {summary['requests_per_sec']:<7}({rps_change:+.0%})"
+              f" {base['p95_ms']:>7} -> {summary['p95_ms']:<7}({p95_change:+.0%}){'  저하' if regressed else ''}")
+    return ok
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 부하 테스트")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default=None, help="실행 중인 서버 주소 (예: http://localhost:8000)")
+    target.add_argument("--in-process", action="store_true", help="앱을 같은 프로세스에서 실행 (기본값)")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간(초)")
+    parser.add_argument("--users", type=int, default=50, help="가상 사용자 수 (최근 생성된 일반 사용자)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--seed-users", type=int, default=0, help="지정하면 실행 전 데이터를 시드합니다")
+    parser.add_argument("--seed-exams", type=int, default=60)
+    parser.add_argument("--seed-reservations", type=int, default=2000)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON 파일 경로")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="기준 대비 허용하는 처리량 감소/p95 증가 비율 (예: 0.2). 넘으면 종료 코드 1")
+    parser.add_argument("--keep-data", action="store_true", help="부하 테스트 중 생성된 예약을 삭제하지 않음")
+    args = parser.parse_args()
+
+    if args.seed_users:
+        from benchmarks.seed import seed
+        seeded = seed(args.seed_users, args.seed_exams, args.seed_reservations, args.seed)
+        print(f"시드 완료: 사용자 {len(seeded['users'])}명, 시험 {len(seeded['exam_ids'])}개, "
+              f"예약 {seeded['reservations']}건", file=sys.stderr)
+
+    users = load_users(args.users)
+    result = asyncio.run(run(args.base_url, users, args.concurrency, args.duration, args.seed))
+    created_ids = result.pop("created_ids")
+    if not args.keep_data:
+        cleanup(created_ids)
+
+    result = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "target": args.base_url or "in-process",
+            "concurrency": args.concurrency,
+            "users": len(users),
+            "seed": args.seed,
+        },
+        **result,
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(result, baseline, args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
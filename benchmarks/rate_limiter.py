@@ -0,0 +1,123 @@
+"""
+요청 제한(RateLimitMiddleware) 요청당 오버헤드 마이크로벤치마크
+
+HTTP 서버와 라우팅 없이, 빈 응답을 보내는 ASGI 앱을 미들웨어로 감싸 직접 호출하고 요청당 처리 시간을 비교합니다.
+- baseline: 미들웨어 없이 앱만 호출
+- unlimited: 제한 규칙이 없는 경로 (규칙 조회만)
+- allowed: 제한 규칙이 있는 경로에서 토큰을 받는 요청 (토큰 검증 캐시 + 버킷 갱신)
+- rejected: 버킷이 빈 사용자의 요청 (429 응답까지)
+- allowed/rejected (db): RATE_LIMIT_DATABASE_ENABLED 와 같은 공유 버킷 (--database, rate_limit_buckets 테이블 필요)
+
+    python -m benchmarks.rate_limiter --repeat 20000
+    python -m benchmarks.rate_limiter --repeat 2000 --database
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+from benchmarks.concurrency import percentile
+from src.api.middleware import RateLimitMiddleware
+from src.core.security import create_access_token
+from src.db.session import SessionLocal
+from src.models import RateLimitBucket
+from src.services.rate_limiter import RateLimiter, RateLimitRule
+
+LIMITED_PATH = "/v1/reservations/available-times"
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+def _scope(path: str, token: str) -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("10.0.0.1", 50000),
+    }
+
+
+def _cleanup(username: str) -> None:
+    db = SessionLocal()
+    try:
+        db.query(RateLimitBucket).filter(RateLimitBucket.key.endswith(f":user:{username}")).delete(
+            synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def measure(app, scope: dict, repeat: int, expected_status: int) -> dict:
+    statuses = []
+
+    async def _send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    await app(scope, _receive, _send)  # 워밍업 (토큰 검증 캐시)
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await app(scope, _receive, _send)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    unexpected = sum(status != expected_status for status in statuses[1:])
+    return {
+        "p50_us": round(percentile(latencies, 50) * 1e6, 2),
+        "p95_us": round(percentile(latencies, 95) * 1e6, 2),
+        "p99_us": round(percentile(latencies, 99) * 1e6, 2),
+        "unexpected_status": unexpected,
+    }
+
+
+async def run(repeat: int, database: bool) -> dict:
+    username = f"bench-{uuid.uuid4().hex[:8]}"
+    token = create_access_token(username)
+    # 측정하는 동안 토큰이 떨어지지 않는 규칙과, 처음 한 번 뒤로는 모두 거절되는 규칙
+    generous = RateLimitRule("GET", LIMITED_PATH, rate=1e9, burst=10 ** 9)
+    strict = RateLimitRule("GET", LIMITED_PATH, rate=1e-6, burst=1)
+
+    results = {
+        "baseline": await measure(_app, _scope(LIMITED_PATH, token), repeat, 200),
+        "unlimited": await measure(RateLimitMiddleware(_app, RateLimiter([generous], 100000, False)),
+                                   _scope("/v1/users/me", token), repeat, 200),
+        "allowed": await measure(RateLimitMiddleware(_app, RateLimiter([generous], 100000, False)),
+                                 _scope(LIMITED_PATH, token), repeat, 200),
+        "rejected": await measure(RateLimitMiddleware(_app, RateLimiter([strict], 100000, False)),
+                                  _scope(LIMITED_PATH, token), repeat, 429),
+    }
+    if database:
+        results["allowed (db)"] = await measure(RateLimitMiddleware(_app, RateLimiter([generous], 100000, True)),
+                                                _scope(LIMITED_PATH, token), repeat, 200)
+        results["rejected (db)"] = await measure(RateLimitMiddleware(_app, RateLimiter([strict], 100000, True)),
+                                                 _scope(LIMITED_PATH, token), repeat, 429)
+        _cleanup(username)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 제한 미들웨어 요청당 오버헤드 마이크로벤치마크")
+    parser.add_argument("--repeat", type=int, default=20000)
+    parser.add_argument("--database", action="store_true", help="공유 버킷(rate_limit_buckets)도 측정")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.repeat, args.database))
+    baseline = results["baseline"]["p50_us"]
+    for name, result in results.items():
+        overhead = result["p50_us"] - baseline
+        print(f"{name:>14}: p50 {result['p50_us']:>9.2f}us  p95 {result['p95_us']:>9.2f}us  "
+              f"p99 {result['p99_us']:>9.2f}us  (+{overhead:.2f}us)"
+              + (f"  예상과 다른 상태 {result['unexpected_status']}건" if result["unexpected_status"] else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+벤치마크용 데이터 시드
+
+src/fake_data_generator.py 의 팩토리로 사용자/시험/예약을 지정한 개수만큼 생성합니다.
+같은 --seed 로 실행하면 난수로 정하는 값(이름, 인원, 확정 여부)이 같습니다. 시험 시작 시각은 실행 시각 기준이고
+ID 는 DB 시퀀스에서 받으므로 실행할 때마다 달라집니다.
+
+    python -m benchmarks.seed --users 50 --exams 60 --reservations 2000 --seed 42
+"""
+import argparse
+import random
+import time
+
+from src import fake_data_generator
+from src.crud.exam_capacity_stats import rebuild_exam_capacity_stats
+from src.crud.exam_schedule import rebuild_reserved_participants
+from src.db.session import SessionLocal
+from src.models import User
+
+
+def _unique_users(users):
+    """팩토리가 만든 사용자 중 username/email 이 겹치는 사용자를 제외합니다."""
+    seen_usernames, seen_emails, unique = set(), set(), []
+    for user in users:
+        if user.username in seen_usernames or user.email in seen_emails:
+            continue
+        seen_usernames.add(user.username)
+        seen_emails.add(user.email)
+        unique.append(user)
+    return unique
+
+
+def seed(num_users: int, num_exams: int, num_reservations: int, random_seed: int = 42) -> dict:
+    random.seed(random_seed)
+    fake_data_generator.fake.seed_instance(random_seed)
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        # 기존 데이터와 겹치지 않도록 시드별 접미사를 붙입니다.
+        suffix = f"_s{random_seed}"
+        if db.query(User.user_id).filter(User.username.like(f"%{suffix}")).first() is not None:
+            raise SystemExit(f"이미 --seed {random_seed} 로 생성된 데이터가 있습니다. 다른 --seed 를 사용해주세요.")
+        users = _unique_users(fake_data_generator.create_fake_users(num_users))
+        for user in users:
+            user.username += suffix
+            user.email = user.email.replace("@", f"{suffix}@")
+            # 벤치마크 사용자는 모두 일반 사용자로 생성합니다 (관리자는 예약 목록 조회 경로가 다름).
+            user.is_admin = False
+        db.add_all(users)
+        db.commit()
+
+        exam_schedules = fake_data_generator.create_fake_exam_schedules(num_exams)
+        db.add_all(exam_schedules)
+        db.commit()
+
+        reservations = fake_data_generator.create_fake_reservations(users, exam_schedules, num_reservations)
+        db.add_all(reservations)
+        db.commit()
+
+        rebuild_reserved_participants(db)
+        rebuild_exam_capacity_stats(db)
+        db.commit()
+
+        return {
+            "users": [user.username for user in users],
+            "exam_ids": [exam_schedule.exam_id for exam_schedule in exam_schedules],
+            "reservations": len(reservations),
+            "elapsed_s": round(time.perf_counter() - started, 2),
+        }
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 데이터 시드")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--exams", type=int, default=60)
+    parser.add_argument("--reservations", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    result = seed(args.users, args.exams, args.reservations, args.seed)
+    print(f"사용자 {len(result['users'])}명, 시험 {len(result['exam_ids'])}개, "
+          f"예약 {result['reservations']}건 생성 ({result['elapsed_s']}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+예약 목록 응답 직렬화 마이크로벤치마크
+
+관리자 예약 목록 한 페이지(기본 1,000건)를 응답 본문(bytes)으로 만드는 시간을 비교합니다. DB 는 사용하지 않습니다.
+- before: 행마다 AdminReservationRead/UserBase 모델 생성 → FastAPI 가 response_model(Union)로 재검증 → 표준 json
+- before+orjson: 위와 같지만 ORJSONResponse 로 인코딩 (default_response_class 만 바꾼 경우)
+- after: 서비스가 조회 결과로 응답 본문 dict 를 한 번에 만들고 ORJSONResponse 로 바로 직렬화
+
+    python -m benchmarks.serialization --rows 1000 --repeat 50
+"""
+import argparse
+import asyncio
+import time
+from collections import namedtuple
+from typing import Union
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from benchmarks.concurrency import percentile
+from src.schemas.reservation import (AdminReservationCursorList, AdminReservationRead, AdminReservationReadList,
+                                     UserReservationCursorList, UserReservationReadList)
+from src.schemas.user import UserBase
+from src.services.reservation import _reservation_read_payloads
+
+# reservation_query.get_user_reservations_query(db, None) 결과 행과 같은 속성
+AdminRow = namedtuple("AdminRow", "reservation_id exam_id is_confirmed num_participants exam_name user_id username email")
+
+# 목록 엔드포인트의 response_model
+RESPONSE_FIELD = create_response_field(
+    name="Response_read_user_reservations",
+    type_=Union[UserReservationReadList, AdminReservationReadList, UserReservationCursorList,
+                AdminReservationCursorList],
+    mode="serialization"
+)
+
+
+def _rows(count: int):
+    return [AdminRow(
+        reservation_id=count - index,
+        exam_id=index % 60 + 1,
+        is_confirmed=index % 2 == 0,
+        num_participants=(index % 10 + 1) * 1000,
+        exam_name=f"시험 {index % 60 + 1}",
+        user_id=index % 50 + 1,
+        username=f"user{index % 50 + 1}",
+        email=f"user{index % 50 + 1}@example.com",
+    ) for index in range(count)]
+
+
+def render_before(rows, response_class=JSONResponse) -> bytes:
+    page = AdminReservationCursorList(
+        revations=[AdminReservationRead(
+            reservation_id=row.reservation_id,
+            exam_id=row.exam_id,
+            exam_name=row.exam_name,
+            is_confirmed=row.is_confirmed,
+            num_participants=row.num_participants,
+            user=UserBase(user_id=row.user_id, email=row.email, username=row.username)
+        ) for row in rows],
+        page_size=len(rows),
+        next_cursor=None,
+        total_itmes=len(rows),
+        total_is_estimate=False
+    )
+    content = asyncio.run(serialize_response(field=RESPONSE_FIELD, response_content=page, is_coroutine=True))
+    return response_class(content).body
+
+
+def render_after(rows) -> bytes:
+    return ORJSONResponse({
+        "page_size": len(rows),
+        "next_cursor": None,
+        "total_itmes": len(rows),
+        "total_is_estimate": False,
+        "revations": _reservation_read_payloads(None, rows),
+    }).body
+
+
+def measure(render, rows, repeat: int) -> dict:
+    render(rows)  # 워밍업
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render(rows)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 목록 응답 직렬화 마이크로벤치마크")
+    parser.add_argument("--rows", type=int, default=1000, help="페이지 크기")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    results = {
+        "before": measure(render_before, rows, args.repeat),
+        "before+orjson": measure(lambda page: render_before(page, ORJSONResponse), rows, args.repeat),
+        "after": measure(render_after, rows, args.repeat),
+    }
+    baseline = results["before"]["p50_ms"]
+    for name, result in results.items():
+        speedup = baseline / result["p50_ms"] if result["p50_ms"] else float("inf")
+        print(f"{name:>14}: p50 {result['p50_ms']:>8.2f}ms  p95 {result['p95_ms']:>8.2f}ms  ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+앱 기동 시간 리포트
+
+`python -X importtime -c "import src.asgi"` 을 여러 번 실행해 모듈별 import 시간의 중앙값을 구하고,
+전체 import 시간과 패키지별(자체 시간 합), 모듈별(누적/자체) 상위 항목을 출력합니다.
+--serve 는 uvicorn 을 실제로 띄워 프로세스 시작부터 요청을 받기 시작할 때(/health)와
+워밍업이 끝나 준비될 때(/health/ready)까지의 시간도 측정합니다.
+
+    python -m benchmarks.startup --repeat 5 --output startup.json
+    python -m benchmarks.startup --repeat 5 --serve --baseline startup.json --max-regression 0.2
+"""
+import argparse
+import json
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def profile_imports(target: str) -> Dict[str, dict]:
+    """새 인터프리터에서 target 모듈을 import 하고 모듈별 자체/누적 import 시간(us)을 반환합니다."""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {target}"],
+                               capture_output=True, text=True, env={**os.environ, "PYTHONPATH": os.getcwd()})
+    if completed.returncode != 0:
+        raise RuntimeError(f"{target} import 실패:\n{completed.stderr[-2000:]}")
+    modules = {}
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules[name] = {"self_us": int(self_us), "cumulative_us": int(cumulative_us)}
+    return modules
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_serve(app: str, timeout: float) -> Dict[str, float]:
+    """uvicorn 을 띄워 /health 와 /health/ready 가 처음 200 을 반환하기까지의 시간(ms)을 측정합니다."""
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-m", "uvicorn", app, "--port", str(port)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               env={**os.environ, "PYTHONPATH": os.getcwd()})
+    result = {}
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1) as client:
+            while time.perf_counter() - started < timeout and process.poll() is None:
+                for name, path in (("live_ms", "/health"), ("ready_ms", "/health/ready")):
+                    if name in result:
+                        continue
+                    try:
+                        if client.get(path).status_code == 200:
+                            result[name] = round((time.perf_counter() - started) * 1000, 1)
+                    except httpx.TransportError:
+                        break
+                if "ready_ms" in result:
+                    return result
+                time.sleep(0.005)
+    finally:
+        process.terminate()
+        process.wait()
+    raise RuntimeError(f"{timeout}초 안에 서버가 준비되지 않았습니다: {result}")
+
+
+def summarize(runs: List[Dict[str, dict]], target: str, top: int) -> dict:
+    names = set().union(*runs)
+    modules = {}
+    for name in names:
+        samples = [run[name] for run in runs if name in run]
+        modules[name] = {
+            "self_ms": round(statistics.median(sample["self_us"] for sample in samples) / 1000, 2),
+            "cumulative_ms": round(statistics.median(sample["cumulative_us"] for sample in samples) / 1000, 2),
+        }
+    by_package = defaultdict(float)
+    for name, timing in modules.items():
+        by_package[name.split(".")[0]] += timing["self_ms"]
+    import_ms = modules[target]["cumulative_ms"]
+
+    def _top(key: str) -> dict:
+        ranked = sorted(modules.items(), key=lambda item: item[1][key], reverse=True)[:top]
+        return {name: timing[key] for name, timing in ranked}
+
+    return {
+        "target": target,
+        "repeat": len(runs),
+        "import_ms": import_ms,
+        "modules": len(modules),
+        "by_package_ms": {name: round(total, 2) for name, total in
+                          sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]},
+        "top_cumulative_ms": _top("cumulative_ms"),
+        "top_self_ms": _top("self_ms"),
+    }
+
+
+def compare(result: dict, baseline: dict, max_regression: Optional[float]) -> bool:
+    """기준 결과와 import/기동 시간을 비교해 출력하고, 허용치를 넘게 느려졌으면 False 를 반환합니다."""
+    ok = True
+    for key in ("import_ms", "live_ms", "ready_ms"):
+        if key not in result or key not in baseline:
+            continue
+        change = (result[key] - baseline[key]) / baseline[key] if baseline[key] else 0.0
+        regressed = max_regression is not None and change > max_regression
+        ok = ok and not regressed
+        print(f"{key:<10} {baseline[key]:>9} -> {result[key]:<9}({change:+.0%}){'  저하' if regressed else ''}")
+    base_packages = baseline.get("by_package_ms", {})
+    for name, total in result["by_package_ms"].items():
+        if name in base_packages:
+            print(f"  {name:<28} {base_packages[name]:>9} -> {total}")
+        else:
+            print(f"  {name:<28} {'(기준 없음)':>9} -> {total}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱 기동 시간(import 시간) 리포트")
+    parser.add_argument("--target", default="src.asgi", help="import 할 모듈 (운영 서버 진입점)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (모듈별 중앙값 사용)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 상위 항목 수")
+    parser.add_argument("--serve", action="store_true", help="uvicorn 을 띄워 /health, /health/ready 까지의 시간도 측정")
+    parser.add_argument("--serve-timeout", type=float, default=60)
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON 파일 경로")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="기준 대비 허용하는 기동 시간 증가 비율 (예: 0.2). 넘으면 종료 코드 1")
+    args = parser.parse_args()
+
+    result = summarize([profile_imports(args.target) for _ in range(args.repeat)], args.target, args.top)
+    if args.serve:
+        serves = [measure_serve(f"{args.target}:app", args.serve_timeout) for _ in range(args.repeat)]
+        result["live_ms"] = statistics.median(serve["live_ms"] for serve in serves if "live_ms" in serve)
+        result["ready_ms"] = statistics.median(serve["ready_ms"] for serve in serves)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(result, baseline, args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
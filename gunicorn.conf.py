@@ -0,0 +1,48 @@
+"""
+운영 서버 설정 (gunicorn 마스터 + uvicorn 워커)
+
+    gunicorn -c gunicorn.conf.py src.asgi:app
+
+- 마스터가 앱을 한 번 import(preload) 한 뒤 워커를 fork 하므로 워커가 빨리 뜨고, import 한 모듈의 메모리를 공유합니다.
+- 워커마다 DB 커넥션 풀, 프로세스 안의 캐시, 캐시 무효화 LISTEN 연결을 따로 가집니다.
+  다른 워커의 쓰기로 바뀐 캐시는 LISTEN/NOTIFY(src/core/cache_invalidation.py)로 지웁니다.
+- 워커가 2개 이상이면 같은 Idempotency-Key 의 동시 요청이 다른 워커에서 두 번 처리되지 않도록 IDEMPOTENCY_DATABASE_ENABLED 를
+  켭니다. 명시적으로 false 로 지정했다면 실행하지 않습니다.
+- /metrics 와 /internal/* 은 요청을 받은 워커 하나의 값이며, 응답의 X-Worker-Pid 헤더와 메트릭의 worker 레이블로 구분합니다.
+- kill -HUP <마스터 pid>: 새 워커를 띄우고 기존 워커는 처리 중인 요청을 마친 뒤 종료합니다 (graceful reload).
+  preload 한 코드는 다시 읽지 않으므로, 새 코드를 배포할 때는 kill -USR2 로 새 마스터를 띄운 뒤 기존 마스터에 TERM 을 보냅니다.
+"""
+import multiprocessing
+import os
+
+from src.core.config import settings
+
+bind = "0.0.0.0:8000"
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = settings.WEB_CONCURRENCY or multiprocessing.cpu_count()
+# preload 로 앱을 import 하기 전에 설정하므로 idempotency_store 가 DB 보관소를 사용합니다 (preload 없이 워커가 import 해도 환경 변수로 전달).
+idempotency_database_forced = workers > 1 and not settings.IDEMPOTENCY_DATABASE_ENABLED
+if idempotency_database_forced:
+    if "IDEMPOTENCY_DATABASE_ENABLED" in os.environ:
+        raise RuntimeError(f"워커 {workers}개로 실행하려면 IDEMPOTENCY_DATABASE_ENABLED=true 가 필요합니다. "
+                           "워커마다 따로 보관하면 같은 Idempotency-Key 의 동시 요청이 중복 처리됩니다.")
+    settings.IDEMPOTENCY_DATABASE_ENABLED = True
+    os.environ["IDEMPOTENCY_DATABASE_ENABLED"] = "true"
+preload_app = True
+# 재시작/종료 시 기존 워커가 처리 중인 요청을 마칠 때까지 기다리는 시간(초)
+graceful_timeout = settings.WEB_GRACEFUL_TIMEOUT
+# nginx 와의 keep-alive 연결 유지 시간(초)
+keepalive = 5
+
+
+def on_starting(server):
+    if idempotency_database_forced:
+        server.log.info("워커 %d개로 실행하므로 Idempotency-Key 응답을 idempotency_keys 테이블에서 공유합니다.", workers)
+
+
+def post_fork(server, worker):
+    # preload 중 마스터에서 열린 커넥션이 있더라도 워커가 같은 소켓을 이어 쓰지 않도록 풀을 새로 시작합니다.
+    # close=False: 마스터(와 다른 워커)가 가진 커넥션은 닫지 않고 이 프로세스의 풀에서만 버립니다.
+    from src.db.session import engine, replica_router
+    for db_engine in [engine, *replica_router.replicas]:
+        db_engine.dispose(close=False)
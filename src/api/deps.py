@@ -1,37 +1,74 @@
-from fastapi import Depends, HTTPException, status
+import os
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
 
-from src.core.config import settings
+from src.core.principal_cache import principal_cache
+from src.core.security import decode_access_token
 from src.crud.user import get_user_by_username
-from src.db.session import SessionLocal
+from src.db.session import SessionLocal, get_db, get_read_db
+from src.schemas.user import CurrentUser
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/users/login")
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def _current_user(token: str) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="인증 정보를 확인할 수 없습니다",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
+    payload = decode_access_token(token)
+    username: Optional[str] = payload.get("sub") if payload else None
+    if username is None:
         raise credentials_exception
-    user = get_user_by_username(db, username=username)
+
+    principal = principal_cache.get(username)
+    if principal is not None:
+        return principal
+
+    # 조회 중에 무효화(사용자 수정/삭제, 다른 워커의 NOTIFY)가 있으면 조회 결과를 캐시에 넣지 않습니다.
+    version = principal_cache.version
+    # 엔드포인트의 세션과 따로, 조회 후 바로 반납하는 짧은 세션을 사용합니다.
+    # 엔드포인트는 별도의 스레드에서 실행되므로, 그 사이 커넥션을 쥐고 있으면 커넥션을 가진 요청이 스레드를 기다리고
+    # 스레드는 커넥션을 기다리는 교착 상태가 생길 수 있습니다.
+    # 조회 결과는 TTL 동안 캐시되므로, 무효화 이후에도 옛 값을 돌려줄 수 있는 복제본이 아닌 primary 에서 조회합니다.
+    db = SessionLocal()
+    try:
+        user = get_user_by_username(db, username=username)
+    finally:
+        db.close()
     if user is None:
         raise credentials_exception
-    return user
+    principal = CurrentUser.model_validate(user)
+    principal_cache.set(version, principal)
+    return principal
+
+
+# DB 조회가 있으므로 동기 함수로 두어 스레드풀에서 실행되게 합니다.
+# (async 로 선언하면 블로킹 쿼리가 이벤트 루프를 막아 동시 요청이 모두 멈춥니다)
+def get_current_user(token: str = Depends(oauth2_scheme)) -> CurrentUser:
+    return _current_user(token)
+
+
+def get_current_read_user(token: str = Depends(oauth2_scheme)) -> CurrentUser:
+    """
+    조회 전용 엔드포인트용. 캐시 미스 시 사용자 조회는 캐시에 들어가므로 get_current_user 와 같이 primary 에서 합니다.
+    """
+    return _current_user(token)
+
+
+def idempotency_key_header(
+        idempotency_key: Optional[str] = Header(
+            None, description="재시도해도 한 번만 처리되도록 하는 요청 키. 같은 키의 재시도에는 처음 응답을 그대로 반환합니다.")
+) -> None:
+    """Idempotency-Key 헤더를 API 문서에 표시합니다. 처리는 IdempotencyMiddleware 가 합니다."""
+
+
+WORKER_PID_HEADER = "X-Worker-Pid"
+
+
+async def worker_pid_header(response: Response) -> None:
+    """워커마다 따로 집계하는 내부 엔드포인트(/internal/*)의 응답에 어느 워커의 값인지 표시합니다."""
+    response.headers[WORKER_PID_HEADER] = str(os.getpid())
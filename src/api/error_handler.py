@@ -1,5 +1,5 @@
 from fastapi import Request, FastAPI, HTTPException
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 
 class CustomException(Exception):
@@ -10,10 +10,12 @@ class CustomException(Exception):
 
 
 def exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "code": exc.status_code,
             "message": exc.detail,
-        }
+        },
+        # WWW-Authenticate, Retry-After 등 예외에 지정한 헤더 유지
+        headers=getattr(exc, "headers", None)
     )
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
+
+from src.core.warmup import startup_warmup
+
+# 로드밸런서/컨테이너 상태 확인용 엔드포인트
+router = APIRouter()
+
+
+@router.get("/health", include_in_schema=False)
+async def liveness():
+    return {"status": "ok"}
+
+
+@router.get("/health/ready", include_in_schema=False)
+async def readiness():
+    # 기동 워밍업이 끝나기 전에는 503 (프로세스는 살아 있지만 아직 트래픽을 받을 준비가 되지 않음)
+    if not startup_warmup.ready:
+        return ORJSONResponse({"status": "starting"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return {"status": "ready"}
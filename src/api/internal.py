@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends
+
+from src.api.deps import worker_pid_header
+
+from src.core.available_times_cache import available_times_cache
+from src.core.cache_invalidation import cache_invalidation_listener
+from src.core.password_hasher import password_hasher
+from src.core.principal_cache import principal_cache
+from src.core.warmup import startup_warmup
+from src.db.session import engine, replica_router
+from src.services.booking_queue import booking_queue
+from src.services.idempotency import idempotency_store
+from src.services.rate_limiter import rate_limiter
+
+# 운영 확인용 내부 엔드포인트 (nginx 에서 외부 접근 차단)
+# 통계는 요청을 받은 워커 프로세스 하나의 값이므로 응답의 X-Worker-Pid 헤더로 어느 워커인지 표시합니다.
+router = APIRouter(dependencies=[Depends(worker_pid_header)])
+
+
+@router.get("/principal-cache", summary="principal 캐시 통계")
+async def principal_cache_stats():
+    return principal_cache.stats()
+
+
+@router.get("/available-times-cache", summary="예약 가능 시간 캐시 통계")
+async def available_times_cache_stats():
+    return available_times_cache.stats()
+
+
+@router.get("/password-hasher", summary="비밀번호 해시 프로세스 풀 통계")
+async def password_hasher_stats():
+    return password_hasher.stats()
+
+
+@router.get("/db-pool", summary="DB 커넥션 풀 상태")
+async def db_pool_stats():
+    return engine.pool.snapshot()
+
+
+@router.get("/booking-queue", summary="예약 대기열 통계")
+async def booking_queue_stats():
+    return booking_queue.stats()
+
+
+@router.get("/db-replicas", summary="읽기 전용 복제본 상태")
+async def db_replicas_stats():
+    return replica_router.stats()
+
+
+@router.get("/idempotency", summary="Idempotency-Key 응답 보관소 통계")
+async def idempotency_stats():
+    return idempotency_store.stats()
+
+
+@router.get("/rate-limiter", summary="요청 제한 통계")
+async def rate_limiter_stats():
+    return rate_limiter.stats()
+
+
+@router.get("/cache-invalidation", summary="캐시 무효화(LISTEN/NOTIFY) 상태")
+async def cache_invalidation_stats():
+    return cache_invalidation_listener.stats()
+
+
+@router.get("/startup", summary="기동 워밍업 상태")
+async def startup_stats():
+    return startup_warmup.stats()
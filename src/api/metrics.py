@@ -0,0 +1,24 @@
+import os
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.api.deps import WORKER_PID_HEADER
+from src.core.metrics import metrics_registry
+from src.db.session import engine
+
+# Prometheus 수집용 엔드포인트 (nginx 에서 외부 접근 차단). 요청을 받은 워커의 메트릭만 worker 레이블을 붙여 반환합니다.
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    pool = engine.pool.snapshot()
+    gauges = {
+        "db_pool_checked_out": pool["checked_out"],
+        "db_pool_overflow": pool["overflow"],
+        "db_pool_waiting": pool["waiting"],
+        "db_pool_timeouts_total": pool["timeouts"],
+    }
+    return PlainTextResponse(metrics_registry.render(gauges), media_type="text/plain; version=0.0.4",
+                             headers={WORKER_PID_HEADER: str(os.getpid())})
@@ -0,0 +1,207 @@
+import hashlib
+import logging
+import math
+import time
+from typing import Iterable, Optional
+
+from cachetools import TTLCache
+from fastapi import HTTPException, status
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.error_handler import exception_handler
+from src.core.config import settings
+from src.core.metrics import RequestMetrics, current_request_metrics, metrics_registry
+from src.core.query_budget import check_query_budget
+from src.core.security import decode_access_token
+from src.services.idempotency import IdempotencyStore, StoredResponse
+from src.services.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+class MetricsMiddleware:
+    """
+    요청별 처리 시간, 쿼리 수/DB 시간, 응답 직렬화 시간을 라우트 단위로 기록합니다.
+    BaseHTTPMiddleware 는 요청마다 태스크를 하나 더 만들기 때문에 순수 ASGI 미들웨어로 구현합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_metrics = RequestMetrics()
+        token = current_request_metrics.set(request_metrics)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_metrics.reset(token)
+            # 경로 파라미터 값 대신 라우트 템플릿(/v1/reservations/{reservation_id})으로 집계합니다.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            metrics_registry.record_request(
+                scope["method"], route, status_code, time.perf_counter() - started, request_metrics)
+            check_query_budget(scope["method"], route, request_metrics)
+
+
+# 검증한 토큰 -> (sub, exp). 서명 검증(HMAC)을 요청마다 반복하지 않도록 보관하며, 이벤트 루프에서만 사용합니다.
+_token_subjects = TTLCache(maxsize=settings.PRINCIPAL_CACHE_MAXSIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def _token_subject(authorization: Optional[str]) -> Optional[str]:
+    """Bearer 토큰의 sub(username). 토큰이 없거나 유효하지 않으면 None (라우트의 인증이 401 로 응답합니다)."""
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    token = authorization[7:]
+    cached = _token_subjects.get(token)
+    if cached is not None:
+        subject, expires_at = cached
+        return subject if expires_at is None or expires_at > time.time() else None
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+    subject = payload.get("sub")
+    if subject is not None:
+        _token_subjects[token] = (subject, payload.get("exp"))
+    return subject
+
+
+def _is_stored_status(status_code: int) -> bool:
+    # 서버 오류와 인증 실패/요청 제한은 같은 요청을 다시 보내면 결과가 달라질 수 있으므로 보관하지 않습니다.
+    return status_code < 500 and status_code not in (status.HTTP_401_UNAUTHORIZED, status.HTTP_429_TOO_MANY_REQUESTS)
+
+
+class IdempotencyMiddleware:
+    """
+    Idempotency-Key 헤더가 있는 쓰기 요청(methods, path_prefix)의 첫 응답을 보관하고, 같은 키의 재시도에는 라우트를 실행하지 않고
+    보관한 응답을 Idempotent-Replayed 헤더와 함께 돌려줍니다. 키는 토큰의 사용자, 메서드, 경로별로 구분하며
+    요청 본문이 다르면 422 로 거절합니다. 인증 정보가 없거나 유효하지 않은 요청은 그대로 라우트로 넘깁니다.
+    """
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore, path_prefix: str,
+                 methods: Iterable[str] = ("POST", "PUT", "PATCH", "DELETE")):
+        self.app = app
+        self.store = store
+        self.path_prefix = path_prefix
+        self.methods = frozenset(methods)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in self.methods or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get("idempotency-key")
+        username = _token_subject(headers.get("authorization")) if idempotency_key is not None else None
+        if username is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            error = HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                  detail=f"Idempotency-Key 는 1~{IDEMPOTENCY_KEY_MAX_LENGTH}자여야 합니다.")
+            await exception_handler(None, error)(scope, receive, send)
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        fingerprint = hashlib.sha256(b"\n".join([scope["query_string"], body])).hexdigest()
+        key = f"{username}:{scope['method']}:{scope['path']}:{idempotency_key}"
+
+        try:
+            stored = await self.store.acquire(key, fingerprint)
+        except HTTPException as e:
+            await exception_handler(None, e)(scope, receive, send)
+            return
+        if stored is not None:
+            await send({"type": "http.response.start", "status": stored.status_code,
+                        "headers": [*stored.headers, (b"idempotent-replayed", b"true")]})
+            await send({"type": "http.response.body", "body": stored.body})
+            return
+
+        body_sent = False
+
+        async def receive_wrapper() -> Message:
+            # 이미 읽은 본문을 라우트에 다시 전달하고, 이후에는 연결 종료 등을 그대로 전달합니다.
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        response_start: Optional[Message] = None
+        response_body = []
+
+        async def send_wrapper(message: Message):
+            nonlocal response_start
+            if message["type"] == "http.response.start":
+                response_start = message
+            elif message["type"] == "http.response.body":
+                response_body.append(message.get("body", b""))
+            await send(message)
+
+        response = None
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+            if response_start is not None and _is_stored_status(response_start["status"]):
+                response = StoredResponse(fingerprint, response_start["status"],
+                                          list(response_start.get("headers", [])), b"".join(response_body))
+        finally:
+            try:
+                await self.store.complete(key, response)
+            except Exception:
+                # 응답은 이미 보냈으므로 보관에 실패해도 요청은 실패시키지 않습니다 (재시도는 다시 실행됩니다).
+                logger.exception("Idempotency-Key 응답 보관 실패: %s", key)
+
+
+class RateLimitMiddleware:
+    """
+    RATE_LIMITS 에 설정한 라우트를 사용자(JWT sub)별, 토큰이 없거나 유효하지 않으면 IP 별 토큰 버킷으로 제한합니다.
+    라우팅과 의존성(get_db, 인증 조회)보다 먼저 실행되므로, 제한을 넘은 요청은 DB 커넥션을 받지 않고 429 와 Retry-After 로 거절됩니다.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter, trust_proxy_headers: bool = False):
+        self.app = app
+        self.limiter = limiter
+        self.trust_proxy_headers = trust_proxy_headers
+
+    def _identity(self, scope: Scope) -> str:
+        headers = Headers(scope=scope)
+        username = _token_subject(headers.get("authorization"))
+        if username is not None:
+            return f"user:{username}"
+        # nginx 뒤에서는 모든 요청의 client 가 nginx 이므로 nginx 가 넣어주는 X-Real-IP 를 사용합니다.
+        client_ip = headers.get("x-real-ip") if self.trust_proxy_headers else None
+        if client_ip is None and scope.get("client"):
+            client_ip = scope["client"][0]
+        return f"ip:{client_ip}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        rule = self.limiter.match(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+        retry_after = await self.limiter.acquire(rule, self._identity(scope))
+        if retry_after is None:
+            await self.app(scope, receive, send)
+            return
+        error = HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                              detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                              headers={"Retry-After": str(math.ceil(retry_after))})
+        await exception_handler(None, error)(scope, receive, send)
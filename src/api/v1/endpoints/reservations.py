@@ -1,13 +1,24 @@
-from typing import List, Union
+from datetime import datetime
+from typing import List, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
-from src.api.deps import get_db, get_current_user
-from src.models.user import User
+from src.api.deps import get_current_read_user, get_current_user, get_db, get_read_db, idempotency_key_header
+from src.core.query_budget import query_budget
+from src.core.available_times_cache import available_times_cache
+from src.core.config import settings
+from src.schemas.user import CurrentUser
 from src.schemas.reservation import ReservationCreate, ReservationUpdate, Reservation, UserReservationRead, \
-    AdminReservationRead, AvailableTimeSchema, UserReservationReadList, AdminReservationReadList
+    AdminReservationRead, AvailableTimeSchema, UserReservationReadList, AdminReservationReadList, \
+    UserReservationCursorList, AdminReservationCursorList, BulkReservationResult, \
+    ReservationBulkConfirm, BulkConfirmResult, ExamCapacityStatsRead
+from src.services.booking_queue import booking_queue
 from src.services.reservation import ReservationService
+from src.utils.cursor import decode_cursor
+from src.utils.etag import etag_matches
 
 router = APIRouter()
 
@@ -20,13 +31,32 @@ common_responses = {
 }
 
 
+def _available_times_headers(etag: str) -> dict:
+    # 사용자별 인증이 필요한 응답이므로 공유 캐시에는 저장하지 않고, 매번 ETag 로 재검증하게 합니다.
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
 @router.get("/available-times", response_model=List[AvailableTimeSchema], summary="이용 가능한 시간 조회",
-            description="현재 예약 가능한 시간 목록을 조회합니다.")
-def available_times(
+            description="현재 예약 가능한 시간 목록을 조회합니다. 응답의 ETag 를 If-None-Match 로 보내면 "
+                        "목록이 바뀌지 않은 경우 본문 없이 304 를 반환합니다.",
+            responses={304: {"description": "목록이 바뀌지 않음"}},
+            dependencies=[Depends(query_budget(2))])
+async def available_times(
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+        # 다시 계산한 목록은 현재 데이터 버전으로 캐시되므로, 복제 지연이 있는 복제본이 아닌 primary 에서 조회합니다.
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: CurrentUser = Depends(get_current_read_user)
 ):
-    times = ReservationService.get_available_times(db)
+    # 캐시된 목록과 같으면 DB 조회 없이 304
+    etag = available_times_cache.current_etag()
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_available_times_headers(etag))
+
+    times, etag = await run_in_threadpool(ReservationService.get_available_times, db)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_available_times_headers(etag))
+    response.headers.update(_available_times_headers(etag))
     return times
 
 
@@ -36,43 +66,152 @@ def available_times(
              responses={
                  400: {"description": "예약 생성 실패"},
                  **common_responses
-             })
-def create_reservation(
+             },
+             dependencies=[Depends(query_budget(4)), Depends(idempotency_key_header)])
+async def create_reservation(
         reservation: ReservationCreate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: CurrentUser = Depends(get_current_user)
 ):
-    db_reservation = ReservationService.create_reservation(db, reservation, current_user.user_id)
+    if settings.BOOKING_QUEUE_ENABLED:
+        # 같은 시험의 요청과 묶어 한 번에 커밋 (잔여 인원 확인도 묶음당 한 번)
+        db_reservation = await booking_queue.submit(current_user.user_id, reservation)
+    else:
+        db_reservation = await run_in_threadpool(
+            ReservationService.create_reservation, db, reservation, current_user.user_id)
     if db_reservation is None:
         raise HTTPException(status_code=400, detail="예약 생성에 실패했습니다. 입력한 정보를 확인해주세요.")
     return db_reservation
 
 
-@router.get("", response_model=Union[UserReservationReadList, AdminReservationReadList], summary="사용자의 모든 예약 조회",
-            description="현재 사용자의 모든 예약을 조회합니다. 페이지네이션을 지원합니다.",
+@router.post("/bulk", response_model=BulkReservationResult, summary="예약 일괄 생성",
+             description=f"여러 시험에 대한 예약을 한 번에 생성합니다 (최대 {settings.BULK_RESERVATION_MAX_ITEMS}건). "
+                         "항목별로 성공/실패가 반환되며, 실패한 항목이 있어도 나머지 예약은 생성됩니다.",
+             status_code=status.HTTP_200_OK,
+             responses={
+                 400: {"description": "요청 목록이 비어 있거나 최대 건수를 초과"},
+                 **common_responses
+             },
+             dependencies=[Depends(query_budget(4)), Depends(idempotency_key_header)])
+async def create_reservations_bulk(
+        reservations: List[ReservationCreate],
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+):
+    return await run_in_threadpool(
+        ReservationService.create_reservations_bulk, db, reservations, current_user.user_id)
+
+
+@router.post("/confirm", response_model=BulkConfirmResult, summary="예약 일괄 확정 (관리자)",
+             description="지정한 예약들, 또는 특정 시험의 미확정 예약 전체를 선착순(생성 시간 순)으로 "
+                         "잔여 인원 안에서 한 번에 확정합니다. 확정된 예약과 확정되지 않은 예약(사유 포함)을 반환합니다. "
+                         "시험 단위로 확정하면 확정되지 않은 예약은 건수(rejected_count)만 반환합니다.",
+             status_code=status.HTTP_200_OK,
+             responses={
+                 400: {"description": "최대 건수 초과"},
+                 **common_responses
+             },
+             dependencies=[Depends(query_budget(4)), Depends(idempotency_key_header)])
+async def confirm_reservations(
+        request: ReservationBulkConfirm,
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+):
+    return await run_in_threadpool(ReservationService.confirm_reservations, db, request, current_user)
+
+
+@router.get("", response_model=Union[UserReservationReadList, AdminReservationReadList,
+                                     UserReservationCursorList, AdminReservationCursorList],
+            summary="사용자의 모든 예약 조회",
+            description="현재 사용자의 모든 예약을 조회합니다. 페이지네이션을 지원합니다. "
+                        "cursor(또는 after_id)를 지정하면 keyset 페이지네이션으로 조회하며, "
+                        "첫 페이지는 빈 cursor(`cursor=`)로 요청하고 응답의 next_cursor 로 다음 페이지를 요청합니다.",
             status_code=status.HTTP_200_OK,
-            responses=common_responses)
-def read_user_reservations(
+            responses=common_responses,
+            dependencies=[Depends(query_budget(3))])
+async def read_user_reservations(
         page: int = Query(1, description="페이지"),
         limit: int = Query(100, ge=1, le=1000, description="한 페이지 최대 갯수"),
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        cursor: Optional[str] = Query(None, description="keyset 페이지네이션 커서 (이전 응답의 next_cursor)"),
+        after_id: Optional[int] = Query(None, ge=1, description="이 예약 ID 이전(더 오래된) 예약부터 조회"),
+        include_total: bool = Query(False, description="커서 모드에서 정확한 전체 건수 계산 여부 (기본: 예상치)"),
+        db: Session = Depends(get_read_db),
+        current_user: CurrentUser = Depends(get_current_read_user)
 ):
     is_admin = current_user.is_admin
-    return ReservationService.get_user_reservations(
-        db, None if is_admin else current_user.user_id, page, limit)
+    user_id = None if is_admin else current_user.user_id
+
+    # 목록은 서비스에서 응답 본문을 한 번에 만들어 두었으므로 response_model 로 다시 검증하지 않고 바로 직렬화합니다.
+    if cursor is None and after_id is None:
+        return ORJSONResponse(
+            await run_in_threadpool(ReservationService.get_user_reservations, db, user_id, page, limit))
+
+    if after_id is None:
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ORJSONResponse(await run_in_threadpool(
+        ReservationService.get_user_reservations_by_cursor, db, user_id, after_id, limit, include_total))
+
+
+@router.get("/export", summary="예약 내보내기 (관리자)",
+            description="조건에 맞는 예약 전체를 NDJSON(기본) 또는 CSV 로 스트리밍합니다. "
+                        "페이지를 나눠 조회하지 않고 한 번의 요청으로 모든 행을 받을 수 있습니다. "
+                        "created_from 이상, created_to 미만의 생성 시각으로 거를 수 있습니다.",
+            status_code=status.HTTP_200_OK,
+            responses={
+                200: {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+                **common_responses
+            },
+            dependencies=[Depends(query_budget(2))])
+async def export_reservations(
+        format: Literal["ndjson", "csv"] = Query("ndjson", description="출력 형식"),
+        exam_id: Optional[int] = Query(None, ge=1, description="시험 ID"),
+        is_confirmed: Optional[bool] = Query(None, description="확정 여부"),
+        created_from: Optional[datetime] = Query(None, description="생성 시각 시작 (포함)"),
+        created_to: Optional[datetime] = Query(None, description="생성 시각 끝 (미포함)"),
+        current_user: CurrentUser = Depends(get_current_read_user)
+):
+    chunks = ReservationService.export_reservations(
+        current_user, format, exam_id, is_confirmed, created_from, created_to)
+    media_type = "text/csv; charset=utf-8" if format == "csv" else "application/x-ndjson"
+    # 동기 이터레이터는 StreamingResponse 가 스레드풀에서 읽으므로 이벤트 루프를 막지 않습니다.
+    return StreamingResponse(chunks, media_type=media_type, headers={
+        "Content-Disposition": f'attachment; filename="reservations.{format}"',
+        # nginx 가 응답을 모아서 보내지 않고 바로 전달하도록 합니다.
+        "X-Accel-Buffering": "no",
+    })
+
+
+@router.get("/capacity-stats", response_model=List[ExamCapacityStatsRead], summary="시험별 예약 현황 (관리자)",
+            description="시험별 정원과 확정/대기 인원 및 예약 수를 시작 시간순으로 조회합니다. "
+                        "start_from 이상, start_to 미만의 시작 시간으로 거를 수 있습니다.",
+            status_code=status.HTTP_200_OK,
+            responses=common_responses,
+            dependencies=[Depends(query_budget(2))])
+async def read_exam_capacity_stats(
+        exam_id: Optional[int] = Query(None, ge=1, description="시험 ID"),
+        start_from: Optional[datetime] = Query(None, description="시험 시작 시간 시작 (포함)"),
+        start_to: Optional[datetime] = Query(None, description="시험 시작 시간 끝 (미포함)"),
+        db: Session = Depends(get_read_db),
+        current_user: CurrentUser = Depends(get_current_read_user)
+):
+    return await run_in_threadpool(
+        ReservationService.get_exam_capacity_stats, db, current_user, exam_id, start_from, start_to)
 
 
 @router.get("/{reservation_id}", response_model=Union[UserReservationRead, AdminReservationRead], summary="특정 예약 조회",
             description="특정 예약의 상세 정보를 조회합니다. 사용자는 자신의 예약만 조회할 수 있습니다.",
             status_code=status.HTTP_200_OK,
-            responses=common_responses)
-def read_reservation(
+            responses=common_responses,
+            dependencies=[Depends(query_budget(2))])
+async def read_reservation(
         reservation_id: int,
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        db: Session = Depends(get_read_db),
+        current_user: CurrentUser = Depends(get_current_read_user)
 ):
-    db_reservation = ReservationService.get_reservation(db, reservation_id, current_user)
+    db_reservation = await run_in_threadpool(ReservationService.read_reservation, db, reservation_id, current_user)
     return db_reservation
 
 
@@ -82,14 +221,16 @@ def read_reservation(
             responses={
                 400: {"description": "예약 수정 실패"},
                 **common_responses
-            })
-def update_reservation(
+            },
+            dependencies=[Depends(query_budget(7)), Depends(idempotency_key_header)])
+async def update_reservation(
         reservation_id: int,
         request: ReservationUpdate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: CurrentUser = Depends(get_current_user)
 ):
-    updated_reservation = ReservationService.update_reservation(db, reservation_id, request, current_user)
+    updated_reservation = await run_in_threadpool(
+        ReservationService.update_reservation, db, reservation_id, request, current_user)
     if updated_reservation is None:
         raise HTTPException(status_code=400, detail="예약 업데이트에 실패했습니다. 입력한 정보를 확인해주세요.")
     return updated_reservation
@@ -101,13 +242,14 @@ def update_reservation(
                responses={
                    400: {"description": "예약 삭제 실패"},
                    **common_responses
-               })
-def delete_reservation(
+               },
+               dependencies=[Depends(query_budget(7)), Depends(idempotency_key_header)])
+async def delete_reservation(
         reservation_id: int,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: CurrentUser = Depends(get_current_user)
 ):
-    success = ReservationService.delete_reservation(db, reservation_id, current_user)
+    success = await run_in_threadpool(ReservationService.delete_reservation, db, reservation_id, current_user)
     if not success:
         raise HTTPException(status_code=400, detail="예약 삭제에 실패했습니다. 다시 시도해주세요.")
     return {"detail": "예약이 성공적으로 삭제되었습니다."}
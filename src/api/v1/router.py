@@ -1,8 +1,13 @@
-from fastapi import APIRouter
-from src.api.v1.endpoints import users
-from src.api.v1.endpoints import reservations
+from fastapi import FastAPI
 
-router = APIRouter()
+from src.api.v1.endpoints import reservations, users
 
-router.include_router(reservations.router, prefix="/reservations", tags=["reservations"])
-router.include_router(users.router, prefix="/users", tags=["users"])
+
+def include_routers(app: FastAPI, prefix: str) -> None:
+    """
+    v1 엔드포인트 라우터를 앱에 등록합니다.
+    FastAPI 는 include_router 할 때마다 라우트(의존성 분석, 응답 모델 필드)를 새로 만들기 때문에
+    중간 APIRouter 에 모았다가 앱에 다시 넣지 않고 앱에 바로 등록해 기동 시간을 줄입니다.
+    """
+    app.include_router(reservations.router, prefix=f"{prefix}/reservations", tags=["reservations"])
+    app.include_router(users.router, prefix=f"{prefix}/users", tags=["users"])
@@ -0,0 +1,15 @@
+"""
+운영 서버 진입점 (gunicorn.conf.py, start.sh)
+
+앱을 import 하는 동안 만들어지는 객체(모듈, 클래스, pydantic 스키마, 라우트)가 많아 순환 참조 GC 가 여러 번 전체를 훑습니다.
+import 하는 동안에는 GC 를 멈추고, 끝나면 그때까지 만든 객체를 GC 대상에서 빼고(freeze) 다시 켭니다.
+freeze 한 객체는 이후 GC 에서도 훑지 않으므로 gunicorn preload 후 fork 한 워커들이 메모리 페이지를 더 오래 공유합니다.
+"""
+import gc
+
+gc.disable()
+try:
+    from src.main import app  # noqa: E402,F401
+finally:
+    gc.freeze()
+    gc.enable()
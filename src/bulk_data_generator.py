@@ -0,0 +1,225 @@
+"""
+대용량 가짜 데이터 생성기
+
+fake_data_generator 와 같은 형태의 데이터를 수백만 건 단위로 생성합니다.
+- 비밀번호 해시(bcrypt)는 한 번만 계산해 모든 사용자에 재사용합니다.
+- 행은 워커 프로세스에서 청크 단위로 만들어 각자의 커넥션으로 COPY FROM STDIN 합니다.
+- 같은 --seed 와 개수로 실행하면 난수로 정하는 값(이름, 인원, 확정 여부, 예약 조합, 기준 시각과의 간격)이 같습니다 (청크별 난수 시드 고정).
+  시각은 --anchor(기본: 실행 시각) 기준이고 ID 는 DB 시퀀스에서 이어 받으므로, 행까지 같게 만들려면 같은 --anchor 로
+  시퀀스가 초기화된 빈 DB 에 생성합니다.
+
+    python -m src.bulk_data_generator --users 100000 --exams 500 --reservations 10000000 --workers 8
+"""
+import argparse
+import io
+import math
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from multiprocessing import Pool
+
+from faker import Faker
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.core.config import settings
+from src.core.security import get_password_hash
+from src.crud.exam_capacity_stats import rebuild_exam_capacity_stats
+from src.crud.exam_schedule import rebuild_reserved_participants
+from src.db.session import create_db_engine
+
+USER_COLUMNS = "user_id, email, username, hashed_password, first_name, last_name, is_active, is_admin"
+EXAM_COLUMNS = "exam_id, name, start_time, end_time, max_capacity"
+RESERVATION_COLUMNS = "user_id, exam_id, num_participants, is_confirmed, created_at"
+
+_worker_engine = None
+
+
+def _init_worker(database_url: str):
+    # fork 된 프로세스는 부모의 커넥션 풀을 쓰면 안 되므로 워커마다 엔진을 새로 만듭니다.
+    global _worker_engine
+    _worker_engine = create_db_engine(database_url, statement_timeout_ms=0, poolclass=NullPool)
+
+
+def _copy(engine, table: str, columns: str, rows: str) -> None:
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        # 실패하면 다시 생성하면 되는 데이터이므로 커밋마다 WAL flush 를 기다리지 않습니다.
+        cursor.execute("SET synchronous_commit = off")
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", io.StringIO(rows))
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _chunk_random(seed: int, kind: int, chunk_index: int) -> random.Random:
+    return random.Random(seed * 1_000_003 + kind * 10_007 + chunk_index)
+
+
+def _user_rows(task) -> int:
+    chunk_index, start, end, first_user_id, password_hash, admin_ratio, seed = task
+    rng = _chunk_random(seed, 1, chunk_index)
+    fake = Faker('ko_KR')
+    fake.seed_instance(rng.random())
+    first_names = [fake.first_name() for _ in range(200)]
+    last_names = [fake.last_name() for _ in range(50)]
+    user_names = [fake.user_name() for _ in range(500)]
+
+    lines = []
+    for offset in range(start, end):
+        user_id = first_user_id + offset
+        # user_id 를 붙여 username/email 이 겹치지 않게 합니다.
+        username = f"{rng.choice(user_names)}_u{user_id}"
+        lines.append("\t".join((
+            str(user_id), f"{username}@example.com", username, password_hash,
+            rng.choice(first_names), rng.choice(last_names),
+            "t", "t" if rng.random() < admin_ratio else "f"
+        )))
+    _copy(_worker_engine, "users", USER_COLUMNS, "\n".join(lines) + "\n")
+    return end - start
+
+
+def _reservation_rows(task) -> int:
+    chunk_index, start, end, first_user_id, num_users, first_exam_id, num_exams, multiplier, offset, \
+        confirmed_ratio, seed, anchor = task
+    rng = _chunk_random(seed, 2, chunk_index)
+    pairs = num_users * num_exams
+
+    lines = []
+    for index in range(start, end):
+        # multiplier 가 pairs 와 서로소이므로 index -> (사용자, 시험) 조합이 겹치지 않는 전단사 함수입니다.
+        pair = (multiplier * index + offset) % pairs
+        lines.append("\t".join((
+            str(first_user_id + pair // num_exams),
+            str(first_exam_id + pair % num_exams),
+            str(rng.randint(1, 10) * 1000),
+            "t" if rng.random() < confirmed_ratio else "f",
+            (anchor - timedelta(seconds=rng.randint(0, 30 * 24 * 3600))).isoformat()
+        )))
+    _copy(_worker_engine, "reservations", RESERVATION_COLUMNS, "\n".join(lines) + "\n")
+    return end - start
+
+
+def _exam_rows(first_exam_id: int, num_exams: int, seed: int, anchor: datetime) -> str:
+    rng = _chunk_random(seed, 0, 0)
+    fake = Faker('ko_KR')
+    fake.seed_instance(seed)
+    start_date = anchor + timedelta(days=1)
+    lines = []
+    for offset in range(num_exams):
+        start_time = (start_date + timedelta(days=rng.randint(0, 30))).replace(
+            hour=rng.randint(12, 22), minute=0, second=0, microsecond=0)
+        end_time = start_time + timedelta(hours=rng.choice([1, 2]))
+        lines.append("\t".join((
+            str(first_exam_id + offset),
+            fake.sentence(nb_words=3, variable_nb_words=True),
+            start_time.isoformat(), end_time.isoformat(),
+            str(rng.randint(20, 49) * 1000)
+        )))
+    return "\n".join(lines) + "\n"
+
+
+def _reserve_ids(connection, table: str, column: str, count: int) -> int:
+    """시퀀스에서 count 개의 연속된 ID 를 미리 확보하고 첫 ID 를 반환합니다."""
+    sequence = connection.execute(text("SELECT pg_get_serial_sequence(:table, :column)"),
+                                  {"table": table, "column": column}).scalar()
+    first_id = connection.execute(text("SELECT nextval(:sequence)"), {"sequence": sequence}).scalar()
+    connection.execute(text("SELECT setval(:sequence, :last_id)"),
+                       {"sequence": sequence, "last_id": first_id + count - 1})
+    return first_id
+
+
+def _coprime_multiplier(rng: random.Random, modulus: int) -> int:
+    multiplier = rng.randrange(modulus // 2, modulus) | 1 if modulus > 2 else 1
+    while math.gcd(multiplier, modulus) != 1:
+        multiplier += 1
+    return multiplier
+
+
+def _run_chunks(pool: Pool, label: str, func, tasks, total: int) -> None:
+    started = time.perf_counter()
+    done = 0
+    for count in pool.imap_unordered(func, tasks):
+        done += count
+        elapsed = time.perf_counter() - started
+        print(f"\r{label} {done:,}/{total:,} ({done / total:.0%}), {done / elapsed:,.0f} 행/초",
+              end="", file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+
+
+def _chunks(total: int, chunk_size: int):
+    return [(index, start, min(start + chunk_size, total))
+            for index, start in enumerate(range(0, total, chunk_size))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대용량 가짜 데이터 생성 (COPY)")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--exams", type=int, default=200)
+    parser.add_argument("--reservations", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--anchor", type=datetime.fromisoformat, default=None,
+                        help="시험 시작/예약 생성 시각의 기준 (ISO 8601, 기본: 실행 시각). 시간대가 없으면 UTC")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=100000, help="워커가 한 번에 COPY 하는 행 수")
+    parser.add_argument("--password", default="password", help="모든 가짜 사용자의 비밀번호")
+    parser.add_argument("--admin-ratio", type=float, default=0.01)
+    parser.add_argument("--confirmed-ratio", type=float, default=0.5)
+    args = parser.parse_args()
+
+    if args.reservations > args.users * args.exams:
+        parser.error("사용자당 시험별 예약은 하나이므로 --reservations 는 --users x --exams 이하여야 합니다.")
+
+    started = time.perf_counter()
+    rng = random.Random(args.seed)
+    anchor = args.anchor or datetime.now(timezone.utc)
+    if anchor.tzinfo is None:
+        anchor = anchor.replace(tzinfo=timezone.utc)
+    password_hash = get_password_hash(args.password)
+    # 대량 적재와 카운터 재계산은 오래 걸리므로 statement_timeout 을 적용하지 않습니다.
+    engine = create_db_engine(statement_timeout_ms=0, poolclass=NullPool)
+
+    with engine.begin() as connection:
+        first_user_id = _reserve_ids(connection, "users", "user_id", args.users)
+        first_exam_id = _reserve_ids(connection, "exam_schedules", "exam_id", args.exams)
+
+    _copy(engine, "exam_schedules", EXAM_COLUMNS, _exam_rows(first_exam_id, args.exams, args.seed, anchor))
+    print(f"시험 {args.exams:,}개 생성", file=sys.stderr)
+
+    pairs = args.users * args.exams
+    multiplier, offset = _coprime_multiplier(rng, pairs), rng.randrange(pairs)
+    with Pool(args.workers, initializer=_init_worker, initargs=(settings.DATABASE_URL,)) as pool:
+        _run_chunks(pool, "사용자", _user_rows, [
+            (index, start, end, first_user_id, password_hash, args.admin_ratio, args.seed)
+            for index, start, end in _chunks(args.users, args.chunk_size)
+        ], args.users)
+        _run_chunks(pool, "예약", _reservation_rows, [
+            (index, start, end, first_user_id, args.users, first_exam_id, args.exams, multiplier, offset,
+             args.confirmed_ratio, args.seed, anchor)
+            for index, start, end in _chunks(args.reservations, args.chunk_size)
+        ], args.reservations)
+
+    db = Session(engine)
+    try:
+        # 확정 인원 카운터와 시험별 집계를 반영하고, 무작위 확정 인원이 정원을 넘은 시험은 정원을 늘려 맞춥니다.
+        rebuild_reserved_participants(db)
+        rebuild_exam_capacity_stats(db)
+        db.execute(text(
+            "UPDATE exam_schedules SET max_capacity = reserved_participants "
+            "WHERE exam_id >= :first_exam_id AND reserved_participants > max_capacity"
+        ), {"first_exam_id": first_exam_id})
+        db.commit()
+    finally:
+        db.close()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE users, exam_schedules, reservations, exam_capacity_stats"))
+
+    print(f"가짜 데이터가 성공적으로 생성되었습니다. ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from src.core.config import settings
+from src.schemas.reservation import AvailableTimeSchema
+from src.utils.etag import make_etag
+
+_available_times_adapter = TypeAdapter(List[AvailableTimeSchema])
+
+
+class AvailableTimesCache:
+    """
+    예약 가능 시간 목록 캐시.
+    목록은 확정 인원이 바뀔 때만 달라지므로, 예약 쓰기 경로에서 올리는 데이터 버전을 키로 보관합니다.
+    조회 구간이 현재 시각 기준으로 움직이기 때문에 버전이 같아도 짧은 TTL 이 지나면 다시 계산합니다.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._version = 0
+        self._entry: Optional[Tuple[int, float, List[AvailableTimeSchema], str]] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def bump(self) -> None:
+        """예약 확정/수정/삭제 후 호출해 캐시된 목록을 무효화합니다."""
+        with self._lock:
+            self._version += 1
+            self._entry = None
+
+    def _fresh_entry(self):
+        entry = self._entry
+        if entry is None or entry[0] != self._version or entry[1] <= time.monotonic():
+            return None
+        return entry
+
+    def current_etag(self) -> Optional[str]:
+        """캐시된 목록이 유효하면 그 ETag 를 반환합니다 (DB 조회 없이 304 응답 판단용)."""
+        with self._lock:
+            entry = self._fresh_entry()
+            return entry[3] if entry else None
+
+    def get(self) -> Optional[Tuple[List[AvailableTimeSchema], str]]:
+        with self._lock:
+            entry = self._fresh_entry()
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[2], entry[3]
+
+    def set(self, version: int, available_times: List[AvailableTimeSchema]) -> str:
+        """계산을 시작할 때 읽은 version 과 함께 저장합니다. 그 사이 버전이 바뀌었으면 저장하지 않습니다."""
+        etag = make_etag(_available_times_adapter.dump_json(available_times))
+        with self._lock:
+            if version == self._version:
+                self._entry = (version, time.monotonic() + self.ttl, available_times, etag)
+        return etag
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entry = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            entry = self._fresh_entry()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "version": self._version,
+                "cached": entry is not None,
+                "etag": entry[3] if entry else None,
+                "ttl_seconds": self.ttl,
+            }
+
+
+available_times_cache = AvailableTimesCache(ttl=settings.AVAILABLE_TIMES_CACHE_TTL_SECONDS)
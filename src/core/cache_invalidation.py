@@ -0,0 +1,142 @@
+import logging
+import os
+import select
+import socket
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+
+from src.core.available_times_cache import available_times_cache
+from src.core.config import settings
+from src.core.principal_cache import principal_cache
+from src.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# DB 트리거(exam_schedules, users)가 pg_notify 로 알리는 채널
+CHANNEL = "cache_invalidation"
+# 알림이 없을 때 LISTEN 연결이 살아 있는지 확인하는 간격(초)
+_HEALTH_CHECK_SECONDS = 30
+
+
+class CacheInvalidationListener:
+    """
+    다른 워커/서버의 쓰기로 바뀐 데이터를 이 프로세스의 캐시에서 지우는 LISTEN 스레드.
+
+    exam_schedules 와 users 의 트리거가 커밋된 변경을 cache_invalidation 채널로 알리면
+    "available_times" 는 예약 가능 시간 캐시를, "principal:<username>" 은 그 사용자의 principal 캐시를 무효화합니다.
+    연결이 끊긴 동안의 알림은 받을 수 없으므로, (다시) 연결할 때마다 두 캐시를 모두 비우고 시작합니다.
+    전용 연결 하나를 쓰며 풀의 커넥션은 사용하지 않습니다.
+    """
+
+    def __init__(self, engine: Engine, retry_seconds: float):
+        self.engine = engine
+        self.retry_seconds = retry_seconds
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._wakeup_reader: Optional[socket.socket] = None
+        self._wakeup_writer: Optional[socket.socket] = None
+        self.connected = False
+        self.connects = 0
+        self.disconnects = 0
+        self.received = 0
+        self.last_received_at: Optional[float] = None
+
+    def start(self) -> None:
+        """워커 프로세스마다 (fork 이후) 호출합니다."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        # stop 에서 select 를 깨우는 소켓. fork 전에 만들면 워커들이 같은 소켓을 공유하므로 여기서 만듭니다.
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._wakeup_writer.send(b"\0")
+        self._thread.join(timeout=5)
+        self._thread = None
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+
+    def handle(self, payload: str) -> None:
+        self.received += 1
+        self.last_received_at = time.time()
+        if payload == "available_times":
+            available_times_cache.bump()
+        elif payload.startswith("principal:"):
+            principal_cache.invalidate(payload[len("principal:"):])
+        else:
+            logger.warning("알 수 없는 캐시 무효화 알림: %s", payload)
+
+    def _connect(self):
+        # 풀을 거치지 않고 엔진 URL 로 바로 연결합니다 (statement_timeout 등 요청용 connect_args 는 적용하지 않음).
+        cargs, cparams = self.engine.dialect.create_connect_args(self.engine.url)
+        connection = self.engine.dialect.connect(*cargs, **cparams)
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        return connection
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                connection = self._connect()
+            except Exception:
+                logger.exception("캐시 무효화 LISTEN 연결 실패, %s초 후 다시 시도합니다.", self.retry_seconds)
+                self._stopped.wait(self.retry_seconds)
+                continue
+
+            # 연결되기 전(또는 끊긴 동안)의 변경은 알림으로 받을 수 없으므로 캐시를 모두 비웁니다.
+            available_times_cache.bump()
+            principal_cache.clear()
+            self.connected = True
+            self.connects += 1
+            try:
+                self._listen(connection)
+            except Exception as error:
+                self.disconnects += 1
+                logger.warning("캐시 무효화 LISTEN 연결이 끊어졌습니다 (%s). %s초 후 다시 연결합니다.",
+                               str(error).strip(), self.retry_seconds)
+                self._stopped.wait(self.retry_seconds)
+            finally:
+                self.connected = False
+                connection.close()
+
+    def _listen(self, connection) -> None:
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([connection, self._wakeup_reader], [], [], _HEALTH_CHECK_SECONDS)
+            if self._wakeup_reader in readable:
+                self._wakeup_reader.recv(16)
+                continue
+            if not readable:
+                # 조용히 끊긴 연결(네트워크 단절 등)을 알아차리기 위한 확인 쿼리
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            connection.poll()
+            while connection.notifies:
+                self.handle(connection.notifies.pop(0).payload)
+
+    def stats(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "channel": CHANNEL,
+            "running": self._thread is not None,
+            "connected": self.connected,
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "received": self.received,
+            "last_received_at": self.last_received_at,
+            "retry_seconds": self.retry_seconds,
+        }
+
+
+cache_invalidation_listener = CacheInvalidationListener(
+    engine=engine,
+    retry_seconds=settings.CACHE_INVALIDATION_RETRY_SECONDS
+)
@@ -1,4 +1,6 @@
 import os
+from typing import List
+
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,10 +16,90 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "grepp-backend")
 
+    # DB 커넥션 풀 (워커 프로세스당). statement_timeout 은 0 이면 사용하지 않습니다.
+    DB_POOL_SIZE: int = os.getenv("DB_POOL_SIZE", 5)
+    DB_MAX_OVERFLOW: int = os.getenv("DB_MAX_OVERFLOW", 10)
+    DB_POOL_TIMEOUT: float = os.getenv("DB_POOL_TIMEOUT", 30)
+    DB_POOL_RECYCLE: int = os.getenv("DB_POOL_RECYCLE", 1800)
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", True)
+    DB_STATEMENT_TIMEOUT_MS: int = os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000)
+
+    # 읽기 전용 복제본 URL (콤마로 구분, 비우면 primary 만 사용)과 장애 복제본을 다시 시도하기까지의 시간(초)
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")
+    DB_REPLICA_RETRY_SECONDS: float = os.getenv("DB_REPLICA_RETRY_SECONDS", 30)
+
     SECRET_KEY: str = os.getenv("SECRET_KEY", "secret")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60)
 
+    # 비밀번호 해시 (bcrypt cost, 전용 프로세스 수, 대기 작업 상한 - 넘으면 503)
+    BCRYPT_ROUNDS: int = os.getenv("BCRYPT_ROUNDS", 12)
+    PASSWORD_HASH_WORKERS: int = os.getenv("PASSWORD_HASH_WORKERS", 2)
+    PASSWORD_HASH_MAX_PENDING: int = os.getenv("PASSWORD_HASH_MAX_PENDING", 16)
+
+    # DB 작업과 동기 의존성을 실행하는 스레드 수 (anyio 기본값 40)
+    THREADPOOL_MAX_WORKERS: int = os.getenv("THREADPOOL_MAX_WORKERS", 40)
+
+    # 인증 사용자(principal) 캐시
+    PRINCIPAL_CACHE_MAXSIZE: int = os.getenv("PRINCIPAL_CACHE_MAXSIZE", 10000)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 60)
+
+    # 예약 가능 시간 목록 캐시 (조회 구간이 현재 시각 기준으로 움직이므로 짧게 유지)
+    AVAILABLE_TIMES_CACHE_TTL_SECONDS: int = os.getenv("AVAILABLE_TIMES_CACHE_TTL_SECONDS", 5)
+
+    # 요청 메트릭 수집 및 /metrics 노출
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", True)
+    # 라우트에 선언한 쿼리 예산(query_budget)을 넘은 요청을 SQL 목록과 함께 경고 로그로 남김
+    QUERY_BUDGET_WARNINGS: bool = os.getenv("QUERY_BUDGET_WARNINGS", False)
+
+    # 일괄 예약 생성 요청 한 번에 허용하는 최대 항목 수
+    BULK_RESERVATION_MAX_ITEMS: int = os.getenv("BULK_RESERVATION_MAX_ITEMS", 100)
+
+    # 예약 일괄 확정 요청 한 번에 지정할 수 있는 최대 예약 ID 수
+    BULK_CONFIRM_MAX_ITEMS: int = os.getenv("BULK_CONFIRM_MAX_ITEMS", 10000)
+
+    # 인기 시험의 예약 폭주 대응: 같은 시험의 예약 생성 요청을 대기열에 모아 묶음 단위로 커밋 (기본 꺼짐)
+    BOOKING_QUEUE_ENABLED: bool = os.getenv("BOOKING_QUEUE_ENABLED", False)
+    # 예약 대기열에서 한 번에 커밋하는 최대 요청 수
+    BOOKING_QUEUE_MAX_BATCH: int = os.getenv("BOOKING_QUEUE_MAX_BATCH", 500)
+    # 예약 대기열에 넣은 요청이 처리되기를 기다리는 최대 시간(초). 넘으면 504 로 응답합니다.
+    BOOKING_QUEUE_TIMEOUT_SECONDS: float = os.getenv("BOOKING_QUEUE_TIMEOUT_SECONDS", 10)
+
+    # 예약 내보내기에서 서버 측 커서로 한 번에 읽어 전송하는 행 수
+    EXPORT_BATCH_SIZE: int = os.getenv("EXPORT_BATCH_SIZE", 1000)
+
+    # Idempotency-Key: 예약 쓰기의 첫 응답을 보관하는 개수와 시간(초), 같은 키의 처리 중 요청을 기다리는 최대 시간(초)
+    IDEMPOTENCY_CACHE_MAXSIZE: int = os.getenv("IDEMPOTENCY_CACHE_MAXSIZE", 10000)
+    IDEMPOTENCY_TTL_SECONDS: int = os.getenv("IDEMPOTENCY_TTL_SECONDS", 86400)
+    IDEMPOTENCY_LOCK_TIMEOUT_SECONDS: int = os.getenv("IDEMPOTENCY_LOCK_TIMEOUT_SECONDS", 30)
+    # 여러 워커/서버가 같은 키를 한 번만 처리하도록 응답을 idempotency_keys 테이블에도 보관
+    IDEMPOTENCY_DATABASE_ENABLED: bool = os.getenv("IDEMPOTENCY_DATABASE_ENABLED", False)
+
+    # 요청 제한 (토큰 버킷, 사용자별이고 토큰이 없으면 IP 별): "메서드 경로=초당 요청 수/최대 연속 요청 수" 를 콤마로 구분
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", True)
+    RATE_LIMITS: str = os.getenv("RATE_LIMITS", "GET /v1/reservations/available-times=5/20,GET /v1/reservations=2/10")
+    # 프로세스 안에 보관하는 최대 버킷 수
+    RATE_LIMIT_MAX_KEYS: int = os.getenv("RATE_LIMIT_MAX_KEYS", 100000)
+    # nginx 가 넣어주는 X-Real-IP 로 IP 를 구분 (앱에 직접 접근할 수 있으면 위조할 수 있으므로 nginx 뒤에서만 켭니다)
+    RATE_LIMIT_TRUST_PROXY_HEADERS: bool = os.getenv("RATE_LIMIT_TRUST_PROXY_HEADERS", False)
+    # 여러 워커/서버가 제한을 공유하도록 버킷을 rate_limit_buckets 테이블에 보관
+    RATE_LIMIT_DATABASE_ENABLED: bool = os.getenv("RATE_LIMIT_DATABASE_ENABLED", False)
+
+    # 운영 서버(gunicorn) 워커 프로세스 수 (0 이면 CPU 코어 수)와 재시작/종료 시 처리 중인 요청을 기다리는 시간(초)
+    WEB_CONCURRENCY: int = os.getenv("WEB_CONCURRENCY", 0)
+    WEB_GRACEFUL_TIMEOUT: int = os.getenv("WEB_GRACEFUL_TIMEOUT", 30)
+    # 다른 워커/서버의 쓰기로 바뀐 데이터를 LISTEN/NOTIFY 로 받아 프로세스 안의 캐시에서 지움 (여러 워커로 실행할 때 필요)
+    CACHE_INVALIDATION_ENABLED: bool = os.getenv("CACHE_INVALIDATION_ENABLED", True)
+    # LISTEN 연결이 끊겼을 때 다시 연결하기까지의 시간(초)
+    CACHE_INVALIDATION_RETRY_SECONDS: float = os.getenv("CACHE_INVALIDATION_RETRY_SECONDS", 5)
+
+    # 기동 직후 백그라운드에서 커넥션 풀, OpenAPI 스키마, 비밀번호 해시 프로세스 등을 미리 준비 (끝나기 전 /health/ready 는 503)
+    STARTUP_WARMUP_ENABLED: bool = os.getenv("STARTUP_WARMUP_ENABLED", True)
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
+    @property
+    def replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
 settings = Settings()
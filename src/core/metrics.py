@@ -0,0 +1,173 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestMetrics:
+    """
+    요청 하나에서 발생한 쿼리 수, DB 시간, 응답 직렬화 시간.
+    쿼리 예산(src.core.query_budget)이 설정된 요청은 budget 과 실행한 SQL 목록(statements)도 가집니다.
+    """
+    __slots__ = ("queries", "db_time", "serialization_time", "budget", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialization_time = 0.0
+        self.budget: Optional[int] = None
+        self.statements: Optional[List[str]] = None
+
+
+# 미들웨어가 요청마다 설정합니다. run_in_threadpool 로 실행되는 코드에도 컨텍스트가 복사되어 같은 객체를 봅니다.
+current_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request_metrics", default=None)
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    프로세스 내 메트릭 저장소. 외부 의존성 없이 Prometheus 텍스트 형식으로 내보냅니다.
+    요청당 lock 을 한 번만 잡도록 요청 단위로 모아서 기록합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._db_time: Dict[Tuple[str, str], Histogram] = {}
+        self._serialization: Dict[Tuple[str, str], Histogram] = {}
+        self._queries: Dict[Tuple[str, str], int] = {}
+
+    def record_request(self, method: str, route: str, status_code: int, duration: float,
+                       request_metrics: RequestMetrics) -> None:
+        key = (method, route)
+        with self._lock:
+            status_key = (method, route, str(status_code))
+            self._requests[status_key] = self._requests.get(status_key, 0) + 1
+            for histograms, value in ((self._latency, duration),
+                                      (self._db_time, request_metrics.db_time),
+                                      (self._serialization, request_metrics.serialization_time)):
+                histogram = histograms.get(key)
+                if histogram is None:
+                    histogram = histograms[key] = Histogram()
+                histogram.observe(value)
+            self._queries[key] = self._queries.get(key, 0) + request_metrics.queries
+
+    def clear(self) -> None:
+        with self._lock:
+            for values in (self._requests, self._latency, self._db_time, self._serialization, self._queries):
+                values.clear()
+
+    def render(self, gauges: Optional[Dict[str, float]] = None) -> str:
+        """
+        이 프로세스의 메트릭만 내보냅니다. gunicorn 워커마다 따로 집계하므로 모든 시계열에 worker(pid) 레이블을 붙여,
+        여러 워커의 값이 한 시계열로 섞이지 않게 합니다 (워커별 값은 sum by 로 합산).
+        """
+        worker = f'worker="{os.getpid()}"'
+        lines = []
+        with self._lock:
+            lines += ["# HELP http_requests_total 처리한 요청 수", "# TYPE http_requests_total counter"]
+            for (method, route, status_code), value in sorted(self._requests.items()):
+                lines.append(f'http_requests_total{{{worker},method="{method}",route="{route}",status="{status_code}"}} '
+                             f'{value}')
+
+            for name, description, histograms in (
+                    ("http_request_duration_seconds", "요청 처리 시간", self._latency),
+                    ("http_request_db_duration_seconds", "요청당 DB 쿼리 실행 시간 합계", self._db_time),
+                    ("http_response_serialization_seconds", "응답 모델 검증/직렬화 시간", self._serialization)):
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+                for (method, route), histogram in sorted(histograms.items()):
+                    labels = f'{worker},method="{method}",route="{route}"'
+                    cumulative = 0
+                    for bound, count in zip(LATENCY_BUCKETS, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            lines += ["# HELP http_request_db_queries_total 요청에서 실행한 쿼리 수",
+                      "# TYPE http_request_db_queries_total counter"]
+            for (method, route), value in sorted(self._queries.items()):
+                lines.append(f'http_request_db_queries_total{{{worker},method="{method}",route="{route}"}} {value}')
+
+        for name, value in (gauges or {}).items():
+            lines += [f"# TYPE {name} gauge", f"{name}{{{worker}}} {value}"]
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started_at"].pop()
+    request_metrics = current_request_metrics.get()
+    if request_metrics is not None:
+        request_metrics.queries += 1
+        request_metrics.db_time += time.perf_counter() - started
+        if request_metrics.statements is not None:
+            request_metrics.statements.append(statement)
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각을 버립니다.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에서 실행되는 쿼리의 수와 시간을 현재 요청에 기록합니다."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+def instrument_response_serialization() -> None:
+    """
+    FastAPI 가 response_model 로 응답을 검증/직렬화하는 시간을 현재 요청에 기록합니다.
+    FastAPI 에 별도의 훅이 없어 fastapi.routing.serialize_response 를 감쌉니다.
+    """
+    from fastapi import routing
+
+    original = routing.serialize_response
+    if getattr(original, "_timed", False):
+        return
+
+    async def serialize_response(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await original(*args, **kwargs)
+        finally:
+            request_metrics = current_request_metrics.get()
+            if request_metrics is not None:
+                request_metrics.serialization_time += time.perf_counter() - started
+
+    serialize_response._timed = True
+    routing.serialize_response = serialize_response
@@ -0,0 +1,117 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from src.core.config import settings
+from src.core.password_worker import hash_in_worker, load_in_worker, verify_in_worker
+
+
+class _OperationStats:
+    def __init__(self):
+        self.count = 0
+        self.rejected = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.hash_time_total = 0.0
+        self.hash_time_max = 0.0
+
+    def record(self, queue_wait: float, hash_time: float) -> None:
+        self.count += 1
+        self.queue_wait_total += queue_wait
+        self.queue_wait_max = max(self.queue_wait_max, queue_wait)
+        self.hash_time_total += hash_time
+        self.hash_time_max = max(self.hash_time_max, hash_time)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "rejected": self.rejected,
+            "queue_wait_avg_ms": round(self.queue_wait_total / self.count * 1000, 1) if self.count else 0.0,
+            "queue_wait_max_ms": round(self.queue_wait_max * 1000, 1),
+            "hash_time_avg_ms": round(self.hash_time_total / self.count * 1000, 1) if self.count else 0.0,
+            "hash_time_max_ms": round(self.hash_time_max * 1000, 1),
+        }
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 전용 프로세스 풀에서 실행합니다.
+    요청 스레드가 수백 ms 동안 CPU(GIL)를 점유하지 않도록 하고, 대기 중인 작업 수가 max_pending 을
+    넘으면 큐에 쌓지 않고 바로 503 을 반환해 가입 요청이 몰려도 다른 API 가 밀리지 않게 합니다.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = 0
+        self._stats = {"hash": _OperationStats(), "verify": _OperationStats()}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # 첫 사용 시 생성합니다. 스레드가 있는 프로세스에서 fork 하지 않도록 spawn 으로 워커를 띄웁니다.
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def _run(self, operation: str, func, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats[operation].rejected += 1
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                                headers={"Retry-After": "1"})
+        try:
+            with self._lock:
+                self._pending += 1
+            submitted = time.time()
+            result, started, hash_time = self._get_executor().submit(func, *args).result()
+            with self._lock:
+                self._stats[operation].record(max(0.0, started - submitted), hash_time)
+            return result
+        finally:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        return self._run("hash", hash_in_worker, password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._run("verify", verify_in_worker, password, hashed_password)
+
+    def warmup(self) -> None:
+        """프로세스를 미리 띄워 둡니다 (spawn 한 프로세스가 모듈을 import 하는 시간을 첫 가입/로그인 요청이 기다리지 않도록)."""
+        executor = self._get_executor()
+        for future in [executor.submit(load_in_worker) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # 해시 프로세스가 종료될 때까지 기다립니다. 기다리지 않으면 gunicorn 워커가 먼저 끝나 해시 프로세스가 남습니다.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+                **{operation: stats.as_dict() for operation, stats in self._stats.items()},
+            }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
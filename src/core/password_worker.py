@@ -0,0 +1,23 @@
+import time
+
+from src.core.security import get_password_hash, password_context, verify_password
+
+# 비밀번호 해시 프로세스(spawn)에서 실행하는 함수들.
+# spawn 한 프로세스는 이 모듈을 import 하므로 fastapi 등 무거운 모듈을 import 하지 않는 파일에 따로 둡니다.
+
+
+def hash_in_worker(password: str):
+    started = time.time()
+    hashed_password = get_password_hash(password)
+    return hashed_password, started, time.time() - started
+
+
+def verify_in_worker(password: str, hashed_password: str):
+    started = time.time()
+    verified = verify_password(password, hashed_password)
+    return verified, started, time.time() - started
+
+
+def load_in_worker() -> None:
+    # passlib(bcrypt)을 미리 불러와 첫 해시/검증 요청이 import 를 기다리지 않게 합니다.
+    password_context()
@@ -0,0 +1,71 @@
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+
+from src.core.config import settings
+from src.schemas.user import CurrentUser
+
+
+class PrincipalCache:
+    """
+    JWT subject(username) -> CurrentUser 캐시.
+    인증된 요청마다 users 테이블을 조회하지 않도록 크기와 TTL 이 제한된 캐시에 보관합니다.
+    get_current_user 는 스레드풀에서 실행되므로 TTLCache 접근은 lock 으로 보호합니다.
+    사용자를 조회하는 동안 무효화된 principal 을 다시 저장하지 않도록, 무효화마다 올리는 version 을 조회 전에 읽어 set 에 넘깁니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def get(self, username: str) -> Optional[CurrentUser]:
+        with self._lock:
+            principal = self._cache.get(username)
+            if principal is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return principal
+
+    def set(self, version: int, principal: CurrentUser) -> None:
+        """조회를 시작할 때 읽은 version 과 함께 저장합니다. 그 사이 무효화가 있었으면 저장하지 않습니다."""
+        with self._lock:
+            if version == self._version:
+                self._cache[principal.username] = principal
+
+    def invalidate(self, username: str) -> None:
+        with self._lock:
+            self._version += 1
+            self._cache.pop(username, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "ttl_seconds": self._cache.ttl,
+            }
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,96 @@
+"""
+엔드포인트별 쿼리 수 예산
+
+N+1 조회나 같은 행을 두 번 읽는 코드가 들어오면 응답 시간이 느려지기 전에 알 수 있도록
+SQLAlchemy 엔진 이벤트로 실행된 SQL 을 세어 예산과 비교합니다.
+
+테스트(tests/test_query_budgets.py)에서는 assert_max_queries 로 엔드포인트 호출 전체의 쿼리 수 상한을 검사합니다.
+
+    with assert_max_queries(3):
+        client.post("/v1/reservations", json={...}, headers=headers)
+
+운영 중에는 라우트에 query_budget 의존성으로 예산을 선언하고, QUERY_BUDGET_WARNINGS 를 켜면
+예산을 넘은 요청을 실행한 SQL 목록과 함께 경고 로그로 남깁니다 (METRICS_ENABLED 필요).
+"""
+import logging
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.config import settings
+from src.core.metrics import RequestMetrics, current_request_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class QueryLog:
+    """count_queries 블록 안에서 실행된 SQL 목록"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+def _format_statements(statements: List[str]) -> str:
+    return "\n".join(f"  {index}. {' '.join(statement.split())}" for index, statement in enumerate(statements, 1))
+
+
+@contextmanager
+def count_queries(engine: Optional[Engine] = None) -> Iterator[QueryLog]:
+    """
+    블록 안에서 엔진으로 실행된 모든 SQL 을 기록합니다.
+    TestClient 는 요청을 다른 스레드에서 처리하므로 컨텍스트 변수 대신 엔진 전체의 이벤트를 사용합니다.
+    """
+    if engine is None:
+        from src.db.session import engine
+
+    query_log = QueryLog()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        query_log.statements.append(statement)
+
+    event.listen(engine, "after_cursor_execute", _record)
+    try:
+        yield query_log
+    finally:
+        event.remove(engine, "after_cursor_execute", _record)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, engine: Optional[Engine] = None) -> Iterator[QueryLog]:
+    """블록 안에서 실행된 SQL 이 max_queries 개를 넘으면 실행한 SQL 목록과 함께 AssertionError 를 발생시킵니다."""
+    with count_queries(engine) as query_log:
+        yield query_log
+    if query_log.count > max_queries:
+        raise AssertionError(f"쿼리 {query_log.count}개 실행 (예산 {max_queries}개):\n"
+                             f"{_format_statements(query_log.statements)}")
+
+
+def query_budget(max_queries: int):
+    """
+    라우트의 쿼리 예산을 선언하는 의존성입니다. 인증(get_current_user)의 캐시 미스 조회도 예산에 포함합니다.
+
+        @router.get("/{reservation_id}", dependencies=[Depends(query_budget(2))])
+    """
+
+    async def _declare_budget():
+        request_metrics = current_request_metrics.get()
+        if settings.QUERY_BUDGET_WARNINGS and request_metrics is not None:
+            request_metrics.budget = max_queries
+            request_metrics.statements = []
+
+    return _declare_budget
+
+
+def check_query_budget(method: str, route: str, request_metrics: RequestMetrics) -> None:
+    """요청이 선언한 예산을 넘었으면 실행한 SQL 목록과 함께 경고를 남깁니다."""
+    if request_metrics.budget is None or request_metrics.queries <= request_metrics.budget:
+        return
+    logger.warning("쿼리 예산 초과: %s %s 에서 쿼리 %d개 실행 (예산 %d개)\n%s",
+                   method, route, request_metrics.queries, request_metrics.budget,
+                   _format_statements(request_metrics.statements or []))
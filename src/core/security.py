@@ -1,21 +1,28 @@
-from passlib.context import CryptContext
-from jose import jwt
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from src.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib(bcrypt)과 jose(cryptography)는 import 가 무거워 처음 사용할 때 불러옵니다.
+# API 프로세스는 비밀번호 해시를 전용 프로세스에서 하므로 passlib 을 불러오지 않고, jose 는 기동 워밍업에서 미리 불러옵니다.
+
+
+@lru_cache(maxsize=None)
+def password_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_context().hash(password)
 
 
 def create_access_token(user_name: str, expires_delta: Optional[timedelta] = None) -> str:
+    from jose import jwt
     to_encode = {"sub": user_name}
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -27,6 +34,8 @@ def create_access_token(user_name: str, expires_delta: Optional[timedelta] = Non
 
 
 def decode_access_token(token: str):
+    """서명과 만료 시간을 검증한 토큰의 payload. 유효하지 않으면 None 을 반환합니다."""
+    from jose import jwt
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import time
+from typing import Dict
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.engine import Engine
+
+from src.core.config import settings
+from src.core.password_hasher import password_hasher
+from src.core.security import decode_access_token
+from src.db.session import engine, replica_router
+
+logger = logging.getLogger(__name__)
+
+
+def _fill_pool(db_engine: Engine, size: int) -> None:
+    # 한꺼번에 size 개를 연결했다가 반납해야 풀에 size 개의 연결이 남습니다.
+    connections = [db_engine.connect() for _ in range(size)]
+    for connection in connections:
+        connection.close()
+
+
+class StartupWarmup:
+    """
+    기동 직후 첫 요청들이 느려지지 않도록 미리 해 두는 작업.
+    lifespan 에서 백그라운드로 실행하며, 끝날 때까지 /health/ready 는 503 을 반환해 로드밸런서가 트래픽을 보내지 않게 합니다.
+    - jwt: 처음 사용할 때 불러오는 jose(cryptography) import
+    - db_pool: primary/복제본 풀에 pool_connections 개씩 미리 연결
+    - openapi: OpenAPI 스키마 생성 (스키마 예시가 커서 첫 /docs, /openapi.json 요청이 느림)
+    - password_hasher: 비밀번호 해시 프로세스 spawn 과 passlib import
+    단계가 실패해도 (예: DB 연결 실패) 기록만 하고 준비 상태가 됩니다. 같은 작업은 요청을 처리할 때 다시 시도됩니다.
+    """
+
+    def __init__(self, enabled: bool, pool_connections: int):
+        self.enabled = enabled
+        self.pool_connections = pool_connections
+        self.ready = not enabled
+        self.durations_ms: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+
+    async def run(self, app: FastAPI) -> None:
+        if not self.enabled:
+            return
+        started = time.perf_counter()
+        steps = {
+            "jwt": lambda: decode_access_token(""),
+            "db_pool": lambda: [_fill_pool(db_engine, self.pool_connections)
+                                for db_engine in [engine, *replica_router.replicas]],
+            "openapi": app.openapi,
+            "password_hasher": password_hasher.warmup,
+        }
+        await asyncio.gather(*[self._run_step(name, step) for name, step in steps.items()])
+        self.durations_ms["total"] = round((time.perf_counter() - started) * 1000, 1)
+        self.ready = True
+
+    async def _run_step(self, name: str, step) -> None:
+        started = time.perf_counter()
+        try:
+            await run_in_threadpool(step)
+        except Exception as error:
+            self.errors[name] = str(error)
+            logger.warning("기동 워밍업 실패 (%s): %s", name, error)
+        self.durations_ms[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "ready": self.ready,
+            "durations_ms": self.durations_ms,
+            "errors": self.errors,
+        }
+
+
+startup_warmup = StartupWarmup(
+    enabled=settings.STARTUP_WARMUP_ENABLED,
+    pool_connections=settings.DB_POOL_SIZE
+)
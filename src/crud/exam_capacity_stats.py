@@ -0,0 +1,138 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models import ExamCapacityStats, ExamSchedule, Reservation
+
+logger = logging.getLogger(__name__)
+
+STAT_COLUMNS = ("confirmed_participants", "pending_participants", "confirmed_reservations", "pending_reservations")
+
+
+def reservation_stats(is_confirmed: Optional[bool], num_participants: int, sign: int = 1) -> Dict[str, int]:
+    """예약 한 건이 집계에 더하는 값. 예약을 빼거나 수정 전 상태를 되돌릴 때는 sign=-1 을 사용합니다."""
+    if is_confirmed:
+        return {"confirmed_participants": sign * num_participants, "pending_participants": 0,
+                "confirmed_reservations": sign, "pending_reservations": 0}
+    return {"confirmed_participants": 0, "pending_participants": sign * num_participants,
+            "confirmed_reservations": 0, "pending_reservations": sign}
+
+
+def add_exam_capacity_stats(db: Session, stats: List[Tuple[int, Dict[str, int]]]) -> None:
+    """
+    (exam_id, 증감) 목록을 시험별로 합쳐 반영합니다. 커밋은 호출자의 트랜잭션에 맡깁니다.
+    여러 시험의 행을 잠글 때 교착 상태가 생기지 않도록 항상 exam_id 순서로 갱신합니다.
+    예약이 늘기만 하는 시험은 upsert 로 행을 만들고, 줄어드는 값이 있는 시험은 (이미 집계된 예약이므로) 있는 행을 UPDATE 합니다.
+    INSERT ... ON CONFLICT 는 충돌 여부와 관계없이 넣으려는 행(음수 증감)에 CHECK 제약을 먼저 검사하기 때문입니다.
+    """
+    totals = defaultdict(lambda: dict.fromkeys(STAT_COLUMNS, 0))
+    for exam_id, delta in stats:
+        for column in STAT_COLUMNS:
+            totals[exam_id][column] += delta[column]
+    increments, decrements = [], []
+    for exam_id, delta in sorted(totals.items()):
+        if any(delta.values()):
+            (increments if min(delta.values()) >= 0 else decrements).append({"exam_id": exam_id, **delta})
+    if increments:
+        statement = insert(ExamCapacityStats).values(increments)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[ExamCapacityStats.exam_id],
+            set_={
+                **{column: getattr(ExamCapacityStats, column) + statement.excluded[column] for column in STAT_COLUMNS},
+                "updated_at": func.now(),
+            }
+        ))
+    for row in decrements:
+        if _apply_exam_capacity_stats(db, row):
+            continue
+        # 집계 행이 없으면 (집계를 만들기 전에 넣은 데이터 등) UPDATE 가 아무 행도 바꾸지 않으므로,
+        # 아직 반영되지 않은 예약 변경 전 상태로 행을 다시 만든 뒤 증감을 적용합니다.
+        logger.warning("시험 %s 의 exam_capacity_stats 행이 없어 예약 기준으로 다시 만듭니다.", row["exam_id"])
+        rebuild_exam_capacity_stats(db, row["exam_id"])
+        if not _apply_exam_capacity_stats(db, row):
+            raise RuntimeError(f"시험 {row['exam_id']} 의 exam_capacity_stats 행을 다시 만들 수 없습니다.")
+
+
+def _apply_exam_capacity_stats(db: Session, row: dict) -> bool:
+    """있는 집계 행에 증감을 더하고, 갱신한 행이 있었는지 반환합니다."""
+    return db.query(ExamCapacityStats).filter(ExamCapacityStats.exam_id == row["exam_id"]).update({
+        **{getattr(ExamCapacityStats, column): getattr(ExamCapacityStats, column) + row[column]
+           for column in STAT_COLUMNS},
+        ExamCapacityStats.updated_at: func.now(),
+    }, synchronize_session=False) > 0
+
+
+def get_exam_capacity_stats(db: Session, exam_id: Optional[int] = None, start_from: Optional[datetime] = None,
+                            start_to: Optional[datetime] = None):
+    """시험별 정원과 확정/미확정 인원 (시작 시간순). 예약을 집계하지 않고 시험마다 집계 행 하나만 읽습니다."""
+    query = db.query(
+        ExamSchedule.exam_id,
+        ExamSchedule.name,
+        ExamSchedule.start_time,
+        ExamSchedule.max_capacity,
+        *[func.coalesce(getattr(ExamCapacityStats, column), 0).label(column) for column in STAT_COLUMNS]
+    ).outerjoin(
+        ExamCapacityStats, ExamCapacityStats.exam_id == ExamSchedule.exam_id
+    )
+    if exam_id is not None:
+        query = query.filter(ExamSchedule.exam_id == exam_id)
+    if start_from is not None:
+        query = query.filter(ExamSchedule.start_time >= start_from)
+    if start_to is not None:
+        query = query.filter(ExamSchedule.start_time < start_to)
+    return query.order_by(ExamSchedule.start_time, ExamSchedule.exam_id).all()
+
+
+def find_exam_capacity_stats_drift(db: Session, exam_id: Optional[int] = None) -> List[dict]:
+    """reservations 테이블을 집계한 값과 저장된 집계가 다른 시험 목록 (exam_id, stored, expected)."""
+    confirmed = Reservation.is_confirmed.is_(True)
+    pending = Reservation.is_confirmed.isnot(True)
+    expected = select(
+        Reservation.exam_id,
+        func.coalesce(func.sum(Reservation.num_participants).filter(confirmed), 0).label("confirmed_participants"),
+        func.coalesce(func.sum(Reservation.num_participants).filter(pending), 0).label("pending_participants"),
+        func.count().filter(confirmed).label("confirmed_reservations"),
+        func.count().filter(pending).label("pending_reservations")
+    ).group_by(Reservation.exam_id)
+    if exam_id is not None:
+        expected = expected.where(Reservation.exam_id == exam_id)
+    expected = expected.subquery("expected")
+
+    stored_columns = [func.coalesce(getattr(ExamCapacityStats, column), 0) for column in STAT_COLUMNS]
+    expected_columns = [func.coalesce(expected.c[column], 0) for column in STAT_COLUMNS]
+    query = db.query(
+        ExamSchedule.exam_id,
+        *[column.label(f"stored_{name}") for column, name in zip(stored_columns, STAT_COLUMNS)],
+        *[column.label(f"expected_{name}") for column, name in zip(expected_columns, STAT_COLUMNS)]
+    ).outerjoin(
+        ExamCapacityStats, ExamCapacityStats.exam_id == ExamSchedule.exam_id
+    ).outerjoin(
+        expected, expected.c.exam_id == ExamSchedule.exam_id
+    ).filter(
+        or_(*[stored != calculated for stored, calculated in zip(stored_columns, expected_columns)])
+    )
+    if exam_id is not None:
+        query = query.filter(ExamSchedule.exam_id == exam_id)
+
+    return [{
+        "exam_id": result.exam_id,
+        "stored": {column: getattr(result, f"stored_{column}") for column in STAT_COLUMNS},
+        "expected": {column: getattr(result, f"expected_{column}") for column in STAT_COLUMNS},
+    } for result in query.order_by(ExamSchedule.exam_id)]
+
+
+def rebuild_exam_capacity_stats(db: Session, exam_id: Optional[int] = None) -> int:
+    """reservations 테이블을 기준으로 집계가 다른 시험만 다시 쓰고, 그 시험 수를 반환합니다. 커밋은 호출자에게 맡깁니다."""
+    drift = find_exam_capacity_stats_drift(db, exam_id)
+    if drift:
+        statement = insert(ExamCapacityStats).values([{"exam_id": row["exam_id"], **row["expected"]} for row in drift])
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[ExamCapacityStats.exam_id],
+            set_={**{column: statement.excluded[column] for column in STAT_COLUMNS}, "updated_at": func.now()}
+        ))
+    return len(drift)
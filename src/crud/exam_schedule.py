@@ -1,4 +1,6 @@
-from sqlalchemy import func, and_
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from src.models import ExamSchedule, Reservation
@@ -9,27 +11,19 @@ def get_exam_schedule(db: Session, exam_id: int):
     return db.query(ExamSchedule).filter(ExamSchedule.exam_id == exam_id).first()
 
 
-def get_exam_schedule_with_available_capacity(db: Session, exam_id: int):
-    result = db.query(
+def _available_capacity_query(db: Session):
+    return db.query(
         ExamSchedule.exam_id,
         ExamSchedule.name,
         ExamSchedule.start_time,
         ExamSchedule.max_capacity,
-        func.coalesce(func.sum(Reservation.num_participants), 0).label('reserved_participants')
-    ).outerjoin(
-        Reservation,
-        and_(
-            Reservation.exam_id == ExamSchedule.exam_id,
-            Reservation.is_confirmed is True
-        )
+        ExamSchedule.reserved_participants
     ).filter(
-        ExamSchedule.exam_id == exam_id
-    ).group_by(
-        ExamSchedule.exam_id
-    ).having(
-        func.coalesce(func.sum(Reservation.num_participants), 0) < ExamSchedule.max_capacity
-    ).first()
+        ExamSchedule.reserved_participants < ExamSchedule.max_capacity
+    )
 
+
+def _to_available_time(result) -> AvailableTimeSchema:
     return AvailableTimeSchema(
         exam_id=result.exam_id,
         name=result.name,
@@ -38,3 +32,59 @@ def get_exam_schedule_with_available_capacity(db: Session, exam_id: int):
         reserved_participants=result.reserved_participants,
         available_capacity=result.max_capacity - result.reserved_participants,
     )
+
+
+def get_exam_schedule_with_available_capacity(db: Session, exam_id: int) -> Optional[AvailableTimeSchema]:
+    result = _available_capacity_query(db).filter(ExamSchedule.exam_id == exam_id).first()
+    if result is None:
+        return None
+    return _to_available_time(result)
+
+
+def get_exam_schedules_with_available_capacity(db: Session, exam_ids: List[int]) -> Dict[int, AvailableTimeSchema]:
+    """여러 시험의 잔여 인원을 한 번의 쿼리로 조회합니다. 정원이 찬 시험은 포함되지 않습니다."""
+    if not exam_ids:
+        return {}
+    results = _available_capacity_query(db).filter(ExamSchedule.exam_id.in_(exam_ids)).all()
+    return {result.exam_id: _to_available_time(result) for result in results}
+
+
+def lock_exam_schedule(db: Session, exam_id: int):
+    """
+    시험 행을 잠그고 정원과 확정 인원을 반환합니다. 시험이 없으면 None.
+    같은 시험의 확정 인원을 바꾸는 트랜잭션만 커밋까지 기다리며, 다른 시험과 일반 조회는 막지 않습니다.
+    FOR NO KEY UPDATE 로 잠그므로 새 예약 INSERT 의 외래 키 확인(FOR KEY SHARE)도 막지 않습니다.
+    일괄 확정(confirm_reservations)과 같이 시험 → 예약 순서로 잠가야 교착 상태가 생기지 않습니다.
+    """
+    return db.query(
+        ExamSchedule.exam_id,
+        ExamSchedule.max_capacity,
+        ExamSchedule.reserved_participants
+    ).filter(
+        ExamSchedule.exam_id == exam_id
+    ).with_for_update(key_share=True).first()
+
+
+def add_reserved_participants(db: Session, exam_id: int, delta: int) -> None:
+    """확정 인원 카운터를 delta 만큼 원자적으로 증감합니다. 커밋은 호출자의 트랜잭션에 맡깁니다."""
+    if delta == 0:
+        return
+    db.query(ExamSchedule).filter(ExamSchedule.exam_id == exam_id).update(
+        {ExamSchedule.reserved_participants: ExamSchedule.reserved_participants + delta},
+        synchronize_session=False
+    )
+
+
+def rebuild_reserved_participants(db: Session, exam_id: Optional[int] = None) -> int:
+    """reservations 테이블을 기준으로 카운터를 다시 계산하고, 값이 달랐던 시험 수를 반환합니다."""
+    confirmed_sum = select(
+        func.coalesce(func.sum(Reservation.num_participants), 0)
+    ).where(
+        Reservation.exam_id == ExamSchedule.exam_id,
+        Reservation.is_confirmed == True
+    ).scalar_subquery()
+
+    query = db.query(ExamSchedule).filter(ExamSchedule.reserved_participants != confirmed_sum)
+    if exam_id is not None:
+        query = query.filter(ExamSchedule.exam_id == exam_id)
+    return query.update({ExamSchedule.reserved_participants: confirmed_sum}, synchronize_session=False)
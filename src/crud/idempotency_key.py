@@ -0,0 +1,60 @@
+from datetime import timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models import IdempotencyKey
+
+
+def claim_idempotency_key(db: Session, key: str, fingerprint: str,
+                          lock_seconds: float) -> Tuple[bool, Optional[IdempotencyKey]]:
+    """
+    키를 처리 중 상태로 등록합니다. 등록했으면 (True, None), 이미 있으면 (False, 기존 행)을 반환하고 바로 커밋합니다.
+    보관 기간이 지난 키와 처리하던 요청이 lock_seconds 안에 끝내지 못한 키는 다시 등록할 수 있습니다.
+    """
+    expires_at = func.now() + timedelta(seconds=lock_seconds)
+    statement = insert(IdempotencyKey).values(key=key, fingerprint=fingerprint, expires_at=expires_at)
+    statement = statement.on_conflict_do_update(
+        index_elements=[IdempotencyKey.key],
+        set_={
+            "fingerprint": statement.excluded.fingerprint,
+            "status_code": None,
+            "headers": None,
+            "body": None,
+            "created_at": func.now(),
+            "expires_at": statement.excluded.expires_at,
+        },
+        where=IdempotencyKey.expires_at < func.now()
+    ).returning(IdempotencyKey.key)
+    claimed = db.execute(statement).first() is not None
+    db.commit()
+    if claimed:
+        return True, None
+    return False, db.query(IdempotencyKey).filter(IdempotencyKey.key == key).first()
+
+
+def save_idempotent_response(db: Session, key: str, status_code: int, headers: List[List[str]], body: bytes,
+                             ttl_seconds: float) -> None:
+    db.query(IdempotencyKey).filter(IdempotencyKey.key == key).update({
+        IdempotencyKey.status_code: status_code,
+        IdempotencyKey.headers: headers,
+        IdempotencyKey.body: body,
+        IdempotencyKey.expires_at: func.now() + timedelta(seconds=ttl_seconds),
+    }, synchronize_session=False)
+    db.commit()
+
+
+def release_idempotency_key(db: Session, key: str) -> None:
+    """응답을 보관하지 않고 끝난 요청(서버 오류 등)의 처리 중 표시를 지워 같은 키로 다시 시도할 수 있게 합니다."""
+    db.query(IdempotencyKey).filter(
+        IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None)
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+def delete_expired_idempotency_keys(db: Session) -> int:
+    deleted = db.query(IdempotencyKey).filter(IdempotencyKey.expires_at < func.now()).delete(synchronize_session=False)
+    db.commit()
+    return deleted
@@ -0,0 +1,41 @@
+from datetime import timedelta
+from typing import Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models import RateLimitBucket
+
+
+def take_rate_limit_token(db: Session, key: str, rate: float, burst: int) -> Tuple[bool, float]:
+    """
+    버킷을 마지막 요청 이후 흐른 시간만큼 채우고 토큰 하나를 꺼냅니다. (꺼냈는지, 남은 토큰 수)를 반환하고 바로 커밋합니다.
+    한 번의 upsert 로 처리하므로 여러 워커가 같은 키로 동시에 요청해도 토큰을 나눠 쓰지 않습니다.
+    """
+    # now() 는 트랜잭션 시작 시각이므로 실제 시각(clock_timestamp)으로 채웁니다.
+    # DB 서버 시계가 뒤로 조정되어도 흐른 시간이 음수가 되지 않도록 0 으로 자르고, 기록한 시각도 되돌리지 않습니다.
+    elapsed = func.greatest(0, func.extract("epoch", func.clock_timestamp() - RateLimitBucket.updated_at))
+    refilled = func.least(burst, RateLimitBucket.tokens + elapsed * rate)
+    statement = insert(RateLimitBucket).values(key=key, tokens=burst - 1, allowed=True,
+                                               updated_at=func.clock_timestamp())
+    statement = statement.on_conflict_do_update(
+        index_elements=[RateLimitBucket.key],
+        set_={
+            "allowed": refilled >= 1,
+            "tokens": case((refilled >= 1, refilled - 1), else_=refilled),
+            "updated_at": func.greatest(RateLimitBucket.updated_at, func.clock_timestamp()),
+        }
+    ).returning(RateLimitBucket.allowed, RateLimitBucket.tokens)
+    result = db.execute(statement).one()
+    db.commit()
+    return result.allowed, result.tokens
+
+
+def delete_idle_rate_limit_buckets(db: Session, idle_seconds: float) -> int:
+    """idle_seconds 동안 요청이 없었던 (이미 가득 찬) 버킷을 지웁니다."""
+    deleted = db.query(RateLimitBucket).filter(
+        RateLimitBucket.updated_at < func.now() - timedelta(seconds=idle_seconds)
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
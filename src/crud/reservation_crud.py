@@ -1,8 +1,13 @@
 # src/crud/reservation_crud.py
-from typing import Optional
+from typing import List, Optional, Tuple
 
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from src.models.exam_capacity_stats import ExamCapacityStats
+from src.models.exam_schedule import ExamSchedule
 from src.models.reservation import Reservation
 from src.schemas.reservation import ReservationCreate, ReservationUpdate
 
@@ -11,35 +16,174 @@ def get_reservation(db: Session, reservation_id: int) -> Optional[Reservation]:
     return db.query(Reservation).filter(Reservation.reservation_id == reservation_id).first()
 
 
-def get_user_reservation(db, exam_id, user_id):
-    return db.query(Reservation.reservation_id).filter(
-        (Reservation.exam_id == exam_id) & (Reservation.user_id == user_id)).first()
+def get_reservation_owner(db: Session, reservation_id: int):
+    """잠그지 않고 예약의 (user_id, exam_id) 만 조회합니다. 예약이 없으면 None."""
+    return db.query(Reservation.user_id, Reservation.exam_id).filter(
+        Reservation.reservation_id == reservation_id).first()
+
+
+def get_reservation_for_update(db: Session, reservation_id: int) -> Optional[Reservation]:
+    """예약 행을 잠그고(FOR UPDATE) 조회합니다. 동시에 같은 예약을 수정/확정하는 트랜잭션은 커밋까지 기다립니다."""
+    return db.query(Reservation).filter(Reservation.reservation_id == reservation_id).with_for_update().first()
+
+
+DUPLICATE_RESERVATION_CONSTRAINT = "uq_reservations_user_id_exam_id"
+
+
+def is_duplicate_reservation_error(error: IntegrityError) -> bool:
+    """(user_id, exam_id) 유니크 제약 위반인지 확인합니다."""
+    diag = getattr(error.orig, "diag", None)
+    return getattr(diag, "constraint_name", None) == DUPLICATE_RESERVATION_CONSTRAINT
+
+
+def _duplicate_reservations_query():
+    """(user_id, exam_id) 가 같은 예약 중 남길 예약(확정된 예약, 그 다음 먼저 생성된 예약)을 제외한 나머지"""
+    ranked = select(
+        Reservation.reservation_id,
+        Reservation.user_id,
+        Reservation.exam_id,
+        func.row_number().over(
+            partition_by=(Reservation.user_id, Reservation.exam_id),
+            order_by=(Reservation.is_confirmed.desc().nulls_last(), Reservation.reservation_id)
+        ).label("rank")
+    ).subquery()
+    return select(ranked.c.reservation_id, ranked.c.user_id, ranked.c.exam_id).where(ranked.c.rank > 1)
+
+
+def find_duplicate_reservations(db: Session) -> list:
+    """지울 중복 예약의 (reservation_id, user_id, exam_id) 목록"""
+    duplicates = _duplicate_reservations_query().subquery()
+    return db.execute(select(duplicates).order_by(duplicates.c.user_id, duplicates.c.exam_id,
+                                                  duplicates.c.reservation_id)).all()
+
+
+def delete_duplicate_reservations(db: Session) -> int:
+    """
+    (user_id, exam_id) 가 같은 예약을 한 건만 남기고 삭제하고, 삭제한 건수를 반환합니다. 커밋은 호출자에게 맡깁니다.
+    확정된 예약이 지워질 수 있으므로 호출자가 확정 인원 카운터를 다시 계산해야 합니다.
+    """
+    duplicate_ids = select(_duplicate_reservations_query().subquery().c.reservation_id)
+    return db.query(Reservation).filter(
+        Reservation.reservation_id.in_(duplicate_ids)
+    ).delete(synchronize_session=False)
 
 
 def create_reservation(db: Session, reservation: ReservationCreate, user_id: int) -> Optional[Reservation]:
-    db_reservation = Reservation(**reservation.dict(), user_id=user_id)
+    """예약을 INSERT(flush) 합니다. 커밋은 호출자의 트랜잭션에 맡깁니다."""
+    # updated_at 을 비워두면 INSERT 후 값을 다시 조회하므로 명시합니다.
+    db_reservation = Reservation(**reservation.dict(), user_id=user_id, updated_at=None)
     db.add(db_reservation)
+    db.flush()
+    return db_reservation
+
+
+def bulk_create_reservations(db: Session, items: List[Tuple[int, ReservationCreate]]) -> list:
+    """(user_id, 예약 요청) 목록을 한 번의 multi-row INSERT ... RETURNING 으로 생성합니다.
+
+    이미 존재하는 (user_id, exam_id) 조합은 ON CONFLICT DO NOTHING 으로 건너뛰며 반환 목록에서 빠집니다.
+    반환 값은 생성된 행(Row)이고, 커밋은 호출자의 트랜잭션에 맡깁니다.
+    """
+    if not items:
+        return []
+    statement = insert(Reservation).values([
+        {**reservation.dict(), "user_id": user_id} for user_id, reservation in items
+    ]).on_conflict_do_nothing(
+        constraint=DUPLICATE_RESERVATION_CONSTRAINT
+    ).returning(*Reservation.__table__.columns)
+    return db.execute(statement).all()
+
+
+def confirm_reservations(db: Session, reservation_ids: Optional[List[int]] = None,
+                         exam_id: Optional[int] = None) -> List[int]:
+    """미확정 예약을 선착순(created_at, reservation_id)으로 잔여 인원 안에서 한 번의 문장으로 확정합니다.
+
+    시험별 누적 인원이 잔여 인원을 넘는 지점부터는 (더 작은 예약이라도) 확정하지 않습니다.
+    확정 인원 카운터와 시험별 집계(exam_capacity_stats)도 같은 문장에서 갱신하며, 확정된 예약 ID 목록을 반환합니다. 커밋은 호출자에게 맡깁니다.
+    """
+    pending = Reservation.is_confirmed.isnot(True)
+    candidates = select(
+        Reservation.reservation_id,
+        Reservation.exam_id,
+        func.sum(Reservation.num_participants).over(
+            partition_by=Reservation.exam_id,
+            order_by=(Reservation.created_at, Reservation.reservation_id)
+        ).label("running_total")
+    ).where(pending)
+    if reservation_ids is not None:
+        candidates = candidates.where(Reservation.reservation_id.in_(reservation_ids))
+    if exam_id is not None:
+        candidates = candidates.where(Reservation.exam_id == exam_id)
+    candidates = candidates.cte("candidates")
+
+    # 동시에 실행되는 확정 요청과 잔여 인원을 나눠 쓰지 않도록 시험 행을 잠급니다.
+    # (FOR NO KEY UPDATE: 같은 시험에 새 예약을 INSERT 하는 요청의 외래 키 확인은 막지 않습니다)
+    exams = select(
+        ExamSchedule.exam_id,
+        (ExamSchedule.max_capacity - ExamSchedule.reserved_participants).label("remaining")
+    ).where(
+        ExamSchedule.exam_id.in_(select(candidates.c.exam_id))
+    ).with_for_update(key_share=True).cte("exams")
+
+    confirmed = update(Reservation).where(
+        Reservation.reservation_id == candidates.c.reservation_id,
+        candidates.c.exam_id == exams.c.exam_id,
+        candidates.c.running_total <= exams.c.remaining,
+        pending
+    ).values(is_confirmed=True).returning(
+        Reservation.reservation_id, Reservation.exam_id, Reservation.num_participants
+    ).cte("confirmed")
+
+    totals = select(
+        confirmed.c.exam_id,
+        func.sum(confirmed.c.num_participants).label("total"),
+        func.count().label("reservations")
+    ).group_by(confirmed.c.exam_id).subquery("totals")
+    counters = update(ExamSchedule).where(
+        ExamSchedule.exam_id == totals.c.exam_id
+    ).values(
+        reserved_participants=ExamSchedule.reserved_participants + totals.c.total
+    ).cte("counters")
+    # 확정된 만큼 미확정 인원/건수를 확정으로 옮깁니다.
+    stats = update(ExamCapacityStats).where(
+        ExamCapacityStats.exam_id == totals.c.exam_id
+    ).values(
+        confirmed_participants=ExamCapacityStats.confirmed_participants + totals.c.total,
+        pending_participants=ExamCapacityStats.pending_participants - totals.c.total,
+        confirmed_reservations=ExamCapacityStats.confirmed_reservations + totals.c.reservations,
+        pending_reservations=ExamCapacityStats.pending_reservations - totals.c.reservations,
+        updated_at=func.now()
+    ).cte("stats")
+
+    statement = select(confirmed.c.reservation_id).order_by(confirmed.c.reservation_id).add_cte(counters, stats)
+    return list(db.execute(statement).scalars())
+
+
+def get_reservation_states(db: Session, reservation_ids: List[int]) -> dict:
+    """예약 ID -> 확정 여부 (존재하지 않는 예약은 포함되지 않습니다)"""
+    if not reservation_ids:
+        return {}
+    results = db.query(Reservation.reservation_id, Reservation.is_confirmed).filter(
+        Reservation.reservation_id.in_(reservation_ids)).all()
+    return {result.reservation_id: result.is_confirmed for result in results}
+
+
+def count_pending_reservations(db: Session, exam_id: int) -> int:
+    return db.query(func.count(Reservation.reservation_id)).filter(
+        Reservation.exam_id == exam_id, Reservation.is_confirmed.isnot(True)
+    ).scalar()
+
+
+def update_reservation(db: Session, db_reservation: Reservation, request: ReservationUpdate) -> Reservation:
+    """호출자가 이미 조회한 예약을 수정합니다 (같은 행을 다시 조회하지 않습니다)."""
+    update_data = request.dict(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_reservation, key, value)
     db.commit()
-    db.refresh(db_reservation)
     return db_reservation
 
 
-def update_reservation(db: Session, reservation_id: int, request: ReservationUpdate) -> Optional[Reservation]:
-    db_reservation = get_reservation(db, reservation_id)
-    if db_reservation:
-        update_data = request.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(db_reservation, key, value)
-        db.commit()
-        db.refresh(db_reservation)
-        return db_reservation
-    return None
-
-
-def delete_reservation(db: Session, reservation_id: int) -> bool:
-    db_reservation = get_reservation(db, reservation_id)
-    if db_reservation:
-        db.delete(db_reservation)
-        db.commit()
-        return True
-    return False
+def delete_reservation(db: Session, db_reservation: Reservation) -> bool:
+    """호출자가 이미 조회한 예약을 삭제합니다 (같은 행을 다시 조회하지 않습니다)."""
+    db.delete(db_reservation)
+    db.commit()
+    return True
@@ -1,7 +1,8 @@
+import json
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 
-from sqlalchemy import func, and_
+from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
 from src.models import ExamSchedule, Reservation, User
@@ -22,7 +23,7 @@ def get_user_reservation_join(query, user_id):
     return query
 
 
-def get_user_reservations(db: Session, user_id: int, page: int = 0, limit: int = 100) -> List[Reservation]:
+def get_user_reservations_query(db: Session, user_id: Optional[int]):
     query = (db.query(
         Reservation.reservation_id,
         Reservation.exam_id,
@@ -32,16 +33,78 @@ def get_user_reservations(db: Session, user_id: int, page: int = 0, limit: int =
     ))
 
     query = get_user_reservation_join(query, user_id)
-    query = query.order_by(Reservation.reservation_id.desc())
+    return query.order_by(Reservation.reservation_id.desc())
+
+
+def get_reservation_with_details(db: Session, reservation_id: int):
+    """시험 이름과 사용자 정보를 포함한 단일 예약 조회"""
+    return get_user_reservations_query(db, None).filter(Reservation.reservation_id == reservation_id).first()
+
+
+def get_user_reservations(db: Session, user_id: int, page: int = 0, limit: int = 100) -> List[Reservation]:
+    query = get_user_reservations_query(db, user_id)
     offset = (page - 1) * limit
     query_result = query.offset(offset).limit(limit).all()
     return query_result
 
 
-def get_user_reservations_count(db: Session, user_id: int) -> int:
-    query = db.query(Reservation.exam_id)
-    query = get_user_reservation_join(query, user_id)
-    return query.count()
+def get_user_reservations_after(db: Session, user_id: Optional[int], after_id: Optional[int], limit: int = 100):
+    """
+    keyset 페이지네이션: reservation_id 가 after_id 보다 작은 예약을 최신순으로 limit 개 조회합니다.
+    다음 페이지 존재 여부를 알 수 있도록 limit + 1 개를 읽습니다.
+    """
+    query = get_user_reservations_query(db, user_id)
+    if after_id is not None:
+        query = query.filter(Reservation.reservation_id < after_id)
+    return query.limit(limit + 1).all()
+
+
+def _user_reservations_count_query(db: Session, user_id: Optional[int]):
+    # 시험/사용자 조인은 외래 키에 대한 LEFT JOIN 이라 건수에 영향이 없으므로 예약 테이블만 셉니다.
+    query = db.query(func.count()).select_from(Reservation)
+    if user_id is not None:
+        query = query.filter(Reservation.user_id == user_id)
+    return query
+
+
+def get_user_reservations_count(db: Session, user_id: Optional[int]) -> int:
+    return _user_reservations_count_query(db, user_id).scalar()
+
+
+def get_user_reservations_with_total(db: Session, user_id: Optional[int], page: int = 1,
+                                     limit: int = 100) -> Tuple[list, int]:
+    """
+    한 페이지와 전체 건수를 한 번의 문장으로 조회합니다.
+    전체 건수는 조인 없는 스칼라 서브쿼리라 InitPlan 으로 한 번만 계산되고, 목록은 인덱스 순서대로 limit 개만 읽습니다.
+    (COUNT(*) OVER () 는 LIMIT 전에 조인된 모든 행을 만들어야 해서 전체 조회에서 느립니다)
+    """
+    total_count = _user_reservations_count_query(db, user_id).correlate(None).scalar_subquery().label("total_count")
+    offset = (page - 1) * limit
+    query_result = get_user_reservations_query(db, user_id).add_columns(total_count).offset(offset).limit(limit).all()
+    if query_result:
+        return query_result, query_result[0].total_count
+    # 빈 페이지는 건수를 함께 받을 행이 없으므로, 마지막 페이지 이후를 요청한 경우에만 따로 셉니다.
+    return query_result, 0 if offset <= 0 else get_user_reservations_count(db, user_id)
+
+
+def estimate_user_reservations_count(db: Session, user_id: Optional[int]) -> Optional[int]:
+    """
+    플래너 통계 기반 예상 건수. 전체 조회는 pg_class.reltuples, 사용자별 조회는 EXPLAIN 의 예상 행 수를 사용합니다.
+    통계가 아직 없으면 None 을 반환합니다.
+    """
+    if user_id is None:
+        reltuples = db.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = 'reservations'::regclass")
+        ).scalar()
+        return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+
+    plan = db.execute(
+        text("EXPLAIN (FORMAT JSON) SELECT 1 FROM reservations WHERE user_id = :user_id"),
+        {"user_id": user_id}
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
 
 
 def get_available_times(db: Session, start_date: datetime, end_date: datetime):
@@ -50,20 +113,11 @@ def get_available_times(db: Session, start_date: datetime, end_date: datetime):
         ExamSchedule.name,
         ExamSchedule.start_time,
         ExamSchedule.max_capacity,
-        func.coalesce(func.sum(Reservation.num_participants), 0).label('reserved_participants')
-    ).outerjoin(
-        Reservation,
-        and_(
-            Reservation.exam_id == ExamSchedule.exam_id,
-            Reservation.is_confirmed == True
-        )
+        ExamSchedule.reserved_participants
     ).filter(
         ExamSchedule.start_time > start_date,
-        ExamSchedule.start_time <= end_date
-    ).group_by(
-        ExamSchedule.exam_id
-    ).having(
-        func.coalesce(func.sum(Reservation.num_participants), 0) < ExamSchedule.max_capacity
+        ExamSchedule.start_time <= end_date,
+        ExamSchedule.reserved_participants < ExamSchedule.max_capacity
     ).order_by(
         ExamSchedule.start_time
     ).all())
@@ -76,3 +130,36 @@ def get_available_times(db: Session, start_date: datetime, end_date: datetime):
         reserved_participants=result.reserved_participants,
         available_capacity=result.max_capacity - result.reserved_participants,
     ) for result in query_result]
+
+
+def get_reservations_export_query(db: Session, exam_id: Optional[int] = None, is_confirmed: Optional[bool] = None,
+                                  created_from: Optional[datetime] = None, created_to: Optional[datetime] = None):
+    """
+    내보내기용 예약 조회 (예약 ID 순). created_from 이상, created_to 미만의 생성 시각으로 거릅니다.
+    결과가 매우 클 수 있으므로 호출자는 yield_per 로 서버 측 커서에서 나눠 읽어야 합니다.
+    """
+    query = db.query(
+        Reservation.reservation_id,
+        Reservation.exam_id,
+        ExamSchedule.name.label("exam_name"),
+        Reservation.user_id,
+        User.username,
+        User.email,
+        Reservation.num_participants,
+        Reservation.is_confirmed,
+        Reservation.created_at,
+        Reservation.updated_at
+    ).join(
+        ExamSchedule, Reservation.exam_id == ExamSchedule.exam_id
+    ).join(
+        User, Reservation.user_id == User.user_id
+    )
+    if exam_id is not None:
+        query = query.filter(Reservation.exam_id == exam_id)
+    if is_confirmed is not None:
+        query = query.filter(Reservation.is_confirmed.is_(True) if is_confirmed else Reservation.is_confirmed.isnot(True))
+    if created_from is not None:
+        query = query.filter(Reservation.created_at >= created_from)
+    if created_to is not None:
+        query = query.filter(Reservation.created_at < created_to)
+    return query.order_by(Reservation.reservation_id)
@@ -25,7 +25,6 @@ def create_user(db: Session, user: UserCreate):
     db_user = User(email=user.email, username=user.username, hashed_password=hashed_password)
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
@@ -35,7 +34,6 @@ def update_user(db: Session, user_id: int, user_data: dict):
         for key, value in user_data.items():
             setattr(db_user, key, value)
         db.commit()
-        db.refresh(db_user)
     return db_user
 
 
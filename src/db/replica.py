@@ -0,0 +1,91 @@
+import functools
+import itertools
+import threading
+import time
+from typing import List
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 세션이 사용할 엔진을 고릅니다.
+    복제본(replica)을 순서대로(round-robin) 돌아가며 사용하고, 연결이 끊기거나 연결할 수 없었던 복제본은
+    retry_seconds 동안 제외합니다. 처음 사용할 때와 제외 기간이 끝났을 때는 커넥션을 한 번 받아 보고 나서 사용하므로
+    내려간 복제본으로 요청이 가는 것은 사용 중에 연결이 끊긴 경우뿐입니다. 사용할 수 있는 복제본이 없으면 primary 를 사용합니다.
+    반환하는 엔진은 커넥션 풀을 공유하는 읽기 전용(READ ONLY 트랜잭션) 엔진이라 primary 로 돌아가도 쓰기는 실패합니다.
+    """
+
+    def __init__(self, primary: Engine, replicas: List[Engine], retry_seconds: float):
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_seconds = retry_seconds
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+        self._down_until = {id(replica): 0.0 for replica in replicas}
+        self._verified = set()
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+        self.failures = 0
+        self._read_only = {id(engine): engine.execution_options(postgresql_readonly=True)
+                           for engine in [primary, *replicas]}
+        for replica in replicas:
+            event.listen(replica, "handle_error", functools.partial(self._on_error, replica))
+
+    def choose(self) -> Engine:
+        now = time.monotonic()
+        start = next(self._next)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if self._available(replica, now):
+                with self._lock:
+                    self.replica_reads += 1
+                return self._read_only[id(replica)]
+        if self.replicas:
+            with self._lock:
+                self.primary_fallbacks += 1
+        return self._read_only[id(self.primary)]
+
+    def _available(self, replica: Engine, now: float) -> bool:
+        if self._down_until[id(replica)] > now:
+            return False
+        if id(replica) in self._verified:
+            return True
+        try:
+            with replica.connect():
+                pass
+        except exc.DBAPIError:
+            # handle_error 리스너가 이미 제외 처리했습니다.
+            return False
+        self._verified.add(id(replica))
+        return True
+
+    def mark_down(self, replica: Engine) -> None:
+        with self._lock:
+            self.failures += 1
+            self._verified.discard(id(replica))
+            self._down_until[id(replica)] = time.monotonic() + self.retry_seconds
+
+    def _on_error(self, replica: Engine, exception_context) -> None:
+        # 연결 실패(connection 이 없는 상태의 오류)와 연결 끊김만 장애로 봅니다. 쿼리 오류는 복제본 문제가 아닙니다.
+        if exception_context.is_disconnect or exception_context.connection is None:
+            self.mark_down(replica)
+
+    def _replica(self, engine: Engine) -> dict:
+        now = time.monotonic()
+        down_for = self._down_until[id(engine)] - now
+        return {
+            "url": engine.url.render_as_string(hide_password=True),
+            "healthy": down_for <= 0,
+            "retry_in_seconds": round(max(down_for, 0.0), 1),
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "replicas": [self._replica(replica) for replica in self.replicas],
+                "replica_reads": self.replica_reads,
+                "primary_fallbacks": self.primary_fallbacks,
+                "failures": self.failures,
+            }
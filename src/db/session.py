@@ -1,17 +1,69 @@
+from typing import Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
+
 from src.core.config import settings
+from src.db.pool import InstrumentedQueuePool
+from src.db.replica import ReplicaRouter
+
+
+def create_db_engine(database_url: Optional[str] = None, statement_timeout_ms: Optional[int] = None,
+                     **kwargs) -> Engine:
+    """
+    Settings 의 풀 설정으로 엔진을 생성합니다. 앱, CLI, 벤치마크 모두 이 함수로 엔진을 만듭니다.
+    poolclass 를 지정하면 (예: 워커 프로세스의 NullPool) 풀 크기 관련 설정은 적용하지 않습니다.
+    """
+    if statement_timeout_ms is None:
+        statement_timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+    connect_args = {}
+    if statement_timeout_ms:
+        connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING, "connect_args": connect_args}
+    if "poolclass" not in kwargs:
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    options.update(kwargs)
+    return create_engine(database_url or settings.DATABASE_URL, **options)
 
-engine = create_engine(settings.DATABASE_URL)
+
+engine = create_db_engine()
+# 세션은 요청 단위로 쓰고 버리므로, 커밋 후 응답을 만들 때 객체를 다시 SELECT 하지 않도록 만료시키지 않습니다.
+# (예약의 서버 기본값/onupdate 컬럼은 모델의 eager_defaults 로 INSERT/UPDATE ... RETURNING 에서 받아옵니다)
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine
 )
 
+# 읽기 전용 복제본. 복제 지연을 감수할 수 있는 조회(목록, 단건 조회, 내보내기)만 사용합니다.
+# 예약 가능 시간은 조회 결과를 쓰기 경로가 올린 캐시 버전으로 보관하므로 primary 에서 조회합니다.
+replica_router = ReplicaRouter(
+    primary=engine,
+    replicas=[create_db_engine(url) for url in settings.replica_urls],
+    retry_seconds=settings.DB_REPLICA_RETRY_SECONDS
+)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_read_db():
+    """복제본(없거나 모두 장애면 primary)에 연결되는 읽기 전용 세션. 커넥션은 첫 쿼리에서 가져옵니다."""
+    db = SessionLocal(bind=replica_router.choose())
+    try:
+        yield db
+    finally:
+        db.close()
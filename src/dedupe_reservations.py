@@ -0,0 +1,38 @@
+import argparse
+
+from src.crud import exam_capacity_stats as exam_capacity_stats_crud
+from src.crud import exam_schedule as exam_schedule_crud
+from src.crud import reservation_crud
+from src.db.session import SessionLocal
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="(user_id, exam_id) 가 같은 중복 예약을 한 건(확정된 예약, 그 다음 먼저 생성된 예약)만 남기고 삭제합니다.")
+    parser.add_argument("--dry-run", action="store_true", help="삭제할 예약만 출력하고 반영하지 않음")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        duplicates = reservation_crud.find_duplicate_reservations(db)
+        for row in duplicates:
+            print(f"사용자 {row.user_id} / 시험 {row.exam_id}: 예약 {row.reservation_id}")
+        if args.dry_run:
+            print(f"삭제할 중복 예약: {len(duplicates)}건 (dry-run, 반영하지 않음)")
+            return
+        deleted = reservation_crud.delete_duplicate_reservations(db)
+        # 삭제한 예약 중 확정된 예약이 있을 수 있으므로 확정 인원 카운터와 시험별 집계를 다시 계산합니다.
+        drifted = exam_schedule_crud.rebuild_reserved_participants(db)
+        stats_drifted = exam_capacity_stats_crud.rebuild_exam_capacity_stats(db)
+        db.commit()
+        print(f"중복 예약 {deleted}건을 삭제했습니다. 다시 계산한 시험: 카운터 {drifted}건, 집계 {stats_drifted}건")
+    except Exception as e:
+        db.rollback()
+        print(f"중복 예약 정리 중 오류 발생: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
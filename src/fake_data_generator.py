@@ -2,18 +2,13 @@ import random
 from datetime import datetime, timedelta
 
 from faker import Faker
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from src.core.config import settings
 from src.core.security import get_password_hash
+from src.crud.exam_capacity_stats import rebuild_exam_capacity_stats
+from src.crud.exam_schedule import rebuild_reserved_participants
+from src.db.session import SessionLocal
 from src.models import User, ExamSchedule, Reservation
 
-# 데이터베이스 연결 설정
-DATABASE_URL = settings.DATABASE_URL
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
 fake = Faker('ko_KR')  # 한국어 데이터 생성
 
 def create_fake_users(num_users=10):
@@ -48,10 +43,10 @@ def create_fake_exam_schedules(num_schedules=20):
     return schedules
 
 def create_fake_reservations(users, exam_schedules, num_reservations=200):
+    # 사용자당 시험별 예약은 하나만 가능하므로 (사용자, 시험) 조합을 중복 없이 뽑습니다.
+    pairs = [(user, exam_schedule) for user in users for exam_schedule in exam_schedules]
     reservations = []
-    for _ in range(num_reservations):
-        user = random.choice(users)
-        exam_schedule = random.choice(exam_schedules)
+    for user, exam_schedule in random.sample(pairs, min(num_reservations, len(pairs))):
         reservation = Reservation(
             user_id=user.user_id,
             exam_id=exam_schedule.exam_id,
@@ -79,6 +74,11 @@ def main():
         db.add_all(reservations)
         db.commit()
 
+        # 가짜 예약을 시험별 확정 인원 카운터와 집계에 반영
+        rebuild_reserved_participants(db)
+        rebuild_exam_capacity_stats(db)
+        db.commit()
+
         print("가짜 데이터가 성공적으로 생성되었습니다.")
     except Exception as e:
         print(f"데이터 생성 중 오류 발생: {e}")
@@ -1,8 +1,56 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from src.api.error_handler import exception_handler
-from src.api.v1.router import router as api_router
+from src.api.health import router as health_router
+from src.api.internal import router as internal_router
+from src.api.metrics import router as metrics_router
+from src.api.middleware import IdempotencyMiddleware, MetricsMiddleware, RateLimitMiddleware
+from src.api.v1.router import include_routers
+from src.core.cache_invalidation import cache_invalidation_listener
+from src.core.config import settings
+from src.core.metrics import instrument_engine, instrument_response_serialization
+from src.core.password_hasher import password_hasher
+from src.core.warmup import startup_warmup
+from src.db.session import engine, replica_router
+from src.services.idempotency import idempotency_store
+from src.services.rate_limiter import rate_limiter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DB 작업(run_in_threadpool)과 동기 의존성을 실행하는 스레드풀 크기
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+    # 워커 프로세스마다 LISTEN 스레드를 띄웁니다 (gunicorn preload 에서도 fork 이후에 실행됨)
+    if settings.CACHE_INVALIDATION_ENABLED:
+        cache_invalidation_listener.start()
+    # 요청은 바로 받기 시작하고, 워밍업이 끝나면 /health/ready 가 200 을 반환합니다.
+    warmup = asyncio.create_task(startup_warmup.run(app))
+    yield
+    warmup.cancel()
+    cache_invalidation_listener.stop()
+    password_hasher.shutdown()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_exception_handler(HTTPException, exception_handler)
-app.include_router(api_router, prefix="/v1")
+include_routers(app, prefix="/v1")
+app.include_router(health_router)
+app.include_router(internal_router, prefix="/internal", include_in_schema=False)
+# 예약 쓰기 재시도(Idempotency-Key)는 라우트와 인증을 실행하지 않고 보관한 응답으로 답합니다.
+app.add_middleware(IdempotencyMiddleware, store=idempotency_store, path_prefix="/v1/reservations")
+if settings.RATE_LIMIT_ENABLED:
+    # 나중에 추가한 미들웨어가 바깥에서 먼저 실행되므로, 제한을 넘은 요청은 다른 처리 없이 거절됩니다.
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter,
+                       trust_proxy_headers=settings.RATE_LIMIT_TRUST_PROXY_HEADERS)
+
+if settings.METRICS_ENABLED:
+    for metered_engine in [engine, *replica_router.replicas]:
+        instrument_engine(metered_engine)
+    instrument_response_serialization()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
@@ -1,3 +1,6 @@
 from .user import User
 from .reservation import Reservation
-from .exam_schedule import ExamSchedule
\ No newline at end of file
+from .exam_schedule import ExamSchedule
+from .exam_capacity_stats import ExamCapacityStats
+from .idempotency_key import IdempotencyKey
+from .rate_limit_bucket import RateLimitBucket
\ No newline at end of file
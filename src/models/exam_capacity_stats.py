@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy.sql import func
+from src.db.base import Base
+
+
+class ExamCapacityStats(Base):
+    """
+    시험별 예약 인원 집계 (리포트용 롤업). 예약 생성/확정/수정/삭제와 같은 트랜잭션에서 증감합니다.
+    정원 확인은 시험 행의 reserved_participants 를 잠그고 하며, 이 테이블은 조회만 합니다.
+    """
+    __tablename__ = "exam_capacity_stats"
+
+    exam_id = Column(Integer, ForeignKey("exam_schedules.exam_id"), primary_key=True)
+    confirmed_participants = Column(Integer, nullable=False, default=0, server_default="0")
+    pending_participants = Column(Integer, nullable=False, default=0, server_default="0")
+    confirmed_reservations = Column(Integer, nullable=False, default=0, server_default="0")
+    pending_reservations = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        CheckConstraint('confirmed_participants >= 0', name='check_non_negative_confirmed_participants'),
+        CheckConstraint('pending_participants >= 0', name='check_non_negative_pending_participants'),
+        CheckConstraint('confirmed_reservations >= 0', name='check_non_negative_confirmed_reservations'),
+        CheckConstraint('pending_reservations >= 0', name='check_non_negative_pending_reservations'),
+    )
+
+    def __repr__(self):
+        return f"<ExamCapacityStats {self.exam_id}: {self.confirmed_participants} + {self.pending_participants}>"
@@ -12,6 +12,8 @@ class ExamSchedule(Base):
     start_time = Column(DateTime(timezone=True), nullable=False, index=True)
     end_time = Column(DateTime(timezone=True), nullable=False)
     max_capacity = Column(Integer, nullable=False, default=50000)
+    # 확정된 예약 인원 합계 (reservations 집계를 대신하는 비정규화 카운터)
+    reserved_participants = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -20,6 +22,7 @@ class ExamSchedule(Base):
     __table_args__ = (
         CheckConstraint('end_time > start_time', name='check_end_time_after_start_time'),
         CheckConstraint('max_capacity > 0', name='check_positive_max_capacity'),
+        CheckConstraint('reserved_participants >= 0', name='check_non_negative_reserved_participants'),
     )
 
     def __repr__(self):
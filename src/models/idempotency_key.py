@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary, JSON
+from sqlalchemy.sql import func
+from src.db.base import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key 별로 처음 처리한 응답을 보관합니다 (여러 워커/서버가 공유하는 경우).
+    status_code 가 비어 있으면 처리 중이고, 처리 중인 키는 expires_at 이 지나면 다른 요청이 다시 가져갈 수 있습니다.
+    """
+    __tablename__ = "idempotency_keys"
+
+    # 사용자, 메서드, 경로와 클라이언트가 보낸 키를 합친 값
+    key = Column(String, primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer)
+    headers = Column(JSON)
+    body = Column(LargeBinary)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyKey {self.key}: {self.status_code}>"
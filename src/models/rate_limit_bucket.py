@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, Float, Boolean, DateTime
+from src.db.base import Base
+
+
+class RateLimitBucket(Base):
+    """
+    여러 워커/서버가 공유하는 요청 제한 토큰 버킷 (RATE_LIMIT_DATABASE_ENABLED).
+    재시작 시 비워져도 되는 값이므로 WAL 을 쓰지 않는 UNLOGGED 테이블로 만듭니다.
+    """
+    __tablename__ = "rate_limit_buckets"
+
+    # 제한 규칙과 사용자(또는 IP)를 합친 값
+    key = Column(String, primary_key=True)
+    tokens = Column(Float, nullable=False)
+    # 마지막 요청이 토큰을 받았는지 여부
+    allowed = Column(Boolean, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    def __repr__(self):
+        return f"<RateLimitBucket {self.key}: {self.tokens}>"
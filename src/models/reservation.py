@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, Boolean, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, DateTime, Boolean, ForeignKey, CheckConstraint, Index, UniqueConstraint, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from src.db.base import Base
@@ -19,7 +19,19 @@ class Reservation(Base):
 
     __table_args__ = (
         CheckConstraint('num_participants > 0', name='check_positive_participants'),
+        # 사용자당 시험별 예약은 하나 (중복 신청은 이 제약 위반으로 감지)
+        UniqueConstraint('user_id', 'exam_id', name='uq_reservations_user_id_exam_id'),
+        # 사용자별 예약 목록 (reservation_id DESC 정렬/커서 페이지네이션)
+        Index('ix_reservations_user_id_reservation_id', 'user_id', text('reservation_id DESC')),
+        # 시험별 확정 인원 합계 (index-only scan 으로 SUM)
+        Index('ix_reservations_exam_id_confirmed', 'exam_id',
+              postgresql_include=['num_participants'], postgresql_where=text('is_confirmed')),
+        # 시험별 미확정 예약을 선착순으로 확정 (일괄 확정)
+        Index('ix_reservations_exam_id_pending', 'exam_id', 'created_at', 'reservation_id',
+              postgresql_include=['num_participants'], postgresql_where=text('is_confirmed IS NOT true')),
     )
+    # created_at/updated_at 을 INSERT/UPDATE ... RETURNING 으로 받아 커밋 후 다시 조회하지 않게 합니다.
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self):
         return f"<Reservation {self.reservation_id}: {self.exam_date}>"
@@ -0,0 +1,36 @@
+import argparse
+import sys
+
+from src.crud import exam_capacity_stats as exam_capacity_stats_crud
+from src.db.session import SessionLocal
+
+
+def main():
+    parser = argparse.ArgumentParser(description="reservations 테이블 기준으로 exam_capacity_stats 를 확인하거나 재계산합니다.")
+    parser.add_argument("--exam-id", type=int, default=None, help="특정 시험만 확인/재계산 (기본: 전체)")
+    parser.add_argument("--check", action="store_true", help="불일치 시험만 출력하고 반영하지 않음 (불일치가 있으면 종료 코드 1)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.check:
+            drift = exam_capacity_stats_crud.find_exam_capacity_stats_drift(db, args.exam_id)
+            for row in drift:
+                print(f"시험 {row['exam_id']}: 저장 {row['stored']} / 실제 {row['expected']}")
+            print(f"집계가 실제 예약과 다른 시험: {len(drift)}건")
+            if drift:
+                sys.exit(1)
+            return
+        drifted = exam_capacity_stats_crud.rebuild_exam_capacity_stats(db, args.exam_id)
+        db.commit()
+        print(f"시험별 집계를 재계산했습니다. 수정된 시험: {drifted}건")
+    except Exception as e:
+        db.rollback()
+        print(f"시험별 집계 재계산 중 오류 발생: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
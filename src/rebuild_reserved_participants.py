@@ -0,0 +1,31 @@
+import argparse
+
+from src.crud import exam_schedule as exam_schedule_crud
+from src.db.session import SessionLocal
+
+
+def main():
+    parser = argparse.ArgumentParser(description="reservations 테이블 기준으로 exam_schedules.reserved_participants 를 재계산합니다.")
+    parser.add_argument("--exam-id", type=int, default=None, help="특정 시험만 재계산 (기본: 전체)")
+    parser.add_argument("--dry-run", action="store_true", help="불일치 건수만 확인하고 반영하지 않음")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        drifted = exam_schedule_crud.rebuild_reserved_participants(db, args.exam_id)
+        if args.dry_run:
+            db.rollback()
+            print(f"카운터가 실제 확정 인원과 다른 시험: {drifted}건 (dry-run, 반영하지 않음)")
+        else:
+            db.commit()
+            print(f"카운터를 재계산했습니다. 수정된 시험: {drifted}건")
+    except Exception as e:
+        db.rollback()
+        print(f"카운터 재계산 중 오류 발생: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 
 from src.schemas.user import UserBase
 
@@ -11,9 +11,9 @@ class ReservationBase(BaseModel):
 
     @field_validator('num_participants')
     @classmethod
-    def validate_positive_number(cls, v, field):
-        if v <= 0:
-            raise ValueError(f'{field.name}는 0보다 커야 합니다.')
+    def validate_positive_number(cls, v, info: ValidationInfo):
+        if v is not None and v <= 0:
+            raise ValueError(f'{info.field_name}는 0보다 커야 합니다.')
         return v
 
 
@@ -25,7 +25,7 @@ class ReservationUpdate(BaseModel):
     num_participants: Optional[int] = Field(None, gt=0, description="참가자 수")
     is_confirmed: Optional[bool] = Field(None, description="예약 확정 여부")
 
-    _validate_num_participants = field_validator('num_participants')(ReservationBase.validate_positive_number)
+    _validate_num_participants = field_validator('num_participants')(ReservationBase.validate_positive_number.__func__)
 
     class Config:
         json_schema_extra = {
@@ -72,6 +72,22 @@ class AdminReservationReadList(BaseModel):
     revations: List[AdminReservationRead]
 
 
+class UserReservationCursorList(BaseModel):
+    page_size: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    total_itmes: Optional[int] = Field(None, description="전체 건수 (include_total=false 이면 플래너 통계 기반 예상치)")
+    total_is_estimate: bool = Field(..., description="total_itmes 가 예상치인지 여부")
+    revations: List[UserReservationRead]
+
+
+class AdminReservationCursorList(BaseModel):
+    page_size: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    total_itmes: Optional[int] = Field(None, description="전체 건수 (include_total=false 이면 플래너 통계 기반 예상치)")
+    total_is_estimate: bool = Field(..., description="total_itmes 가 예상치인지 여부")
+    revations: List[AdminReservationRead]
+
+
 class ReservationInDB(ReservationBase):
     reservation_id: int = Field(..., description="예약 ID")
     user_id: int = Field(..., gt=0, description="사용자 ID")
@@ -97,6 +113,66 @@ class Reservation(ReservationInDB):
     pass
 
 
+class BulkReservationItemResult(BaseModel):
+    index: int = Field(..., description="요청 목록에서의 위치 (0부터)")
+    exam_id: int = Field(..., description="시험 ID")
+    success: bool = Field(..., description="예약 생성 성공 여부")
+    code: int = Field(..., description="항목별 상태 코드 (201, 400, 409)")
+    message: Optional[str] = Field(None, description="실패 사유")
+    reservation: Optional[Reservation] = Field(None, description="생성된 예약")
+
+
+class BulkReservationResult(BaseModel):
+    created: int = Field(..., description="생성된 예약 수")
+    failed: int = Field(..., description="실패한 예약 수")
+    results: List[BulkReservationItemResult]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "created": 1,
+                "failed": 1,
+                "results": [
+                    {"index": 0, "exam_id": 1, "success": True, "code": 201, "message": None,
+                     "reservation": {"reservation_id": 1, "user_id": 123, "num_participants": 5,
+                                     "is_confirmed": False, "created_at": "2023-06-10T09:00:00Z",
+                                     "updated_at": None}},
+                    {"index": 1, "exam_id": 2, "success": False, "code": 409,
+                     "message": "이미 존재하는 예약이 있습니다.", "reservation": None}
+                ]
+            }
+        }
+
+
+class ReservationBulkConfirm(BaseModel):
+    reservation_ids: Optional[List[int]] = Field(None, min_length=1, description="확정할 예약 ID 목록")
+    exam_id: Optional[int] = Field(None, gt=0, description="이 시험의 미확정 예약을 잔여 인원까지 확정")
+
+    @model_validator(mode='after')
+    def validate_target(self):
+        if (self.reservation_ids is None) == (self.exam_id is None):
+            raise ValueError('reservation_ids 와 exam_id 중 하나만 지정해야 합니다.')
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "exam_id": 1
+            }
+        }
+
+
+class BulkConfirmRejection(BaseModel):
+    reservation_id: int = Field(..., description="예약 ID")
+    message: str = Field(..., description="확정되지 않은 사유")
+
+
+class BulkConfirmResult(BaseModel):
+    confirmed: List[int] = Field(..., description="확정된 예약 ID 목록")
+    rejected: List[BulkConfirmRejection] = Field(..., description="확정되지 않은 예약 목록 (reservation_ids 로 확정한 경우)")
+    rejected_count: int = Field(..., ge=0, description="확정되지 않은 예약 수. exam_id 로 확정하면 목록 없이 건수만 반환합니다")
+
+
 class AvailableTimeSchema(BaseModel):
     exam_id: int = Field(..., description="시험 ID")
     name: str = Field(..., description="시험 제목")
@@ -118,3 +194,15 @@ class AvailableTimeSchema(BaseModel):
                 "available_capacity": 5
             }
         }
+
+
+class ExamCapacityStatsRead(BaseModel):
+    exam_id: int = Field(..., description="시험 ID")
+    name: str = Field(..., description="시험 제목")
+    start_time: datetime = Field(..., description="시험 시작 시간")
+    max_capacity: int = Field(..., description="최대 수용 인원")
+    confirmed_participants: int = Field(..., description="확정된 참가자 수")
+    pending_participants: int = Field(..., description="확정 대기 중인 참가자 수")
+    total_participants: int = Field(..., description="전체 예약 참가자 수 (확정 + 대기)")
+    confirmed_reservations: int = Field(..., description="확정된 예약 수")
+    pending_reservations: int = Field(..., description="확정 대기 중인 예약 수")
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Set, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from src.core.config import settings
+from src.db.session import SessionLocal
+from src.schemas.reservation import Reservation as ReservationSchema
+from src.schemas.reservation import ReservationCreate
+from src.services.reservation import ReservationService
+
+logger = logging.getLogger(__name__)
+
+
+class BookingQueue:
+    """
+    시험별 예약 생성 대기열 (group commit).
+
+    같은 시험에 예약 요청이 몰리면 요청마다 잔여 인원을 조회하고 커밋하는 대신, 시험별 대기열에 모아
+    한 묶음(micro-batch)씩 잔여 인원을 한 번 확인하고 한 번의 INSERT/커밋으로 처리한 뒤 요청별 결과를 돌려줍니다.
+    묶음을 처리하는 동안 도착한 요청이 다음 묶음이 되므로, 요청이 적을 때는 기다리는 시간 없이 한 건씩 처리됩니다.
+    대기열과 처리 태스크는 이벤트 루프 하나에서만 다루고, 대기열이 비면 태스크도 종료됩니다.
+    요청은 timeout 초까지만 기다립니다. 그 전에 묶음에 들어가지 못한 요청은 처리하지 않지만,
+    이미 커밋 중인 묶음에 들어간 요청은 응답(504)과 관계없이 생성될 수 있습니다.
+    """
+
+    def __init__(self, max_batch_size: int, timeout: float):
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self._queues: Dict[int, asyncio.Queue] = {}
+        # 이벤트 루프는 태스크를 약한 참조로만 가지므로, 처리 중인 태스크가 GC 되지 않도록 끝날 때까지 보관합니다.
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self.timeouts = 0
+
+    async def submit(self, user_id: int, request: ReservationCreate) -> ReservationSchema:
+        """예약 요청을 시험별 대기열에 넣고, 해당 묶음이 커밋되면 생성된 예약을 반환합니다 (실패 시 HTTPException)."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues.get(request.exam_id)
+        if queue is None:
+            queue = self._queues[request.exam_id] = asyncio.Queue()
+            task = loop.create_task(self._drain(request.exam_id, queue))
+            self._tasks.add(task)
+            task.add_done_callback(lambda done: self._on_drain_done(request.exam_id, queue, done))
+        queue.put_nowait((user_id, request, future))
+        try:
+            # 시간이 지나면 future 가 취소되어, 아직 묶음에 들어가지 않은 요청은 처리되지 않습니다.
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                                detail="예약 처리 대기 시간이 초과되었습니다. 예약 목록에서 생성 여부를 확인해주세요.")
+
+    def _on_drain_done(self, exam_id: int, queue: asyncio.Queue, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled() or task.exception() is None:
+            return
+        # 처리 태스크가 예기치 않게 끝났으면 대기열을 지워 다음 요청이 새 태스크를 시작하게 합니다.
+        logger.error("예약 대기열 처리 실패 (exam_id=%s)", exam_id, exc_info=task.exception())
+        if self._queues.get(exam_id) is queue:
+            del self._queues[exam_id]
+        while not queue.empty():
+            _, _, future = queue.get_nowait()
+            if not future.done():
+                future.set_exception(task.exception())
+
+    async def _drain(self, exam_id: int, queue: asyncio.Queue) -> None:
+        while True:
+            # 비어 있는지 확인하고 대기열을 지우는 사이에 await 가 없으므로 새 요청을 놓치지 않습니다.
+            if queue.empty():
+                del self._queues[exam_id]
+                return
+            batch = []
+            while not queue.empty() and len(batch) < self.max_batch_size:
+                user_id, request, future = queue.get_nowait()
+                # 연결이 끊겨 취소된 요청은 처리하지 않습니다.
+                if not future.cancelled():
+                    batch.append((user_id, request, future))
+            if batch:
+                await self._commit(exam_id, batch)
+
+    async def _commit(self, exam_id: int, batch: List[Tuple[int, ReservationCreate, asyncio.Future]]) -> None:
+        try:
+            results = await run_in_threadpool(self._process, exam_id, [(user_id, request) for user_id, request, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        with self._lock:
+            self.batches += 1
+            self.items += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _process(exam_id: int, items: List[Tuple[int, ReservationCreate]]):
+        # 묶음에는 여러 요청이 섞여 있으므로 요청 세션 대신 전용 세션을 사용합니다.
+        db = SessionLocal()
+        try:
+            return ReservationService.create_reservations_for_exam(db, exam_id, items)
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": settings.BOOKING_QUEUE_ENABLED,
+                "active_exams": len(self._queues),
+                "drain_tasks": len(self._tasks),
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+                "max_batch_size": self.max_batch_size,
+                "timeouts": self.timeouts,
+                "timeout_seconds": self.timeout,
+            }
+
+
+booking_queue = BookingQueue(
+    max_batch_size=settings.BOOKING_QUEUE_MAX_BATCH,
+    timeout=settings.BOOKING_QUEUE_TIMEOUT_SECONDS
+)
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from cachetools import TTLCache
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from src.core.config import settings
+from src.crud import idempotency_key as idempotency_key_crud
+from src.db.session import SessionLocal
+
+# 다른 워커가 처리 중인 키의 응답이 DB 에 저장됐는지 다시 확인하는 간격(초)
+_POLL_INTERVAL_SECONDS = 0.05
+# 만료된 키를 지우는 최소 간격(초)
+_PURGE_INTERVAL_SECONDS = 60
+
+
+class StoredResponse(NamedTuple):
+    fingerprint: str
+    status_code: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key 별 첫 응답 보관소.
+
+    처음 도착한 요청만 실행하고 그 응답(상태 코드, 헤더, 본문)을 크기와 TTL 이 제한된 캐시에 보관해, 같은 키의 재시도에는
+    라우트를 실행하지 않고 보관한 응답을 그대로 돌려줍니다. 같은 키의 요청이 처리 중이면 새로 실행하지 않고 끝나기를 기다립니다.
+    use_database 를 켜면 idempotency_keys 테이블에도 보관해 여러 워커/서버가 같은 키를 한 번만 처리합니다.
+    캐시와 처리 중 목록은 이벤트 루프에서만 다루므로 lock 이 필요 없습니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, lock_timeout: float, use_database: bool):
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.use_database = use_database
+        self._responses = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._next_purge = 0.0
+        self.executions = 0
+        self.replays = 0
+        self.waits = 0
+        self.mismatches = 0
+
+    async def acquire(self, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """
+        보관된 응답이 있으면 반환하고, 없으면 이 요청이 실행할 차례를 받아 None 을 반환합니다.
+        None 을 받은 호출자는 반드시 complete 를 호출해야 합니다.
+        같은 키를 다른 요청 본문으로 재사용하면 422, lock_timeout 동안 처리 중인 요청이 끝나지 않으면 409 를 발생시킵니다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lock_timeout
+        while True:
+            stored = self._responses.get(key)
+            if stored is not None:
+                return self._replay(stored, fingerprint)
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+            self.waits += 1
+            try:
+                await asyncio.wait_for(asyncio.shield(in_flight), max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                raise _in_progress_error()
+            # 처리하던 요청이 응답을 보관했으면 다음 반복에서 돌려주고, 보관하지 않았으면 이 요청이 실행합니다.
+
+        self._in_flight[key] = loop.create_future()
+        if not self.use_database:
+            self.executions += 1
+            return None
+        try:
+            while True:
+                claimed, row = await run_in_threadpool(self._claim, key, fingerprint)
+                if claimed:
+                    self.executions += 1
+                    return None
+                if row is not None and row.status_code is not None:
+                    stored = StoredResponse(row.fingerprint, row.status_code,
+                                            [(name.encode("latin-1"), value.encode("latin-1")) for name, value in row.headers],
+                                            row.body)
+                    self._responses[key] = stored
+                    self._release(key)
+                    return self._replay(stored, fingerprint)
+                # 다른 워커가 처리 중
+                if loop.time() >= deadline:
+                    raise _in_progress_error()
+                await asyncio.sleep(_POLL_INTERVAL_SECONDS)
+        except BaseException:
+            self._release(key)
+            raise
+
+    async def complete(self, key: str, response: Optional[StoredResponse]) -> None:
+        """실행한 요청의 응답을 보관하고 기다리던 요청들을 깨웁니다. response 가 None 이면 보관하지 않습니다."""
+        try:
+            if response is not None:
+                self._responses[key] = response
+            if self.use_database:
+                await run_in_threadpool(self._save, key, response)
+        finally:
+            self._release(key)
+
+    def _replay(self, stored: StoredResponse, fingerprint: str) -> StoredResponse:
+        if stored.fingerprint != fingerprint:
+            self.mismatches += 1
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                detail="같은 Idempotency-Key 로 다른 요청을 보낼 수 없습니다.")
+        self.replays += 1
+        return stored
+
+    def _release(self, key: str) -> None:
+        future = self._in_flight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def _claim(self, key: str, fingerprint: str):
+        db = SessionLocal()
+        try:
+            if self._next_purge <= time.monotonic():
+                self._next_purge = time.monotonic() + _PURGE_INTERVAL_SECONDS
+                idempotency_key_crud.delete_expired_idempotency_keys(db)
+            return idempotency_key_crud.claim_idempotency_key(db, key, fingerprint, self.lock_timeout)
+        finally:
+            db.close()
+
+    def _save(self, key: str, response: Optional[StoredResponse]) -> None:
+        db = SessionLocal()
+        try:
+            if response is None:
+                idempotency_key_crud.release_idempotency_key(db, key)
+            else:
+                headers = [[name.decode("latin-1"), value.decode("latin-1")] for name, value in response.headers]
+                idempotency_key_crud.save_idempotent_response(
+                    db, key, response.status_code, headers, response.body, self.ttl)
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        return {
+            "executions": self.executions,
+            "replays": self.replays,
+            "waits": self.waits,
+            "mismatches": self.mismatches,
+            "in_flight": len(self._in_flight),
+            "size": len(self._responses),
+            "maxsize": self._responses.maxsize,
+            "ttl_seconds": self.ttl,
+            "database": self.use_database,
+        }
+
+
+def _in_progress_error() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_409_CONFLICT,
+                         detail="같은 Idempotency-Key 의 요청이 아직 처리 중입니다. 잠시 후 다시 시도해주세요.")
+
+
+idempotency_store = IdempotencyStore(
+    maxsize=settings.IDEMPOTENCY_CACHE_MAXSIZE,
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+    lock_timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT_SECONDS,
+    use_database=settings.IDEMPOTENCY_DATABASE_ENABLED
+)
@@ -0,0 +1,145 @@
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
+from starlette.routing import compile_path
+
+from src.core.config import settings
+from src.crud import rate_limit_bucket as rate_limit_bucket_crud
+from src.db.session import SessionLocal
+
+# 쓰이지 않는 공유 버킷을 지우는 최소 간격(초)
+_PURGE_INTERVAL_SECONDS = 60
+
+
+class RateLimitRule(NamedTuple):
+    method: str
+    path: str
+    # 초당 채워지는 토큰 수와 버킷 크기(연속으로 보낼 수 있는 최대 요청 수)
+    rate: float
+    burst: int
+
+
+def parse_rate_limits(value: str) -> List[RateLimitRule]:
+    """
+    "GET /v1/reservations/available-times=5/20, GET /v1/reservations/{reservation_id}=2/10" 형식의 설정을 읽습니다.
+    경로는 라우트 템플릿으로 적을 수 있습니다.
+    """
+    rules = []
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        try:
+            route, limit = item.rsplit("=", 1)
+            method, path = route.split()
+            rate, burst = limit.split("/")
+            rule = RateLimitRule(method.upper(), path, float(rate), int(burst))
+        except ValueError:
+            raise ValueError(f"RATE_LIMITS 형식이 올바르지 않습니다: {item.strip()!r} (예: GET /v1/reservations=2/10)")
+        if rule.rate <= 0 or rule.burst < 1:
+            raise ValueError(f"RATE_LIMITS 의 초당 요청 수와 최대 연속 요청 수는 0보다 커야 합니다: {item.strip()!r}")
+        rules.append(rule)
+    return rules
+
+
+class RateLimiter:
+    """
+    라우트별 토큰 버킷 요청 제한. 버킷은 (규칙, 사용자 또는 IP) 마다 하나이고 요청마다 토큰 하나를 씁니다.
+
+    기본은 프로세스 안의 크기가 제한된 TTLCache 에 버킷을 보관합니다. 버킷은 burst / rate 초가 지나면 다시 가득 차므로
+    그동안 요청이 없던 버킷은 지워도 결과가 같습니다 (크기를 넘어 밀려난 버킷도 가득 찬 버킷으로 다시 시작합니다).
+    use_database 를 켜면 rate_limit_buckets 테이블의 버킷을 공유해 워커/서버가 여러 개여도 제한이 합산되지 않고,
+    거절된 키는 Retry-After 동안 DB 를 조회하지 않고 바로 거절합니다.
+    버킷은 이벤트 루프에서만 다루므로 lock 이 필요 없습니다.
+    """
+
+    def __init__(self, rules: List[RateLimitRule], max_keys: int, use_database: bool):
+        self.rules = rules
+        self.use_database = use_database
+        self._exact: Dict[Tuple[str, str], RateLimitRule] = {}
+        self._patterns = []
+        for rule in rules:
+            path_regex, _, param_convertors = compile_path(rule.path)
+            if param_convertors:
+                self._patterns.append((rule.method, path_regex, rule))
+            else:
+                self._exact[(rule.method, rule.path)] = rule
+        idle_seconds = max((rule.burst / rule.rate for rule in rules), default=1)
+        self._buckets = TTLCache(maxsize=max_keys, ttl=idle_seconds)
+        self._blocked = TTLCache(maxsize=max_keys, ttl=idle_seconds)
+        self._idle_seconds = idle_seconds
+        self._next_purge = 0.0
+        self.allowed = 0
+        self.limited = 0
+
+    def match(self, method: str, path: str) -> Optional[RateLimitRule]:
+        rule = self._exact.get((method, path))
+        if rule is not None or not self._patterns:
+            return rule
+        for rule_method, path_regex, rule in self._patterns:
+            if rule_method == method and path_regex.match(path):
+                return rule
+        return None
+
+    async def acquire(self, rule: RateLimitRule, identity: str) -> Optional[float]:
+        """토큰을 꺼내면 None, 버킷이 비어 있으면 토큰이 다시 생길 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        key = f"{rule.method} {rule.path}:{identity}"
+        if self.use_database:
+            retry_after = await self._acquire_shared(rule, key)
+        else:
+            retry_after = self._acquire_local(rule, key)
+        if retry_after is None:
+            self.allowed += 1
+        else:
+            self.limited += 1
+        return retry_after
+
+    def _acquire_local(self, rule: RateLimitRule, key: str) -> Optional[float]:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (rule.burst, now))
+        tokens = min(rule.burst, tokens + (now - updated_at) * rule.rate)
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            return None
+        self._buckets[key] = (tokens, now)
+        return (1 - tokens) / rule.rate
+
+    async def _acquire_shared(self, rule: RateLimitRule, key: str) -> Optional[float]:
+        now = time.monotonic()
+        blocked_until = self._blocked.get(key)
+        if blocked_until is not None and blocked_until > now:
+            return blocked_until - now
+        allowed, tokens = await run_in_threadpool(self._take, rule, key)
+        if allowed:
+            return None
+        retry_after = (1 - tokens) / rule.rate
+        self._blocked[key] = now + retry_after
+        return retry_after
+
+    def _take(self, rule: RateLimitRule, key: str) -> Tuple[bool, float]:
+        db = SessionLocal()
+        try:
+            if self._next_purge <= time.monotonic():
+                self._next_purge = time.monotonic() + _PURGE_INTERVAL_SECONDS
+                rate_limit_bucket_crud.delete_idle_rate_limit_buckets(db, self._idle_seconds)
+            return rate_limit_bucket_crud.take_rate_limit_token(db, key, rule.rate, rule.burst)
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        return {
+            "rules": [f"{rule.method} {rule.path}={rule.rate:g}/{rule.burst}" for rule in self.rules],
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "buckets": len(self._buckets),
+            "max_keys": self._buckets.maxsize,
+            "database": self.use_database,
+        }
+
+
+rate_limiter = RateLimiter(
+    rules=parse_rate_limits(settings.RATE_LIMITS),
+    max_keys=settings.RATE_LIMIT_MAX_KEYS,
+    use_database=settings.RATE_LIMIT_DATABASE_ENABLED
+)
@@ -1,53 +1,206 @@
-from datetime import timedelta
-from typing import Optional, Union
+import csv
+import io
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Tuple, Union
 
+import orjson
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from src.core.available_times_cache import available_times_cache
+from src.core.config import settings
+from src.crud import exam_capacity_stats as exam_capacity_stats_crud
 from src.crud import exam_schedule as exam_schedule_crud
 from src.crud import reservation_crud as reservation_crud
 from src.crud import reservation_query
 from src.crud.reservation_query import get_user_reservations_count
-from src.models import User
+from src.db.session import SessionLocal, replica_router
 from src.models.reservation import Reservation
-from src.schemas.reservation import (AdminReservationRead, ReservationCreate,
-                                     ReservationUpdate,
-                                     UserReservationRead, UserReservationReadList, AdminReservationReadList)
-from src.schemas.user import UserBase
+from src.schemas.reservation import (AdminReservationRead, AvailableTimeSchema, BulkReservationItemResult,
+                                     BulkReservationResult, ExamCapacityStatsRead, ReservationCreate, ReservationUpdate,
+                                     ReservationBulkConfirm, BulkConfirmRejection, BulkConfirmResult,
+                                     UserReservationRead)
+from src.schemas.reservation import Reservation as ReservationSchema
+from src.schemas.user import CurrentUser
+from src.utils.cursor import encode_cursor
 from src.utils.time_utils import get_kst_now
 
 
+def _confirmed_participants(is_confirmed: Optional[bool], num_participants: int) -> int:
+    """exam_schedules.reserved_participants 에 반영되는 인원 (확정된 예약만 집계)"""
+    return num_participants if is_confirmed else 0
+
+
+def _reservation_read_payloads(user_id: Optional[int], query_results) -> List[dict]:
+    """
+    UserReservationRead / AdminReservationRead 와 같은 모양의 dict 목록.
+    목록 응답은 최대 1,000건이므로 행마다 모델을 만들고 다시 검증하지 않고, 조회 결과를 그대로 옮겨 담습니다.
+    """
+    if user_id is not None:
+        return [{
+            "reservation_id": result.reservation_id,
+            "exam_id": result.exam_id,
+            "exam_name": result.exam_name,
+            "is_confirmed": result.is_confirmed,
+            "num_participants": result.num_participants,
+        } for result in query_results]
+    return [{
+        "reservation_id": result.reservation_id,
+        "exam_id": result.exam_id,
+        "exam_name": result.exam_name,
+        "is_confirmed": result.is_confirmed,
+        "num_participants": result.num_participants,
+        "user": {
+            "email": result.email,
+            "username": result.username,
+        },
+    } for result in query_results]
+
+
+EXPORT_COLUMNS = ("reservation_id", "exam_id", "exam_name", "user_id", "username", "email",
+                  "num_participants", "is_confirmed", "created_at", "updated_at")
+
+
+def _export_chunk(rows, export_format: str) -> bytes:
+    """서버 측 커서에서 읽은 한 묶음의 행을 NDJSON 또는 CSV 바이트로 변환합니다."""
+    if export_format == "ndjson":
+        return b"".join(orjson.dumps(row._asdict()) + b"\n" for row in rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # 시각은 NDJSON(orjson)과 같은 ISO 8601 형식으로 씁니다.
+    writer.writerows([value.isoformat() if isinstance(value, datetime) else value for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _booking_error(exam_schedule: Optional[AvailableTimeSchema], num_participants: int,
+                   now: datetime) -> Optional[str]:
+    """예약 가능 기간(시작 3일 전까지)과 잔여 인원을 확인하고, 예약할 수 없으면 사유를 반환합니다."""
+    if exam_schedule is None:
+        return "예약이 가능하지 않은 날짜입니다."
+    if exam_schedule.reserved_participants + num_participants > exam_schedule.max_capacity:
+        return "예약 가능한 인원을 초과했습니다."
+    if exam_schedule.start_time < now or exam_schedule.start_time > now + timedelta(days=3):
+        return "예약이 가능하지 않은 날짜입니다."
+    return None
+
+
+def _add_created_stats(db: Session, created_rows) -> None:
+    """일괄 생성된 예약들을 시험별 집계에 반영합니다."""
+    exam_capacity_stats_crud.add_exam_capacity_stats(db, [
+        (row.exam_id, exam_capacity_stats_crud.reservation_stats(row.is_confirmed, row.num_participants))
+        for row in created_rows
+    ])
+
+
 class ReservationService:
 
     @staticmethod
     def create_reservation(db: Session, request: ReservationCreate, user_id: int) -> Optional[Reservation]:
         exam_id = request.exam_id
 
-        # 중복 신청여부 확인
-        reservation = reservation_crud.get_user_reservation(db, exam_id, user_id)
-        if reservation is not None:
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 예약이 있습니다.")
-
         # 예약 가능 여부 확인 (3일전, 최대 5만명)
         exam_schedule = exam_schedule_crud.get_exam_schedule_with_available_capacity(db, exam_id)
+        error = _booking_error(exam_schedule, request.num_participants, get_kst_now())
+        if error is not None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+        # 신규 예약은 미확정 상태로 생성되므로 확정 인원 카운터는 확정(수정) 시점에 반영됩니다.
+        # 중복 신청은 별도 조회 없이 (user_id, exam_id) 유니크 제약 위반으로 감지합니다.
+        try:
+            db_reservation = reservation_crud.create_reservation(db, request, user_id)
+        except IntegrityError as e:
+            db.rollback()
+            if reservation_crud.is_duplicate_reservation_error(e):
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 예약이 있습니다.")
+            raise
+        # 시험별 집계 행은 같은 시험의 예약끼리 잠그는 행이므로, 커밋 직전에 갱신해 잠금을 쥐는 시간을 줄입니다.
+        exam_capacity_stats_crud.add_exam_capacity_stats(
+            db, [(exam_id, exam_capacity_stats_crud.reservation_stats(False, request.num_participants))])
+        db.commit()
+        return db_reservation
+
+    @staticmethod
+    def create_reservations_bulk(db: Session, requests: List[ReservationCreate], user_id: int) -> BulkReservationResult:
+        if not requests:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="예약 요청 목록이 비어 있습니다.")
+        if len(requests) > settings.BULK_RESERVATION_MAX_ITEMS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"한 번에 최대 {settings.BULK_RESERVATION_MAX_ITEMS}건까지 예약할 수 있습니다.")
+
+        # 요청에 포함된 시험들의 예약 가능 여부를 한 번의 쿼리로 확인
+        exam_schedules = exam_schedule_crud.get_exam_schedules_with_available_capacity(
+            db, list({request.exam_id for request in requests}))
         now = get_kst_now()
-        three_days_later = now + timedelta(days=3)
-        if exam_schedule is None:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="예약이 가능하지 않은 날짜입니다.")
 
-        if exam_schedule.reserved_participants + request.num_participants > exam_schedule.max_capacity:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="예약 가능한 인원을 초과했습니다.")
+        results: List[Optional[BulkReservationItemResult]] = [None] * len(requests)
+        pending = {}  # exam_id -> 요청 위치
+        for index, request in enumerate(requests):
+            error = _booking_error(exam_schedules.get(request.exam_id), request.num_participants, now)
+            if error is None and request.exam_id in pending:
+                results[index] = BulkReservationItemResult(
+                    index=index, exam_id=request.exam_id, success=False,
+                    code=status.HTTP_409_CONFLICT, message="같은 시험에 대한 예약이 요청에 중복되어 있습니다.")
+            elif error is not None:
+                results[index] = BulkReservationItemResult(
+                    index=index, exam_id=request.exam_id, success=False,
+                    code=status.HTTP_400_BAD_REQUEST, message=error)
+            else:
+                pending[request.exam_id] = index
 
-        if exam_schedule.start_time < now:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="예약이 가능하지 않은 날짜입니다.")
+        # 통과한 예약을 한 번의 INSERT 로 생성 (이미 존재하는 예약은 건너뛰고 409 로 응답)
+        created_rows = reservation_crud.bulk_create_reservations(
+            db, [(user_id, requests[index]) for index in pending.values()])
+        created = {row.exam_id: ReservationSchema.model_validate(row) for row in created_rows}
+        _add_created_stats(db, created_rows)
+        db.commit()
 
-        if exam_schedule.start_time > three_days_later:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="예약이 가능하지 않은 날짜입니다.")
+        for exam_id, index in pending.items():
+            reservation = created.get(exam_id)
+            if reservation is None:
+                results[index] = BulkReservationItemResult(
+                    index=index, exam_id=exam_id, success=False,
+                    code=status.HTTP_409_CONFLICT, message="이미 존재하는 예약이 있습니다.")
+            else:
+                results[index] = BulkReservationItemResult(
+                    index=index, exam_id=exam_id, success=True,
+                    code=status.HTTP_201_CREATED, reservation=reservation)
 
-        return reservation_crud.create_reservation(db, request, user_id)
+        return BulkReservationResult(created=len(created), failed=len(requests) - len(created), results=results)
 
     @staticmethod
-    def get_reservation(db: Session, reservation_id: int, current_user: User) -> Optional[Reservation]:
+    def create_reservations_for_exam(db: Session, exam_id: int, items: List[Tuple[int, ReservationCreate]]) -> List[
+        Union[ReservationSchema, HTTPException]]:
+        """
+        같은 시험에 대한 여러 사용자의 예약 요청(user_id, 요청)을 잔여 인원 한 번 조회, 한 번의 INSERT 와 커밋으로 처리합니다.
+        예약 대기열(booking_queue)이 사용하며, 요청별로 생성된 예약 또는 create_reservation 과 같은 HTTPException 을 반환합니다.
+        """
+        exam_schedule = exam_schedule_crud.get_exam_schedule_with_available_capacity(db, exam_id)
+        now = get_kst_now()
+
+        results: List[Optional[Union[ReservationSchema, HTTPException]]] = [None] * len(items)
+        pending = {}  # user_id -> 요청 위치
+        for index, (user_id, request) in enumerate(items):
+            error = _booking_error(exam_schedule, request.num_participants, now)
+            if error is not None:
+                results[index] = HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+            elif user_id in pending:
+                results[index] = HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 예약이 있습니다.")
+            else:
+                pending[user_id] = index
+
+        created_rows = reservation_crud.bulk_create_reservations(db, [items[index] for index in pending.values()])
+        created = {row.user_id: ReservationSchema.model_validate(row) for row in created_rows}
+        _add_created_stats(db, created_rows)
+        db.commit()
+
+        for user_id, index in pending.items():
+            results[index] = created.get(user_id) or HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 예약이 있습니다.")
+        return results
+
+    @staticmethod
+    def get_reservation(db: Session, reservation_id: int, current_user: CurrentUser) -> Optional[Reservation]:
         db_reservation = reservation_crud.get_reservation(db, reservation_id)
         if db_reservation is None:
             raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다. 예약 ID를 확인해주세요.")
@@ -56,74 +209,226 @@ class ReservationService:
         return db_reservation
 
     @staticmethod
-    def get_user_reservations(db: Session, user_id: int, page: int = 1, limit: int = 100) -> Union[
-        UserReservationReadList, AdminReservationReadList]:
-        total_items = get_user_reservations_count(db, user_id)
-        query_results = reservation_query.get_user_reservations(db, user_id, page, limit)
+    def read_reservation(db: Session, reservation_id: int, current_user: CurrentUser) -> Union[
+        UserReservationRead, AdminReservationRead]:
+        result = reservation_query.get_reservation_with_details(db, reservation_id)
+        if result is None:
+            raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다. 예약 ID를 확인해주세요.")
+        if not current_user.is_admin and result.user_id != current_user.user_id:
+            raise HTTPException(status_code=403, detail="이 예약에 접근할 권한이 없습니다. 본인의 예약만 조회할 수 있습니다.")
+        read_schema = AdminReservationRead if current_user.is_admin else UserReservationRead
+        return read_schema.model_validate(
+            _reservation_read_payloads(None if current_user.is_admin else current_user.user_id, [result])[0])
+
+    @staticmethod
+    def get_user_reservations(db: Session, user_id: int, page: int = 1, limit: int = 100) -> dict:
+        """UserReservationReadList / AdminReservationReadList 모양의 응답 본문"""
+        query_results, total_items = reservation_query.get_user_reservations_with_total(db, user_id, page, limit)
         total_pages = total_items // limit + (1 if total_items % limit > 0 else 0)
 
-        if user_id is not None:
-            read_schema = [UserReservationRead.from_orm(result) for result in query_results]
-            return UserReservationReadList(
-                revations=read_schema,
-                page=page,
-                page_size=limit,
-                total_itmes=total_items,
-                total_pages=total_pages
-            )
-        else:
-            read_schema = [AdminReservationRead(
-                reservation_id=result.reservation_id,
-                exam_id=result.exam_id,
-                exam_name=result.exam_name,
-                is_confirmed=result.is_confirmed,
-                num_participants=result.num_participants,
-                user=UserBase(
-                    user_id=result.user_id,
-                    email=result.email,
-                    username=result.username
-                )
-            ) for result in query_results]
-            return AdminReservationReadList(
-                revations=read_schema,
-                page=page,
-                page_size=limit,
-                total_itmes=total_items,
-                total_pages=total_pages
-            )
+        return {
+            "page": page,
+            "page_size": limit,
+            "total_itmes": total_items,
+            "total_pages": total_pages,
+            "revations": _reservation_read_payloads(user_id, query_results),
+        }
 
     @staticmethod
-    def update_reservation(db: Session, reservation_id: int, request: ReservationUpdate, current_user: User) -> \
+    def get_user_reservations_by_cursor(db: Session, user_id: Optional[int], after_id: Optional[int],
+                                        limit: int = 100, include_total: bool = False) -> dict:
+        """UserReservationCursorList / AdminReservationCursorList 모양의 응답 본문"""
+        query_results = reservation_query.get_user_reservations_after(db, user_id, after_id, limit)
+        has_next = len(query_results) > limit
+        query_results = query_results[:limit]
+        next_cursor = encode_cursor(query_results[-1].reservation_id) if has_next else None
+
+        # 정확한 건수는 요청한 경우에만 COUNT, 기본은 플래너 통계 기반 예상치
+        total_items = None
+        if not include_total:
+            total_items = reservation_query.estimate_user_reservations_count(db, user_id)
+        total_is_estimate = total_items is not None
+        if total_items is None:
+            total_items = get_user_reservations_count(db, user_id)
+
+        return {
+            "page_size": limit,
+            "next_cursor": next_cursor,
+            "total_itmes": total_items,
+            "total_is_estimate": total_is_estimate,
+            "revations": _reservation_read_payloads(user_id, query_results),
+        }
+
+    @staticmethod
+    def update_reservation(db: Session, reservation_id: int, request: ReservationUpdate, current_user: CurrentUser) -> \
     Optional[
         Reservation]:
-        db_reservation = reservation_crud.get_reservation_for_update(db, reservation_id)
-        if db_reservation is None:
+        # 권한 확인은 잠그지 않고 먼저 합니다 (다른 사용자의 요청이 남의 시험 행을 잠그지 않도록)
+        owner = reservation_crud.get_reservation_owner(db, reservation_id)
+        if owner is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="예약을 찾을 수 없습니다. 예약 ID를 확인해주세요.")
-
-        # 권한 확인
-        if not current_user.is_admin and db_reservation.user_id != current_user.user_id:
+        if not current_user.is_admin and owner.user_id != current_user.user_id:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="해당 예약에 대한 수정 권한이 없습니다.")
         if not current_user.is_admin and request.is_confirmed is not None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="해당 예약에 대한 허가 권한이 없습니다.")
 
+        # 시험 행 → 예약 행 순서로 잠가, 같은 시험의 확정 인원을 바꾸는 요청(수정/일괄 확정)을 직렬화합니다.
+        # 확인과 잠금 사이에 삭제되었을 수 있으므로 잠근 뒤 다시 조회합니다 (예약의 user_id/exam_id 는 바뀌지 않습니다).
+        exam_schedule = exam_schedule_crud.lock_exam_schedule(db, owner.exam_id)
+        db_reservation = reservation_crud.get_reservation_for_update(db, reservation_id)
+        if db_reservation is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="예약을 찾을 수 없습니다. 예약 ID를 확인해주세요.")
+
+        # 확정 인원 카운터와 시험별 집계를 예약 수정과 같은 트랜잭션에서 갱신
+        update_data = request.dict(exclude_unset=True)
+        delta = _confirmed_participants(
+            update_data.get('is_confirmed', db_reservation.is_confirmed),
+            update_data.get('num_participants', db_reservation.num_participants)
+        ) - _confirmed_participants(db_reservation.is_confirmed, db_reservation.num_participants)
+        # 시험 행을 잠근 상태에서 확인하므로 동시에 확정해도 정원을 넘지 않습니다.
+        if delta > 0 and exam_schedule.reserved_participants + delta > exam_schedule.max_capacity:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="예약 가능한 인원을 초과했습니다.")
+        exam_schedule_crud.add_reserved_participants(db, db_reservation.exam_id, delta)
+        exam_capacity_stats_crud.add_exam_capacity_stats(db, [
+            (db_reservation.exam_id, exam_capacity_stats_crud.reservation_stats(
+                db_reservation.is_confirmed, db_reservation.num_participants, sign=-1)),
+            (db_reservation.exam_id, exam_capacity_stats_crud.reservation_stats(
+                update_data.get('is_confirmed', db_reservation.is_confirmed),
+                update_data.get('num_participants', db_reservation.num_participants))),
+        ])
+
         # 예약 상태 업데이트
-        return reservation_crud.update_reservation(db, reservation_id, request)
+        updated_reservation = reservation_crud.update_reservation(db, db_reservation, request)
+        if delta:
+            available_times_cache.bump()
+        return updated_reservation
 
     @staticmethod
-    def delete_reservation(db: Session, reservation_id: int, current_user: User) -> bool:
-        db_reservation = ReservationService.get_reservation(db, reservation_id, current_user)
+    def confirm_reservations(db: Session, request: ReservationBulkConfirm, current_user: CurrentUser) -> BulkConfirmResult:
+        if not current_user.is_admin:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="예약 확정은 관리자만 할 수 있습니다.")
+
+        if request.exam_id is not None:
+            if exam_schedule_crud.get_exam_schedule(db, request.exam_id) is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="시험을 찾을 수 없습니다. 시험 ID를 확인해주세요.")
+            confirmed = reservation_crud.confirm_reservations(db, exam_id=request.exam_id)
+            db.commit()
+            if confirmed:
+                available_times_cache.bump()
+            # 확정 후에도 남은 미확정 예약은 잔여 인원 부족으로 확정되지 않은 예약입니다.
+            # 시험의 미확정 예약 수에는 상한이 없으므로 목록 대신 건수만 반환합니다.
+            return BulkConfirmResult(confirmed=confirmed, rejected=[],
+                                     rejected_count=reservation_crud.count_pending_reservations(db, request.exam_id))
+
+        reservation_ids = list(dict.fromkeys(request.reservation_ids))
+        if len(reservation_ids) > settings.BULK_CONFIRM_MAX_ITEMS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"한 번에 최대 {settings.BULK_CONFIRM_MAX_ITEMS}건까지 확정할 수 있습니다.")
+        confirmed = reservation_crud.confirm_reservations(db, reservation_ids=reservation_ids)
+        db.commit()
+        if confirmed:
+            available_times_cache.bump()
+
+        confirmed_ids = set(confirmed)
+        not_confirmed = [reservation_id for reservation_id in reservation_ids if reservation_id not in confirmed_ids]
+        states = reservation_crud.get_reservation_states(db, not_confirmed)
+        rejected = []
+        for reservation_id in not_confirmed:
+            if reservation_id not in states:
+                message = "예약을 찾을 수 없습니다."
+            elif states[reservation_id]:
+                message = "이미 확정된 예약입니다."
+            else:
+                message = "예약 가능한 인원을 초과했습니다."
+            rejected.append(BulkConfirmRejection(reservation_id=reservation_id, message=message))
+        return BulkConfirmResult(confirmed=confirmed, rejected=rejected, rejected_count=len(rejected))
+
+    @staticmethod
+    def delete_reservation(db: Session, reservation_id: int, current_user: CurrentUser) -> bool:
+        # 존재/권한 확인 (없으면 404, 본인 예약이 아니면 403). 잠그기 전에 확인합니다.
+        owner = reservation_crud.get_reservation_owner(db, reservation_id)
+        if owner is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="예약을 찾을 수 없습니다. 예약 ID를 확인해주세요.")
+        if not current_user.is_admin and owner.user_id != current_user.user_id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="이 예약을 삭제할 권한이 없습니다. 본인의 예약만 삭제할 수 있습니다.")
+
+        # 수정과 같이 시험 행 → 예약 행 순서로 잠가, 삭제하는 동안 확정(수정/일괄 확정)되어 카운터가 어긋나지 않게 합니다.
+        exam_schedule_crud.lock_exam_schedule(db, owner.exam_id)
+        db_reservation = reservation_crud.get_reservation_for_update(db, reservation_id)
         if db_reservation is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="예약을 찾을 수 없습니다. 예약 ID를 확인해주세요.")
-        if not current_user.is_admin and db_reservation.user_id != current_user.user_id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="이 예약을 삭제할 권한이 없습니다. 본인의 예약만 삭제할 수 있습니다.")
-        if db_reservation.num_participants > 0:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="예약 가능 인원을 초과했습니다.")
-        return reservation_crud.delete_reservation(db, reservation_id)
+
+        # 확정된 예약이었다면 카운터에서 차감하고 시험별 집계에서도 뺍니다 (삭제와 같은 트랜잭션에서 커밋)
+        delta = -_confirmed_participants(db_reservation.is_confirmed, db_reservation.num_participants)
+        exam_schedule_crud.add_reserved_participants(db, db_reservation.exam_id, delta)
+        exam_capacity_stats_crud.add_exam_capacity_stats(db, [
+            (db_reservation.exam_id, exam_capacity_stats_crud.reservation_stats(
+                db_reservation.is_confirmed, db_reservation.num_participants, sign=-1)),
+        ])
+        deleted = reservation_crud.delete_reservation(db, db_reservation)
+        if delta:
+            available_times_cache.bump()
+        return deleted
 
     @staticmethod
-    def get_available_times(db: Session):
+    def export_reservations(current_user: CurrentUser, export_format: str, exam_id: Optional[int] = None,
+                            is_confirmed: Optional[bool] = None, created_from: Optional[datetime] = None,
+                            created_to: Optional[datetime] = None) -> Iterator[bytes]:
+        """
+        조건에 맞는 예약 전체를 NDJSON/CSV 로 나눠 만드는 이터레이터를 반환합니다. 관리자만 사용할 수 있습니다.
+        응답을 보내는 동안 계속 읽어야 하므로 요청 세션 대신 복제본(없으면 primary)에 전용 세션을 열고,
+        서버 측 커서에서 EXPORT_BATCH_SIZE 개씩 읽어 바로 내보내 전체 건수와 관계없이 메모리 사용량이 일정합니다.
+        """
+        if not current_user.is_admin:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="예약 내보내기는 관리자만 할 수 있습니다.")
+
+        def generate() -> Iterator[bytes]:
+            if export_format == "csv":
+                # 엑셀에서 한글이 깨지지 않도록 BOM 을 붙입니다.
+                yield ("\ufeff" + ",".join(EXPORT_COLUMNS) + "\r\n").encode("utf-8")
+            db = SessionLocal(bind=replica_router.choose())
+            try:
+                query = reservation_query.get_reservations_export_query(
+                    db, exam_id, is_confirmed, created_from, created_to)
+                result = db.execute(query.statement, execution_options={"yield_per": settings.EXPORT_BATCH_SIZE})
+                for rows in result.partitions():
+                    yield _export_chunk(rows, export_format)
+            finally:
+                db.close()
+
+        return generate()
+
+    @staticmethod
+    def get_available_times(db: Session) -> Tuple[List[AvailableTimeSchema], str]:
+        """예약 가능 시간 목록과 ETag 를 반환합니다. 캐시가 유효하면 DB 를 조회하지 않습니다."""
+        cached = available_times_cache.get()
+        if cached is not None:
+            return cached
+
+        version = available_times_cache.version
         now = get_kst_now()
         three_days_later = now + timedelta(days=3)
 
         available_times = reservation_query.get_available_times(db, now, three_days_later)
-        return available_times
+        etag = available_times_cache.set(version, available_times)
+        return available_times, etag
+
+    @staticmethod
+    def get_exam_capacity_stats(db: Session, current_user: CurrentUser, exam_id: Optional[int] = None,
+                                start_from: Optional[datetime] = None,
+                                start_to: Optional[datetime] = None) -> List[ExamCapacityStatsRead]:
+        """시험별 확정/대기 인원 (관리자). 예약을 집계하지 않고 exam_capacity_stats 를 시험마다 한 행씩 읽습니다."""
+        if not current_user.is_admin:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="시험별 예약 현황은 관리자만 조회할 수 있습니다.")
+        return [ExamCapacityStatsRead(
+            exam_id=result.exam_id,
+            name=result.name,
+            start_time=result.start_time,
+            max_capacity=result.max_capacity,
+            confirmed_participants=result.confirmed_participants,
+            pending_participants=result.pending_participants,
+            total_participants=result.confirmed_participants + result.pending_participants,
+            confirmed_reservations=result.confirmed_reservations,
+            pending_reservations=result.pending_reservations,
+        ) for result in exam_capacity_stats_crud.get_exam_capacity_stats(db, exam_id, start_from, start_to)]
@@ -1,16 +1,19 @@
 from datetime import timedelta
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.core.config import settings
+from src.core.password_hasher import password_hasher
+from src.core.principal_cache import principal_cache
 from src.models.user import User
 from src.schemas.user import UserCreate, UserLogin, UserUpdate
-from src.core.security import create_access_token, get_password_hash, verify_password
+from src.core.security import create_access_token
 
 
 def get_user(db: Session, user_id: int):
-    return db.query(User).filter(User.id == user_id).first()
+    return db.query(User).filter(User.user_id == user_id).first()
 
 
 def get_user_by_email(db: Session, email: str):
@@ -22,43 +25,55 @@ def get_users(db: Session, skip: int = 0, limit: int = 100):
 
 
 def create_user(db: Session, request: UserCreate):
+    # 중복 가입은 비밀번호를 해시하기 전에 거절합니다.
     if get_user_by_username(db, username=request.username):
         raise HTTPException(status_code=400, detail="이미 등록된 아이디입니다.")
 
     if get_user_by_email(db, email=request.email):
         raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다.")
 
+    # 비밀번호 해시는 수백 ms 가 걸리므로 그동안 DB 커넥션을 반납합니다.
+    db.close()
+    hashed_password = password_hasher.hash(request.password)
 
-    hashed_password = get_password_hash(request.password)
     db_user = User(email=request.email, username=request.username, hashed_password=hashed_password)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    try:
+        db.commit()
+    except IntegrityError:
+        # 확인과 저장 사이에 같은 아이디/이메일로 가입한 경우 (users 의 유니크 제약)
+        db.rollback()
+        raise HTTPException(status_code=400, detail="이미 등록된 아이디 또는 이메일입니다.")
     return db_user
 
 
 def update_user(db: Session, user_id: int, user: UserUpdate):
+    update_data = user.dict(exclude_unset=True)
+    if 'password' in update_data:
+        update_data['hashed_password'] = password_hasher.hash(update_data.pop('password'))
+
     db_user = get_user(db, user_id)
     if not db_user:
         return None
 
-    update_data = user.dict(exclude_unset=True)
-    if 'password' in update_data:
-        update_data['hashed_password'] = get_password_hash(update_data.pop('password'))
-
+    previous_username = db_user.username
     for key, value in update_data.items():
         setattr(db_user, key, value)
 
     db.commit()
-    db.refresh(db_user)
+    # 캐시된 인증 정보가 변경 전 값으로 남지 않도록 무효화
+    principal_cache.invalidate(previous_username)
+    principal_cache.invalidate(db_user.username)
     return db_user
 
 
 def delete_user(db: Session, user_id: int):
     db_user = get_user(db, user_id)
     if db_user:
+        username = db_user.username
         db.delete(db_user)
         db.commit()
+        principal_cache.invalidate(username)
         return True
     return False
 
@@ -67,7 +82,10 @@ def authenticate_user(db: Session, email: str, password: str):
     user = get_user_by_email(db, email)
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    hashed_password = user.hashed_password
+    # 비밀번호 검증은 수백 ms 가 걸리므로 그동안 DB 커넥션을 반납합니다.
+    db.close()
+    if not password_hasher.verify(password, hashed_password):
         return False
     return user
 
@@ -80,6 +98,11 @@ def login(db: Session, form_data: OAuth2PasswordRequestForm = Depends()):
     db_user = get_user_by_username(db, form_data.username)
     if db_user is None:
         raise HTTPException(status_code=400, detail="이메일 또는 비밀번호가 잘못되었습니다.")
-    access_token = create_access_token(db_user.username,
+    username, hashed_password = db_user.username, db_user.hashed_password
+    # 비밀번호 검증은 수백 ms 가 걸리므로 그동안 DB 커넥션을 반납합니다.
+    db.close()
+    if not password_hasher.verify(form_data.password, hashed_password):
+        raise HTTPException(status_code=400, detail="이메일 또는 비밀번호가 잘못되었습니다.")
+    access_token = create_access_token(username,
                                        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     return access_token
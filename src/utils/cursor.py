@@ -0,0 +1,22 @@
+import base64
+import json
+from typing import Optional
+
+
+def encode_cursor(reservation_id: int) -> str:
+    payload = json.dumps({"rid": reservation_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[int]:
+    """빈 문자열은 첫 페이지(None)를 뜻합니다. 형식이 잘못된 커서는 ValueError 를 발생시킵니다."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        reservation_id = json.loads(base64.urlsafe_b64decode(padded))["rid"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+    if not isinstance(reservation_id, int) or reservation_id <= 0:
+        raise ValueError("잘못된 커서입니다.")
+    return reservation_id
@@ -0,0 +1,17 @@
+import hashlib
+from typing import Optional
+
+
+def make_etag(payload: bytes) -> str:
+    # 응답 직렬화 방식과 무관하게 내용이 같으면 같은 값이 되도록 약한(weak) ETag 를 사용합니다.
+    return f'W/"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """If-None-Match 헤더(쉼표로 구분된 목록 또는 *)가 etag 와 일치하는지 확인합니다 (약한 비교)."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
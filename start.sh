@@ -1,3 +1,6 @@
 #!/bin/bash
-alembic upgrade head
-uvicorn src.main:app --host 0.0.0.0 --port 8000
+# 스케일 아웃으로 추가하는 컨테이너는 MIGRATE_ON_START=false 로 마이그레이션 확인(alembic import, 약 1초)을 건너뜁니다.
+if [ "${MIGRATE_ON_START:-true}" = "true" ]; then
+    alembic upgrade head
+fi
+exec gunicorn -c gunicorn.conf.py src.asgi:app
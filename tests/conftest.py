@@ -0,0 +1,4 @@
+import os
+
+# 같은 사용자로 여러 번 호출하는 테스트가 요청 제한(429)에 걸리지 않도록, 앱 설정을 읽기 전에 끕니다.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
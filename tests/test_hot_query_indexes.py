@@ -0,0 +1,19 @@
+"""
+핫 쿼리가 기대한 인덱스를 사용하는지 EXPLAIN 으로 확인합니다 (benchmarks/explain_indexes.py 와 같은 검사).
+CI 의 시드 데이터는 작아 플래너가 seq scan 을 고를 수 있으므로 enable_seqscan=off 로 인덱스 사용 가능 여부를 확인합니다.
+"""
+from benchmarks.explain_indexes import check_hot_query_indexes
+from src.db.session import SessionLocal
+
+
+def test_hot_queries_use_expected_indexes():
+    db = SessionLocal()
+    try:
+        results = check_hot_query_indexes(db, disable_seqscan=True)
+    finally:
+        db.rollback()
+        db.close()
+
+    failures = [f"{result['name']}: 기대 {result['expected_index']}, 사용 {result['used'] or '없음'}"
+                for result in results if not result["ok"]]
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,208 @@
+"""
+엔드포인트별 쿼리 수 예산 (src/core/query_budget.py)
+
+라우트에 query_budget 으로 선언한 예산과 같은 값으로 assert_max_queries 를 걸어, N+1 조회나 같은 행을 두 번 읽는 코드가
+들어오면 실패하게 합니다. 인증 조회가 예산에 포함되도록 매 요청 전에 principal 캐시를 비웁니다.
+테스트용 사용자/시험을 만들고 끝나면 지우므로 비어 있는 DB 에서도 실행할 수 있습니다.
+"""
+import uuid
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.available_times_cache import available_times_cache
+from src.core.principal_cache import principal_cache
+from src.core.query_budget import assert_max_queries
+from src.core.security import create_access_token
+from src.db.session import SessionLocal
+from src.main import app
+from src.models import ExamCapacityStats, ExamSchedule, Reservation, User
+from src.utils.time_utils import get_kst_now
+
+
+class Fixtures:
+    """테스트가 만든 사용자/시험을 기록해 두었다가 한꺼번에 지웁니다."""
+
+    def __init__(self):
+        self.user_ids = []
+        self.usernames = []
+        self.exam_ids = []
+
+    def user(self, is_admin: bool = False) -> dict:
+        username = f"budget-{uuid.uuid4().hex[:12]}"
+        db = SessionLocal()
+        try:
+            # 인증은 토큰으로만 하므로 비밀번호 해시는 검증되지 않는 값으로 둡니다.
+            user = User(email=f"{username}@example.com", username=username, hashed_password="x" * 60,
+                        is_admin=is_admin)
+            db.add(user)
+            db.commit()
+            self.user_ids.append(user.user_id)
+        finally:
+            db.close()
+        return {"Authorization": f"Bearer {create_access_token(username)}"}
+
+    def exam(self) -> int:
+        db = SessionLocal()
+        try:
+            # 예약 가능 기간(시작 3일 전부터) 안에 있는 시험
+            start_time = get_kst_now() + timedelta(days=2)
+            exam_schedule = ExamSchedule(name="query budget", start_time=start_time,
+                                         end_time=start_time + timedelta(hours=2), max_capacity=1000)
+            db.add(exam_schedule)
+            db.commit()
+            self.exam_ids.append(exam_schedule.exam_id)
+            return exam_schedule.exam_id
+        finally:
+            db.close()
+
+    def cleanup(self) -> None:
+        db = SessionLocal()
+        try:
+            user_ids = self.user_ids + [user_id for (user_id,) in db.query(User.user_id).filter(
+                User.username.in_(self.usernames))]
+            db.query(Reservation).filter(
+                Reservation.exam_id.in_(self.exam_ids) | Reservation.user_id.in_(user_ids)
+            ).delete(synchronize_session=False)
+            db.query(ExamCapacityStats).filter(ExamCapacityStats.exam_id.in_(self.exam_ids)).delete(
+                synchronize_session=False)
+            db.query(ExamSchedule).filter(ExamSchedule.exam_id.in_(self.exam_ids)).delete(synchronize_session=False)
+            db.query(User).filter(User.user_id.in_(user_ids)).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+
+@pytest.fixture(scope="module")
+def client():
+    # 비동기 엔진의 커넥션은 이벤트 루프에 묶이므로, 모든 요청을 하나의 TestClient(이벤트 루프)에서 보냅니다.
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def fixtures():
+    created = Fixtures()
+    yield created
+    created.cleanup()
+
+
+@pytest.fixture
+def user(fixtures):
+    return fixtures.user()
+
+
+@pytest.fixture
+def admin(fixtures):
+    return fixtures.user(is_admin=True)
+
+
+def _book(client, headers, exam_id: int, num_participants: int = 2) -> int:
+    response = client.post("/v1/reservations", json={"exam_id": exam_id, "num_participants": num_participants},
+                           headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["reservation_id"]
+
+
+def _request(client, max_queries: int, method: str, url: str, **kwargs):
+    """principal 캐시가 빈 상태(인증 조회 포함)에서 요청 전체의 쿼리 수가 예산 이하인지 확인합니다."""
+    principal_cache.clear()
+    with assert_max_queries(max_queries):
+        return client.request(method, url, **kwargs)
+
+
+def test_create_user_and_login(client, fixtures):
+    username = f"budget-{uuid.uuid4().hex[:12]}"
+    fixtures.usernames.append(username)
+    response = _request(client, 3, "POST", "/v1/users",
+                        json={"email": f"{username}@example.com", "username": username, "password": "password123!@#"})
+    assert response.status_code == 201, response.text
+
+    response = _request(client, 1, "POST", "/v1/users/login",
+                        data={"username": username, "password": "password123!@#"})
+    assert response.status_code == 200, response.text
+
+
+def test_me(client, user):
+    assert _request(client, 1, "GET", "/v1/users/me", headers=user).status_code == 200
+
+
+def test_available_times(client, user, fixtures):
+    fixtures.exam()
+    # 캐시 미스(목록 다시 계산) 기준
+    available_times_cache.bump()
+    assert _request(client, 2, "GET", "/v1/reservations/available-times", headers=user).status_code == 200
+
+
+def test_create_reservation(client, user, fixtures):
+    exam_id = fixtures.exam()
+    response = _request(client, 4, "POST", "/v1/reservations",
+                        json={"exam_id": exam_id, "num_participants": 2}, headers=user)
+    assert response.status_code == 201, response.text
+
+
+def test_create_reservations_bulk(client, user, fixtures):
+    exam_ids = [fixtures.exam() for _ in range(3)]
+    response = _request(client, 4, "POST", "/v1/reservations/bulk",
+                        json=[{"exam_id": exam_id, "num_participants": 1} for exam_id in exam_ids], headers=user)
+    assert response.status_code == 200, response.text
+
+
+def test_read_reservation(client, user, fixtures):
+    reservation_id = _book(client, user, fixtures.exam())
+    assert _request(client, 2, "GET", f"/v1/reservations/{reservation_id}", headers=user).status_code == 200
+
+
+@pytest.mark.parametrize("query", ["page=1&limit=20", "cursor=&limit=20"])
+def test_read_user_reservations(client, user, fixtures, query):
+    for _ in range(3):
+        _book(client, user, fixtures.exam())
+    assert _request(client, 3, "GET", f"/v1/reservations?{query}", headers=user).status_code == 200
+
+
+def test_update_reservation(client, user, admin, fixtures):
+    reservation_id = _book(client, user, fixtures.exam())
+    # 확정은 확정 인원 카운터와 시험별 집계를 함께 갱신하는 가장 무거운 수정입니다.
+    response = _request(client, 7, "PUT", f"/v1/reservations/{reservation_id}",
+                        json={"is_confirmed": True, "num_participants": 3}, headers=admin)
+    assert response.status_code == 200, response.text
+
+
+def test_confirm_reservations(client, user, admin, fixtures):
+    reservation_ids = [_book(client, user, fixtures.exam()) for _ in range(3)]
+    response = _request(client, 4, "POST", "/v1/reservations/confirm",
+                        json={"reservation_ids": reservation_ids}, headers=admin)
+    assert response.status_code == 200, response.text
+
+
+def test_confirm_reservations_by_exam(client, admin, fixtures):
+    exam_id = fixtures.exam()
+    # 정원 1000명: 먼저 만든 두 예약(600 + 300)만 확정되고 마지막 예약은 남습니다.
+    reservation_ids = [_book(client, fixtures.user(), exam_id, num_participants)
+                       for num_participants in (600, 300, 300)]
+    response = _request(client, 4, "POST", "/v1/reservations/confirm", json={"exam_id": exam_id}, headers=admin)
+    assert response.status_code == 200, response.text
+    assert response.json() == {"confirmed": reservation_ids[:2], "rejected": [], "rejected_count": 1}
+
+
+@pytest.mark.parametrize("confirmed", [False, True])
+def test_delete_reservation(client, user, admin, fixtures, confirmed):
+    reservation_id = _book(client, user, fixtures.exam())
+    if confirmed:
+        client.put(f"/v1/reservations/{reservation_id}", json={"is_confirmed": True}, headers=admin)
+    response = _request(client, 7, "DELETE", f"/v1/reservations/{reservation_id}", headers=user)
+    assert response.status_code == 204, response.text
+
+
+def test_export_reservations(client, user, admin, fixtures):
+    exam_id = fixtures.exam()
+    _book(client, user, exam_id)
+    response = _request(client, 2, "GET", f"/v1/reservations/export?exam_id={exam_id}", headers=admin)
+    assert response.status_code == 200, response.text
+
+
+def test_capacity_stats(client, admin, fixtures):
+    exam_id = fixtures.exam()
+    response = _request(client, 2, "GET", f"/v1/reservations/capacity-stats?exam_id={exam_id}", headers=admin)
+    assert response.status_code == 200, response.text